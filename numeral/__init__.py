@@ -1,7 +1,33 @@
-from numeral.numeral import (
+from numeral.backends import (
     int2letter, letter2int, int2tokens, tokens2int, int2roman, roman2int)
+from numeral.backends import (
+    set_backend, get_backend, use_backend, register_backend, shadow_report)
+from numeral.numeral import (
+    letter2int_batch, tokens2int_batch, roman2int_batch)
+from numeral.numeral import (
+    int2sortable, sortable2int, int2sortable_batch, sortable2int_batch)
+from numeral.numeral import (
+    tokens_length, first_index_of_length, count_of_length,
+    nth_label_of_length)
+from numeral.numeral import (
+    TokensDecoder)
+from numeral.numeral import (
+    InputLimitError, set_limits, get_limits, use_limits)
+from numeral.systems import (
+    NumeralSystem, NUMERAL_SYSTEMS, int2numeral, numeral2int,
+    int2numeral_batch, numeral2int_batch)
+from numeral.transcoding import (
+    transcode, transcode_batch)
+from numeral.cells import (
+    parse_cell_ref, format_cell_ref, parse_range_ref, format_range_ref,
+    parse_cell_ref_batch, format_cell_ref_batch,
+    parse_range_ref_batch, format_range_ref_batch)
+from numeral.scanner import (
+    find_romans, sub_romans, sub_integers)
+from numeral.formatter import (
+    NumeralFormatter, NumeralInt, format_numeral)
 from numeral.numeral import (
-    ROMAN_ALTERNATIVES)
+    ROMAN_ALTERNATIVES, BATCH_ERRORS, LIMIT_NAMES)
 from numeral.numeral import (
     _ROMAN_UNICODE_UPPER, _ROMAN_UNICODE_LOWER,
     _ROMAN_UNICODE, _ROMAN_UNICODE_R,
@@ -9,4 +35,5 @@ from numeral.numeral import (
     _ROMAN_CLAUDIAN_TO_APOSTROPHUS, _ROMAN_CLAUDIAN_TO_APOSTROPHUS_R,
     _ROMAN_CLAUDIAN_TO_ASCII, _ROMAN_UNICODE_TO_ASCII,
     _ROMAN_ASCII_UPPER, _ROMAN_ASCII_LOWER, _ROMAN_ASCII, _ROMAN_ASCII_R,
-    _ROMAN_MINUS, _ROMAN_MAX_CONSECUTIVE, _ROMAN_STRICT_REGEX)
+    _ROMAN_MINUS, _ROMAN_MAX_CONSECUTIVE, _ROMAN_STRICT_REGEX,
+    _ROMAN_DECODE_ASCII, _ROMAN_DECODE_VALUES, _ROMAN_DECODE_TRANSLATE)
@@ -0,0 +1,538 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Numeral: pluggable backends with runtime selection.
+
+The conversion functions exposed at the package level (e.g.
+`numeral.int2roman()`) dispatch to the active backend, also when imported
+by name (e.g. `from numeral import int2roman`).
+The implementation in `numeral.numeral` is the `reference` backend.
+The active backend is set globally by `set_backend()`, and it can be
+overridden in the current context (e.g. thread or `asyncio` task) by
+`use_backend()`.
+
+The following backends are available:
+ - 'reference': the implementation in `numeral.numeral`;
+ - 'fast': memoized version of the reference implementation;
+ - 'numpy': array-aware version of the reference implementation, which
+   converts each distinct element of a `numpy.ndarray` only once
+   (requires `numpy`).
+
+Additional backends can be registered with `register_backend()`.
+
+A shadow backend can be specified as well: every call is then run with both
+backends, and mismatches and timings are collected in a `ShadowReport`.
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals)
+
+# ======================================================================
+# :: Python Standard Library Imports
+import collections  # Container datatypes
+import contextlib  # Utilities for with-statement contexts
+import contextvars  # Context Variables
+import functools  # Higher-order functions and operations on callable objects
+import time  # Time access and conversions
+import doctest  # Test interactive Python examples
+
+# ======================================================================
+# :: Internal Imports
+from numeral import numeral as _reference
+
+# ======================================================================
+BACKEND_FUNCS = (
+    'int2letter', 'letter2int', 'int2tokens', 'tokens2int',
+    'int2roman', 'roman2int')
+
+_BACKENDS = {}
+_BACKEND_LOADERS = {}
+# :: global backend state (see `set_backend()`), and its context-local
+#    override (see `use_backend()`)
+_STATE = {'name': 'reference', 'funcs': None, 'shadow': None, 'report': None}
+_CONTEXT_STATE = contextvars.ContextVar('_CONTEXT_STATE', default=None)
+
+
+# ======================================================================
+class ShadowReport(object):
+    """
+    Comparison of two backends on live calls.
+
+    Attributes:
+        primary (str): The name of the primary backend.
+        shadow (str): The name of the shadow backend.
+        calls (collections.Counter): The number of calls per function.
+        timings (dict): The total time spent per function and backend.
+            Format: {<func_name>: [<primary_time>, <shadow_time>]}.
+        mismatches (list[tuple]): The calls with different outcomes.
+            Format: [(<func_name>, <args>, <kws>, <primary>, <shadow>), ...].
+            Outcomes are either the results or the exceptions raised.
+        max_mismatches (int): The maximum number of mismatches to keep.
+        num_mismatches (int): The total number of mismatches.
+    """
+
+    def __init__(self, primary, shadow, max_mismatches=100):
+        self.primary = primary
+        self.shadow = shadow
+        self.calls = collections.Counter()
+        self.timings = collections.defaultdict(lambda: [0.0, 0.0])
+        self.mismatches = []
+        self.max_mismatches = max_mismatches
+        self.num_mismatches = 0
+
+    # --------------------------------
+    def add(self, func_name, args, kws, outcomes, timings):
+        """
+        Record a call.
+
+        Args:
+            func_name (str): The name of the function.
+            args (tuple): The positional arguments.
+            kws (dict): The keyword arguments.
+            outcomes (tuple): The outcomes of the primary and shadow backend.
+            timings (tuple): The timings of the primary and shadow backend.
+
+        Returns:
+            None.
+        """
+        self.calls[func_name] += 1
+        self.timings[func_name][0] += timings[0]
+        self.timings[func_name][1] += timings[1]
+        if not _same_outcome(*outcomes):
+            self.num_mismatches += 1
+            if len(self.mismatches) < self.max_mismatches:
+                self.mismatches.append((func_name, args, kws) + outcomes)
+
+    # --------------------------------
+    def relative_timings(self):
+        """
+        Compute the shadow-to-primary time ratio per function.
+
+        Returns:
+            result (dict): The time ratio per function.
+        """
+        return {
+            func_name: shadow_time / primary_time if primary_time else None
+            for func_name, (primary_time, shadow_time)
+            in self.timings.items()}
+
+    # --------------------------------
+    def __repr__(self):
+        return '{}({!r} vs {!r}: {} calls, {} mismatches)'.format(
+            type(self).__name__, self.primary, self.shadow,
+            sum(self.calls.values()), self.num_mismatches)
+
+
+# ======================================================================
+def _same_outcome(primary, shadow):
+    """
+    Check if two call outcomes are equivalent.
+
+    Args:
+        primary (Any): The result or the exception of the primary call.
+        shadow (Any): The result or the exception of the shadow call.
+
+    Returns:
+        result (bool): True if the outcomes are equivalent.
+
+    Examples:
+        >>> _same_outcome(1, 1), _same_outcome(1, 2)
+        (True, False)
+        >>> _same_outcome(ValueError('a'), ValueError('b'))
+        True
+        >>> _same_outcome(ValueError('a'), 1)
+        False
+    """
+    if isinstance(primary, Exception) or isinstance(shadow, Exception):
+        return type(primary) is type(shadow)
+    try:
+        return bool(primary == shadow)
+    except ValueError:  # e.g. arrays
+        return bool((primary == shadow).all())
+
+
+# ======================================================================
+def _timed_call(func, args, kws):
+    """
+    Call a function capturing its outcome and its timing.
+
+    Args:
+        func (callable): The function to call.
+        args (tuple): The positional arguments.
+        kws (dict): The keyword arguments.
+
+    Returns:
+        result (tuple): The outcome and the elapsed time in seconds.
+            The outcome is either the result or the exception raised.
+    """
+    begin_time = time.perf_counter()
+    try:
+        outcome = func(*args, **kws)
+    except Exception as exc:
+        outcome = exc
+    return outcome, time.perf_counter() - begin_time
+
+
+# ======================================================================
+def register_backend(
+        name,
+        funcs=None,
+        loader=None):
+    """
+    Register a backend.
+
+    Args:
+        name (str): The name of the backend.
+        funcs (Mapping[str, callable]|None): The backend functions.
+            Keys must be in `BACKEND_FUNCS`.
+            Missing functions fall back to the reference backend.
+        loader (callable|None): Function returning the backend functions.
+            This is called on first use, e.g. to delay optional imports.
+            Either `funcs` or `loader` must be specified.
+
+    Returns:
+        None.
+
+    Raises:
+        ValueError: if the function names are not supported.
+
+    Examples:
+        >>> register_backend('upper', {'int2letter': lambda num, *_args:
+        ...     _reference.int2letter(num, *_args).upper()})
+        >>> with use_backend('upper'):
+        ...     int2letter(27), int2roman(4)
+        ('AB', 'Ⅳ')
+        >>> int2letter(27)
+        'ab'
+    """
+    if loader is not None:
+        _BACKENDS.pop(name, None)
+        _BACKEND_LOADERS[name] = loader
+    else:
+        unknown = set(funcs) - set(BACKEND_FUNCS)
+        if unknown:
+            raise ValueError(
+                'Unsupported backend functions: {}'.format(sorted(unknown)))
+        _BACKENDS[name] = {
+            func_name: funcs.get(func_name, getattr(_reference, func_name))
+            for func_name in BACKEND_FUNCS}
+
+
+# ======================================================================
+def _get_funcs(name):
+    """
+    Get the functions of a backend, loading it if needed.
+
+    Args:
+        name (str): The name of the backend.
+
+    Returns:
+        funcs (dict): The backend functions.
+
+    Raises:
+        ValueError: if the backend is not registered.
+    """
+    if name not in _BACKENDS:
+        if name not in _BACKEND_LOADERS:
+            raise ValueError('Unknown backend `{}`'.format(name))
+        register_backend(name, _BACKEND_LOADERS.pop(name)())
+    return _BACKENDS[name]
+
+
+# ======================================================================
+def get_backend():
+    """
+    Get the active backend.
+
+    Returns:
+        result (tuple): The names of the active and of the shadow backend.
+            The shadow backend name is None if not set.
+
+    Examples:
+        >>> get_backend()
+        ('reference', None)
+    """
+    state = _get_state()
+    return state['name'], state['shadow']
+
+
+# ======================================================================
+def _get_state():
+    """
+    Get the state of the active backend.
+
+    This is the state set by `use_backend()` in the current context (if
+    any), or otherwise the global state set by `set_backend()`.
+
+    Returns:
+        state (dict): The backend state.
+    """
+    state = _CONTEXT_STATE.get()
+    return _STATE if state is None else state
+
+
+# ======================================================================
+def _make_state(
+        name,
+        shadow,
+        max_mismatches):
+    """
+    Compute the state of a backend.
+
+    Args:
+        name (str): The name of the backend.
+        shadow (str|None): The name of the shadow backend.
+        max_mismatches (int): The maximum number of mismatches to keep.
+
+    Returns:
+        state (dict): The backend state.
+
+    Raises:
+        ValueError: if the backends are not registered.
+    """
+    funcs = _get_funcs(name)
+    if shadow is not None:
+        shadow_funcs = _get_funcs(shadow)
+        report = ShadowReport(name, shadow, max_mismatches)
+        funcs = {
+            func_name: _shadowed(
+                func_name, funcs[func_name], shadow_funcs[func_name], report)
+            for func_name in BACKEND_FUNCS}
+    else:
+        report = None
+    return dict(name=name, funcs=funcs, shadow=shadow, report=report)
+
+
+# ======================================================================
+def set_backend(
+        name,
+        shadow=None,
+        max_mismatches=100):
+    """
+    Set the active backend globally.
+
+    This applies to all threads, unless overridden in the current context
+    by `use_backend()`.
+
+    Args:
+        name (str): The name of the backend.
+        shadow (str|None): The name of the shadow backend.
+            If not None, every call is run with both backends and the
+            outcome of the active backend is returned.
+            Mismatches and timings are reported through `shadow_report()`.
+        max_mismatches (int): The maximum number of mismatches to keep.
+            This is only used if `shadow` is not None.
+
+    Returns:
+        None.
+
+    Raises:
+        ValueError: if the backends are not registered.
+
+    Examples:
+        >>> from numeral import int2roman as early_int2roman
+        >>> set_backend('fast', shadow='reference')
+        >>> [early_int2roman(i) for i in (4, 4, 1666)]
+        ['Ⅳ', 'Ⅳ', 'ⅯⅮⅭⅬⅩⅥ']
+        >>> shadow_report()
+        ShadowReport('fast' vs 'reference': 3 calls, 0 mismatches)
+        >>> set_backend('reference')
+    """
+    _STATE.update(_make_state(name, shadow, max_mismatches))
+
+
+# ======================================================================
+@contextlib.contextmanager
+def use_backend(
+        name,
+        shadow=None,
+        max_mismatches=100):
+    """
+    Temporarily set the active backend in the current context.
+
+    The backend only applies to the current context (e.g. thread or
+    `asyncio` task), where it overrides the global backend.
+
+    Args:
+        name (str): The name of the backend.
+        shadow (str|None): The name of the shadow backend.
+        max_mismatches (int): The maximum number of mismatches to keep.
+
+    Yields:
+        report (ShadowReport|None): The shadow report, if any.
+
+    Examples:
+        >>> import threading
+        >>> names = []
+        >>> with use_backend('fast'):
+        ...     thread = threading.Thread(
+        ...         target=lambda: names.append(get_backend()[0]))
+        ...     thread.start()
+        ...     thread.join()
+        ...     names.append(get_backend()[0])
+        >>> names
+        ['reference', 'fast']
+
+    See Also:
+        set_backend()
+    """
+    state = _make_state(name, shadow, max_mismatches)
+    token = _CONTEXT_STATE.set(state)
+    try:
+        yield state['report']
+    finally:
+        _CONTEXT_STATE.reset(token)
+
+
+# ======================================================================
+def shadow_report():
+    """
+    Get the report of the shadow backend.
+
+    Returns:
+        report (ShadowReport|None): The shadow report, if any.
+    """
+    return _get_state()['report']
+
+
+# ======================================================================
+def _shadowed(
+        func_name,
+        func,
+        shadow_func,
+        report):
+    """
+    Combine a function with its shadow counterpart.
+
+    Args:
+        func_name (str): The name of the function.
+        func (callable): The primary function.
+        shadow_func (callable): The shadow function.
+        report (ShadowReport): The report to update.
+
+    Returns:
+        wrapper (callable): The function running both implementations.
+    """
+
+    def wrapper(*_args, **_kws):
+        outcome, elapsed = _timed_call(func, _args, _kws)
+        shadow_outcome, shadow_elapsed = _timed_call(shadow_func, _args, _kws)
+        report.add(
+            func_name, _args, _kws, (outcome, shadow_outcome),
+            (elapsed, shadow_elapsed))
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return wrapper
+
+
+# ======================================================================
+def _dispatcher(func_name):
+    """
+    Create a function dispatching to the active backend.
+
+    Args:
+        func_name (str): The name of the function.
+
+    Returns:
+        dispatcher (callable): The dispatching function.
+    """
+    def dispatcher(*_args, **_kws):
+        state = _CONTEXT_STATE.get()
+        funcs = (_STATE if state is None else state)['funcs']
+        return funcs[func_name](*_args, **_kws)
+
+    return functools.update_wrapper(
+        dispatcher, getattr(_reference, func_name))
+
+
+# ======================================================================
+def _memoized(func, maxsize=2 ** 16):
+    """
+    Memoize a function, falling back to plain calls for unhashable inputs.
+
+    The input-size limits in effect are part of the cache key, so that
+    cached results are not returned in violation of the active limits.
+
+    Args:
+        func (callable): The function to memoize.
+        maxsize (int): The maximum size of the cache.
+
+    Returns:
+        wrapper (callable): The memoized function.
+
+    Examples:
+        >>> int2roman_ = _memoized(_reference.int2roman)
+        >>> int2roman_(4), int2roman_(4, alternatives=[('Ⅳ', 'ⅠⅤ')])
+        ('Ⅳ', 'ⅠⅤ')
+        >>> with _reference.use_limits(max_magnitude=3):
+        ...     int2roman_(4)
+        Traceback (most recent call last):
+            ...
+        numeral.numeral.InputLimitError: Input magnitude exceeds \
+`max_magnitude=3`
+    """
+    cached_func = functools.lru_cache(maxsize)(
+        lambda _limits, *_args, **_kws: func(*_args, **_kws))
+
+    @functools.wraps(func)
+    def wrapper(*_args, **_kws):
+        try:
+            return cached_func(_reference._get_limits(None), *_args, **_kws)
+        except TypeError:  # unhashable inputs
+            return func(*_args, **_kws)
+
+    return wrapper
+
+
+# ======================================================================
+def _numpy_backend():
+    """
+    Load the array-aware backend.
+
+    Returns:
+        funcs (dict): The backend functions.
+    """
+    import numpy as np  # Fundamental package for scientific computing
+
+    def vectorized(func):
+        @functools.wraps(func)
+        def wrapper(arg, *_args, **_kws):
+            if isinstance(arg, np.ndarray):
+                uniques, inverse = np.unique(arg, return_inverse=True)
+                results = [func(x.item(), *_args, **_kws) for x in uniques]
+                dtype = np.int64 if all(
+                    isinstance(x, int) and -2 ** 63 <= x < 2 ** 63
+                    for x in results) else object
+                return np.array(results, dtype=dtype)[inverse].reshape(
+                    arg.shape)
+            return func(arg, *_args, **_kws)
+
+        return wrapper
+
+    return {
+        func_name: vectorized(getattr(_reference, func_name))
+        for func_name in BACKEND_FUNCS}
+
+
+# ======================================================================
+register_backend('reference', {})
+register_backend('fast', {
+    func_name: _memoized(getattr(_reference, func_name))
+    for func_name in BACKEND_FUNCS})
+register_backend('numpy', loader=_numpy_backend)
+_STATE['funcs'] = _get_funcs('reference')
+
+int2letter = _dispatcher('int2letter')
+letter2int = _dispatcher('letter2int')
+int2tokens = _dispatcher('int2tokens')
+tokens2int = _dispatcher('tokens2int')
+int2roman = _dispatcher('int2roman')
+roman2int = _dispatcher('roman2int')
+
+# ======================================================================
+if __name__ == '__main__':
+    doctest.testmod()
@@ -0,0 +1,588 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Numeral: spreadsheet (A1-style) cell references.
+
+The column letters are the representation of `int2letter()` using
+uppercase letters, except that both rows and columns are 1-based,
+e.g. `A1` is the first cell and `AB123` is row 123 of column 28.
+
+References are limited to the sheet size of common spreadsheets, i.e.
+`MAX_ROW` rows and `MAX_COLUMN` columns (up to `XFD`), and the columns are
+converted through precomputed tables.
+Ranges are normalized, so that the start and the stop cells are the
+top-left and the bottom-right corners, respectively.
+
+Examples:
+    >>> parse_cell_ref('AB123')
+    (123, 28)
+    >>> format_cell_ref(123, 28)
+    'AB123'
+    >>> parse_range_ref('A1:ZZ999')
+    ((1, 1), (999, 702))
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals)
+
+# ======================================================================
+# :: Python Standard Library Imports
+import re  # Regular expression operations
+import numbers  # Numeric abstract base classes
+import string  # Common string operations
+import itertools  # Functions creating iterators for efficient looping
+import functools  # Higher-order functions and operations on callable objects
+import doctest  # Test interactive Python examples
+
+# ======================================================================
+# :: Internal Imports
+from numeral.numeral import _batch
+
+# ======================================================================
+MAX_COLUMN = 16384  # i.e. `XFD`
+MAX_ROW = 1048576
+
+_MAX_ROW_DIGITS = len(str(MAX_ROW))
+
+# :: absolute markers (`$`) are accepted and ignored
+_CELL_REF_REGEX = re.compile(
+    r'\s*\$?([A-Za-z]+)\$?([1-9][0-9]*)\s*', re.ASCII)
+_RANGE_REF_REGEX = re.compile(
+    r'\s*\$?([A-Za-z]+)\$?([1-9][0-9]*)\s*'
+    r'(?::\s*\$?([A-Za-z]+)\$?([1-9][0-9]*)\s*)?', re.ASCII)
+
+
+# ======================================================================
+@functools.lru_cache(maxsize=None)
+def _column_tables():
+    """
+    Compute the column tables up to `MAX_COLUMN`.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - names (tuple[str]): The letters of the columns.
+               The column `i` is at index `i - 1`.
+             - indices (dict[str, int]): The columns of the letters.
+
+    Examples:
+        >>> names, indices = _column_tables()
+        >>> names[0], names[-1], indices['AA']
+        ('A', 'XFD', 27)
+    """
+    names = []
+    for length in itertools.count(1):
+        names.extend(
+            ''.join(letters) for letters in itertools.product(
+                string.ascii_uppercase, repeat=length))
+        if len(names) >= MAX_COLUMN:
+            break
+    names = tuple(names[:MAX_COLUMN])
+    indices = dict((name, i + 1) for i, name in enumerate(names))
+    return names, indices
+
+
+# ======================================================================
+def _column2int(letters):
+    """
+    Convert the letters of a column to its 1-based index.
+
+    Args:
+        letters (str): The letters of the column.
+            Must only contain ASCII letters.
+
+    Returns:
+        col (int|None): The column index or None if beyond `MAX_COLUMN`.
+
+    Examples:
+        >>> _column2int('xfd'), _column2int('XFE')
+        (16384, None)
+    """
+    return _column_tables()[1].get(letters.upper())
+
+
+# ======================================================================
+def _int2column(col):
+    """
+    Convert the (valid) 1-based index of a column to its letters.
+
+    Args:
+        col (int): The column index.
+            Must be between 1 and `MAX_COLUMN`.
+
+    Returns:
+        letters (str): The letters of the column.
+
+    Examples:
+        >>> _int2column(1), _int2column(16384)
+        ('A', 'XFD')
+    """
+    return _column_tables()[0][col - 1]
+
+
+# ======================================================================
+def _normalize_range(
+        start,
+        stop):
+    """
+    Get the top-left and the bottom-right corners of a range.
+
+    Args:
+        start (tuple[int]): The (row, column) of a corner cell.
+        stop (tuple[int]): The (row, column) of the opposite corner cell.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - start (tuple[int]): The (row, column) of the top-left cell.
+             - stop (tuple[int]): The (row, column) of the bottom-right cell.
+
+    Examples:
+        >>> _normalize_range((9, 2), (7, 3))
+        ((7, 2), (9, 3))
+    """
+    return (
+        (min(start[0], stop[0]), min(start[1], stop[1])),
+        (max(start[0], stop[0]), max(start[1], stop[1])))
+
+
+# ======================================================================
+def _match2cell(
+        letters,
+        digits):
+    """
+    Convert the letters and the digits of a cell reference to a cell.
+
+    Args:
+        letters (str): The letters of the column.
+            Must only contain ASCII letters.
+        digits (str): The digits of the row.
+            Must only contain ASCII digits, without leading zeros.
+
+    Returns:
+        ref (tuple[int]|None): The (row, column) pair or None if beyond
+            `MAX_ROW` or `MAX_COLUMN`.
+
+    Examples:
+        >>> _match2cell('XFD', '1048576'), _match2cell('A', '1048577')
+        ((1048576, 16384), None)
+    """
+    col = _column2int(letters)
+    if col is None or len(digits) > _MAX_ROW_DIGITS:
+        return None
+    row = int(digits)
+    return (row, col) if row <= MAX_ROW else None
+
+
+# ======================================================================
+def _parse_cell_ref(text):
+    """
+    Convert a cell reference to row and column without raising.
+
+    Args:
+        text (str): The input string to parse.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - ref (tuple[int]|None): The (row, column) pair or None.
+             - error (tuple|None): The exception type and message, if any.
+
+    Examples:
+        >>> _parse_cell_ref('$B$7')
+        ((7, 2), None)
+        >>> _parse_cell_ref('B0')
+        (None, (<class 'ValueError'>, 'Invalid cell reference `B0`'))
+    """
+    match = _CELL_REF_REGEX.fullmatch(text)
+    ref = _match2cell(match.group(1), match.group(2)) if match else None
+    if ref is None:
+        return None, (
+            ValueError, 'Invalid cell reference `{}`'.format(text))
+    return ref, None
+
+
+# ======================================================================
+def _format_cell_ref(ref):
+    """
+    Convert row and column to a cell reference without raising.
+
+    Args:
+        ref (tuple[int]): The (row, column) pair.
+            Both must be integers (but not bool).
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - text (str|None): The cell reference or None.
+             - error (tuple|None): The exception type and message, if any.
+
+    Examples:
+        >>> _format_cell_ref((7, 2))
+        ('B7', None)
+        >>> _format_cell_ref((7, 0))
+        (None, (<class 'ValueError'>, 'Invalid cell `(7, 0)`'))
+        >>> [_format_cell_ref(ref)[1] for ref in [(1,), None, (1.5, 2)]]
+        [(<class 'ValueError'>, 'Invalid cell `(1,)`'), \
+(<class 'ValueError'>, 'Invalid cell `None`'), \
+(<class 'ValueError'>, 'Invalid cell `(1.5, 2)`')]
+    """
+    try:
+        row, col = ref
+    except (TypeError, ValueError):  # not a pair
+        return None, (ValueError, 'Invalid cell `{}`'.format(ref))
+    if not all(
+            isinstance(x, numbers.Integral) and not isinstance(x, bool)
+            for x in (row, col)) \
+            or not (1 <= row <= MAX_ROW and 1 <= col <= MAX_COLUMN):
+        return None, (ValueError, 'Invalid cell `{}`'.format(ref))
+    return _int2column(col) + str(row), None
+
+
+# ======================================================================
+def _parse_range_ref(text):
+    """
+    Convert a range reference to its corner cells without raising.
+
+    Args:
+        text (str): The input string to parse.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - ref (tuple[tuple[int]]|None): The (start, stop) cells or None.
+               Each cell is a (row, column) pair.
+             - error (tuple|None): The exception type and message, if any.
+
+    Examples:
+        >>> _parse_range_ref('B7:C9')
+        (((7, 2), (9, 3)), None)
+        >>> _parse_range_ref('B7')
+        (((7, 2), (7, 2)), None)
+        >>> _parse_range_ref('C7:B9')
+        (((7, 2), (9, 3)), None)
+    """
+    match = _RANGE_REF_REGEX.fullmatch(text)
+    start = stop = None
+    if match:
+        letters, digits, stop_letters, stop_digits = match.groups()
+        start = stop = _match2cell(letters, digits)
+        if stop_letters:
+            stop = _match2cell(stop_letters, stop_digits)
+    if start is None or stop is None:
+        return None, (
+            ValueError, 'Invalid range reference `{}`'.format(text))
+    return _normalize_range(start, stop), None
+
+
+# ======================================================================
+def _format_range_ref(ref):
+    """
+    Convert the corner cells of a range to a range reference without raising.
+
+    Args:
+        ref (tuple[tuple[int]]): The (start, stop) cells.
+            Each cell is a (row, column) pair.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - text (str|None): The range reference or None.
+             - error (tuple|None): The exception type and message, if any.
+
+    Examples:
+        >>> _format_range_ref(((7, 2), (9, 3)))
+        ('B7:C9', None)
+        >>> _format_range_ref(((9, 2), (7, 3)))
+        ('B7:C9', None)
+        >>> _format_range_ref(((7, 2),))
+        (None, (<class 'ValueError'>, 'Invalid range `((7, 2),)`'))
+    """
+    try:
+        start, stop = ref
+    except (TypeError, ValueError):  # not a pair
+        return None, (ValueError, 'Invalid range `{}`'.format(ref))
+    for cell in (start, stop):
+        _, error = _format_cell_ref(cell)
+        if error:
+            return None, error
+    start, stop = _normalize_range(start, stop)
+    return _format_cell_ref(start)[0] + ':' + _format_cell_ref(stop)[0], None
+
+
+# ======================================================================
+def parse_cell_ref(text):
+    """
+    Convert a cell reference to its row and column.
+
+    Args:
+        text (str): The input string to parse.
+            Absolute markers (`$`) are ignored, and lowercase letters are
+            accepted.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - row (int): The 1-based row.
+             - col (int): The 1-based column.
+
+    Raises:
+        ValueError: if the input is not a valid cell reference.
+            This includes cells beyond `MAX_ROW` or `MAX_COLUMN`.
+
+    Examples:
+        >>> parse_cell_ref('A1'), parse_cell_ref('$XFD$1048576')
+        ((1, 1), (1048576, 16384))
+        >>> parse_cell_ref('A1:B2')
+        Traceback (most recent call last):
+            ...
+        ValueError: Invalid cell reference `A1:B2`
+        >>> parse_cell_ref('XFE1')
+        Traceback (most recent call last):
+            ...
+        ValueError: Invalid cell reference `XFE1`
+
+    See Also:
+        format_cell_ref(), parse_range_ref(), letter2int()
+    """
+    ref, error = _parse_cell_ref(text)
+    if error:
+        raise error[0](error[1])
+    return ref
+
+
+# ======================================================================
+def format_cell_ref(
+        row,
+        col):
+    """
+    Convert a row and a column to a cell reference.
+
+    Args:
+        row (int): The 1-based row.
+        col (int): The 1-based column.
+
+    Returns:
+        text (str): The cell reference.
+
+    Raises:
+        ValueError: if `row` or `col` are not positive, or if they exceed
+            `MAX_ROW` or `MAX_COLUMN`, respectively.
+
+    Examples:
+        >>> format_cell_ref(1, 1), format_cell_ref(1048576, 16384)
+        ('A1', 'XFD1048576')
+        >>> all(parse_cell_ref(format_cell_ref(3, i)) == (3, i)
+        ...     for i in range(1, MAX_COLUMN + 1))
+        True
+        >>> format_cell_ref(1048577, 1)
+        Traceback (most recent call last):
+            ...
+        ValueError: Invalid cell `(1048577, 1)`
+
+    See Also:
+        parse_cell_ref(), format_range_ref(), int2letter()
+    """
+    text, error = _format_cell_ref((row, col))
+    if error:
+        raise error[0](error[1])
+    return text
+
+
+# ======================================================================
+def parse_range_ref(text):
+    """
+    Convert a range reference to its corner cells.
+
+    Args:
+        text (str): The input string to parse.
+            A single cell reference is interpreted as a one-cell range.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - start (tuple[int]): The (row, column) of the top-left cell.
+             - stop (tuple[int]): The (row, column) of the bottom-right cell.
+
+    Raises:
+        ValueError: if the input is not a valid range reference.
+
+    Examples:
+        >>> parse_range_ref('AB1:AC10'), parse_range_ref('AC10:AB1')
+        (((1, 28), (10, 29)), ((1, 28), (10, 29)))
+        >>> parse_range_ref('A1:')
+        Traceback (most recent call last):
+            ...
+        ValueError: Invalid range reference `A1:`
+
+    See Also:
+        format_range_ref(), parse_cell_ref()
+    """
+    ref, error = _parse_range_ref(text)
+    if error:
+        raise error[0](error[1])
+    return ref
+
+
+# ======================================================================
+def format_range_ref(
+        start,
+        stop):
+    """
+    Convert the corner cells of a range to a range reference.
+
+    Args:
+        start (tuple[int]): The (row, column) of a corner cell.
+        stop (tuple[int]): The (row, column) of the opposite corner cell.
+
+    Returns:
+        text (str): The range reference.
+            The top-left corner is always first.
+
+    Raises:
+        ValueError: if any cell is not valid (see `format_cell_ref()`).
+
+    Examples:
+        >>> format_range_ref((1, 28), (10, 29))
+        'AB1:AC10'
+        >>> format_range_ref((1, 29), (10, 28))
+        'AB1:AC10'
+
+    See Also:
+        parse_range_ref(), format_cell_ref()
+    """
+    text, error = _format_range_ref((start, stop))
+    if error:
+        raise error[0](error[1])
+    return text
+
+
+# ======================================================================
+def parse_cell_ref_batch(
+        texts,
+        errors='raise',
+        fill_value=None):
+    """
+    Convert multiple cell references to their rows and columns.
+
+    Args:
+        texts (Iterable[str]): The input strings to parse.
+        errors (str): The policy for invalid items.
+            Accepted values are the items of `numeral.BATCH_ERRORS`.
+        fill_value (Any): The value to use for invalid items.
+            This is only used if `errors == 'coerce'`.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - refs (list): The (row, column) pairs.
+             - invalid (list[int]): The indices of the invalid items.
+
+    Examples:
+        >>> parse_cell_ref_batch(['A1', 'A0', 'ab12'], errors='coerce')
+        ([(1, 1), None, (12, 28)], [1])
+
+    See Also:
+        parse_cell_ref()
+    """
+    return _batch(_parse_cell_ref, texts, errors, fill_value)
+
+
+# ======================================================================
+def format_cell_ref_batch(
+        refs,
+        errors='raise',
+        fill_value=None):
+    """
+    Convert multiple rows and columns to cell references.
+
+    Args:
+        refs (Iterable[tuple[int]]): The (row, column) pairs.
+        errors (str): The policy for invalid items.
+            Accepted values are the items of `numeral.BATCH_ERRORS`.
+        fill_value (Any): The value to use for invalid items.
+            This is only used if `errors == 'coerce'`.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - texts (list): The cell references.
+             - invalid (list[int]): The indices of the invalid items.
+
+    Examples:
+        >>> format_cell_ref_batch([(1, 1), (0, 1), (12, 28)], errors='skip')
+        (['A1', 'AB12'], [1])
+
+    See Also:
+        format_cell_ref()
+    """
+    return _batch(_format_cell_ref, refs, errors, fill_value)
+
+
+# ======================================================================
+def parse_range_ref_batch(
+        texts,
+        errors='raise',
+        fill_value=None):
+    """
+    Convert multiple range references to their corner cells.
+
+    Args:
+        texts (Iterable[str]): The input strings to parse.
+        errors (str): The policy for invalid items.
+            Accepted values are the items of `numeral.BATCH_ERRORS`.
+        fill_value (Any): The value to use for invalid items.
+            This is only used if `errors == 'coerce'`.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - refs (list): The (start, stop) cells.
+             - invalid (list[int]): The indices of the invalid items.
+
+    Examples:
+        >>> parse_range_ref_batch(['A1:B2', 'C3'])
+        ([((1, 1), (2, 2)), ((3, 3), (3, 3))], [])
+
+    See Also:
+        parse_range_ref()
+    """
+    return _batch(_parse_range_ref, texts, errors, fill_value)
+
+
+# ======================================================================
+def format_range_ref_batch(
+        refs,
+        errors='raise',
+        fill_value=None):
+    """
+    Convert multiple corner cells of ranges to range references.
+
+    Args:
+        refs (Iterable[tuple[tuple[int]]]): The (start, stop) cells.
+        errors (str): The policy for invalid items.
+            Accepted values are the items of `numeral.BATCH_ERRORS`.
+        fill_value (Any): The value to use for invalid items.
+            This is only used if `errors == 'coerce'`.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - texts (list): The range references.
+             - invalid (list[int]): The indices of the invalid items.
+
+    Examples:
+        >>> format_range_ref_batch([((1, 1), (2, 2)), ((3, 3), (3, 3))])
+        (['A1:B2', 'C3:C3'], [])
+
+    See Also:
+        format_range_ref()
+    """
+    return _batch(_format_range_ref, refs, errors, fill_value)
+
+
+# ======================================================================
+if __name__ == '__main__':
+    doctest.testmod()
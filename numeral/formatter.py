@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Numeral: format-spec integration for numeral rendering.
+
+The format specification mini-language is:
+
+    <kind>[,<option>...][:<string format spec>]
+
+where `<kind>` is one of:
+ - `roman`: see `int2roman()`; the options are:
+   `ascii`, `additive`, `standard` (no extended range), `lower`, `upper`,
+   `claudian`, `alternatives`, `unsigned`, `vinculum` or `vinculum=<marker>`
+ - `letters`: see `int2letter()`; the options are:
+   `lower`, `upper`, `alphabet=<characters>`
+ - `tokens=<token>|<token>|...`: see `int2tokens()`
+and all kinds accept the `sign=<negative sign>` option.
+The optional string format spec (e.g. `>8`) is applied to the result.
+
+Each distinct specification is compiled into a converter only once.
+
+Examples:
+    >>> fmt = NumeralFormatter()
+    >>> fmt.format('{:roman,ascii,lower}. {:letters,upper}) {:05d}', 4, 27, 3)
+    'iv. AB) 00003'
+    >>> fmt.format('[{:tokens=po|ta:>8}]', 8)
+    '[  potapo]'
+    >>> '{:roman}'.format(NumeralInt(1666))
+    'ⅯⅮⅭⅬⅩⅥ'
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals)
+
+# ======================================================================
+# :: Python Standard Library Imports
+import string  # Common string operations
+import functools  # Higher-order functions and operations on callable objects
+import doctest  # Test interactive Python examples
+
+# ======================================================================
+# :: Internal Imports
+from numeral.backends import int2letter, int2tokens, int2roman
+from numeral.numeral import ROMAN_ALTERNATIVES
+
+# ======================================================================
+_ROMAN_SPEC_FLAGS = {
+    'ascii': ('only_ascii', True),
+    'additive': ('only_additive', True),
+    'standard': ('extended', False),
+    'lower': ('uppercase', False),
+    'upper': ('uppercase', True),
+    'claudian': ('claudian', True),
+    'alternatives': ('alternatives', ROMAN_ALTERNATIVES),
+    'unsigned': ('signed', False),
+    'vinculum': ('vinculum', True),
+}
+_LETTERS_SPEC_FLAGS = {
+    'lower': ('alphabet', string.ascii_lowercase),
+    'upper': ('alphabet', string.ascii_uppercase),
+}
+
+
+# ======================================================================
+@functools.lru_cache(maxsize=256)
+def compile_spec(spec):
+    """
+    Compile a numeral format specification into a converter.
+
+    Args:
+        spec (str): The numeral format specification.
+            See the module documentation for the syntax.
+
+    Returns:
+        converter (callable|None): The converter.
+            Its signature is: converter(int) -> str.
+            If `spec` is not a numeral format specification, returns None.
+
+    Raises:
+        ValueError: if the numeral format specification is invalid.
+
+    Examples:
+        >>> compile_spec('roman,ascii')(1666)
+        'MDCLXVI'
+        >>> compile_spec('tokens=!|@,sign=~')(-3)
+        '~!@'
+        >>> compile_spec('>5') is None
+        True
+        >>> compile_spec('roman,unknown')
+        Traceback (most recent call last):
+            ...
+        ValueError: Invalid numeral format spec `roman,unknown`
+    """
+    numeral_spec, sep, str_spec = spec.partition(':')
+    items = numeral_spec.split(',')
+    kind, _, kind_value = items[0].partition('=')
+    if kind == 'roman' and not kind_value:
+        func, flags, kws = int2roman, _ROMAN_SPEC_FLAGS, {}
+    elif kind == 'letters' and not kind_value:
+        func, flags, kws = int2letter, _LETTERS_SPEC_FLAGS, {}
+    elif kind == 'tokens' and kind_value:
+        tokens = tuple(kind_value.split('|'))
+        func, flags, kws = int2tokens, {}, {'tokens': tokens}
+    else:
+        return None
+    for item in items[1:]:
+        name, has_value, value = item.partition('=')
+        if name in flags and not has_value:
+            kws[flags[name][0]] = flags[name][1]
+        elif name == 'sign' and value:
+            kws['negative_sign'] = value
+        elif name == 'alphabet' and value and func is int2letter:
+            kws['alphabet'] = value
+        elif name == 'vinculum' and value and func is int2roman:
+            kws['vinculum'] = value
+        else:
+            raise ValueError('Invalid numeral format spec `{}`'.format(spec))
+    converter = functools.partial(func, **kws)
+    if sep:
+        return lambda num: format(converter(num), str_spec)
+    else:
+        return converter
+
+
+# ======================================================================
+def format_numeral(
+        value,
+        spec):
+    """
+    Format a value using a numeral format specification.
+
+    Args:
+        value (int|Any): The value to format.
+        spec (str): The format specification.
+            If this is not a numeral format specification, the built-in
+            `format()` is used.
+
+    Returns:
+        text (str): The formatted value.
+
+    Examples:
+        >>> format_numeral(12, 'roman,ascii'), format_numeral(12, '>3')
+        ('XII', ' 12')
+    """
+    converter = compile_spec(spec)
+    return converter(value) if converter else format(value, spec)
+
+
+# ======================================================================
+class NumeralFormatter(string.Formatter):
+    """
+    String formatter supporting numeral format specifications.
+
+    See the module documentation for the syntax.
+    """
+
+    def format_field(self, value, format_spec):
+        return format_numeral(value, format_spec)
+
+
+# ======================================================================
+class NumeralInt(int):
+    """
+    Integer supporting numeral format specifications in `format()`.
+
+    See the module documentation for the syntax.
+    """
+
+    def __format__(self, format_spec):
+        converter = compile_spec(format_spec)
+        return converter(self) if converter \
+            else int.__format__(self, format_spec)
+
+
+# ======================================================================
+if __name__ == '__main__':
+    doctest.testmod()
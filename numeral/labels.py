@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Numeral: compact containers for large amounts of encoded numerals.
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals)
+
+# ======================================================================
+# :: Python Standard Library Imports
+import array  # Efficient arrays of numeric values
+import doctest  # Test interactive Python examples
+
+# ======================================================================
+# :: Internal Imports
+from numeral.backends import int2letter
+from numeral.numeral import (
+    letter2int_batch, tokens2int_batch, roman2int_batch)
+
+# ======================================================================
+LABEL_DECODERS = {
+    'letter': letter2int_batch,
+    'tokens': tokens2int_batch,
+    'roman': roman2int_batch,
+}
+
+_LABEL_PAD = b'\x00'
+
+
+# ======================================================================
+class LabelArray(object):
+    """
+    Compact array of encoded numerals (or any string label).
+
+    All labels are stored UTF-8 encoded in a single contiguous buffer,
+    either using an offsets array (variable width) or fixed-width rows
+    padded with null bytes (if `width` is specified).
+    Labels are decoded to `str` only when accessed.
+
+    Slicing returns a view sharing the same buffers.
+
+    Args:
+        texts (Iterable[str]): The labels.
+        width (int|None): The width of the rows in bytes.
+            If None, the rows have variable width.
+
+    Raises:
+        ValueError: if a label does not fit in `width` bytes.
+
+    Examples:
+        >>> labels = LabelArray.from_ints(range(1000))
+        >>> len(labels), labels[27], labels[-1]
+        (1000, 'ab', 'all')
+        >>> labels[26:29].tolist()
+        ['aa', 'ab', 'ac']
+        >>> labels[26:29].to_ints()
+        ([26, 27, 28], [])
+        >>> fixed = LabelArray(['Ⅰ', 'Ⅱ', 'Ⅳ', 'Ⅻ'], width=3)
+        >>> fixed.tolist(), fixed.to_ints('roman')
+        (['Ⅰ', 'Ⅱ', 'Ⅳ', 'Ⅻ'], ([1, 2, 4, 12], []))
+        >>> import pickle
+        >>> pickle.loads(pickle.dumps(labels[1::2]))[13]
+        'ab'
+    """
+
+    __slots__ = ('_data', '_offsets', '_width', '_start', '_stop')
+
+    def __init__(self, texts=(), width=None):
+        data = bytearray()
+        if width:
+            for text in texts:
+                item = text.encode('utf-8')
+                if len(item) > width:
+                    raise ValueError(
+                        '`{}` does not fit in {} bytes'.format(text, width))
+                data += item + _LABEL_PAD * (width - len(item))
+            offsets = None
+            size = len(data) // width
+        else:
+            offsets = array.array('Q', [0])
+            for text in texts:
+                data += text.encode('utf-8')
+                offsets.append(len(data))
+            size = len(offsets) - 1
+        self._data = bytes(data)
+        self._offsets = offsets
+        self._width = width
+        self._start = 0
+        self._stop = size
+
+    # --------------------------------
+    @classmethod
+    def _from_buffers(cls, data, offsets, width, start, stop):
+        """
+        Create a label array (or view) from existing buffers.
+
+        Args:
+            data (bytes): The UTF-8 encoded labels.
+            offsets (array.array|None): The offsets of the labels.
+                Must be None if `width` is specified.
+            width (int|None): The width of the rows in bytes.
+            start (int): The index of the first label of the view.
+            stop (int): The index after the last label of the view.
+
+        Returns:
+            result (LabelArray): The label array.
+        """
+        self = cls.__new__(cls)
+        self._data = data
+        self._offsets = offsets
+        self._width = width
+        self._start = start
+        self._stop = stop
+        return self
+
+    # --------------------------------
+    @classmethod
+    def from_ints(cls, nums, func=int2letter, width=None, **_kws):
+        """
+        Encode integers into a label array.
+
+        Args:
+            nums (Iterable[int]): The input numbers to convert.
+            func (callable): The conversion function.
+                Must have the signature: func(int, **_kws) -> str,
+                e.g. `int2letter()`, `int2tokens()` or `int2roman()`.
+            width (int|None): The width of the rows in bytes.
+                If None, the rows have variable width.
+            **_kws: Keyword arguments for `func`.
+
+        Returns:
+            result (LabelArray): The label array.
+        """
+        return cls((func(num, **_kws) for num in nums), width)
+
+    # --------------------------------
+    def _item(self, i):
+        """Decode the i-th label of the underlying buffers."""
+        if self._width:
+            begin = i * self._width
+            return self._data[begin:begin + self._width].rstrip(
+                _LABEL_PAD).decode('utf-8')
+        else:
+            return self._data[
+                self._offsets[i]:self._offsets[i + 1]].decode('utf-8')
+
+    # --------------------------------
+    def __len__(self):
+        return self._stop - self._start
+
+    # --------------------------------
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self._from_buffers(
+                    self._data, self._offsets, self._width,
+                    self._start + start, self._start + max(start, stop))
+            return type(self)(
+                (self._item(self._start + i)
+                 for i in range(start, stop, step)), self._width)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('LabelArray index out of range')
+        return self._item(self._start + index)
+
+    # --------------------------------
+    def __iter__(self):
+        for i in range(self._start, self._stop):
+            yield self._item(i)
+
+    # --------------------------------
+    def __repr__(self):
+        return '{}({!r}, width={!r})'.format(
+            type(self).__name__, self.tolist(), self._width)
+
+    # --------------------------------
+    def __reduce__(self):
+        if self._width:
+            data = self._data[
+                self._start * self._width:self._stop * self._width]
+            offsets = None
+        elif self._start == 0 \
+                and self._stop == len(self._offsets) - 1:
+            data = self._data
+            offsets = self._offsets
+        else:
+            base = self._offsets[self._start]
+            data = self._data[base:self._offsets[self._stop]]
+            offsets = array.array(
+                'Q', [offset - base for offset in
+                      self._offsets[self._start:self._stop + 1]])
+        return self._from_buffers, (
+            data, offsets, self._width, 0, len(self))
+
+    # --------------------------------
+    @property
+    def nbytes(self):
+        """The number of bytes used by the underlying buffers."""
+        return len(self._data) + (
+            self._offsets.itemsize * len(self._offsets)
+            if self._offsets is not None else 0)
+
+    # --------------------------------
+    def tolist(self):
+        """
+        Decode all labels.
+
+        Returns:
+            result (list[str]): The labels.
+        """
+        return list(self)
+
+    # --------------------------------
+    def to_ints(
+            self,
+            kind='letter',
+            *_args,
+            **_kws):
+        """
+        Decode all labels to integers.
+
+        Args:
+            kind (str): The kind of representation.
+                Accepted values are the keys of `LABEL_DECODERS`, i.e.:
+                 - 'letter': see `numeral.letter2int_batch()`;
+                 - 'tokens': see `numeral.tokens2int_batch()`;
+                 - 'roman': see `numeral.roman2int_batch()`.
+            *_args: Positional arguments for the batch decoder.
+            **_kws: Keyword arguments for the batch decoder.
+                This includes the `errors` policy.
+
+        Returns:
+            result (tuple): The tuple
+                contains:
+                 - nums (list): The integers represented.
+                 - invalid (list[int]): The indices of the invalid items.
+        """
+        return LABEL_DECODERS[kind](iter(self), *_args, **_kws)
+
+
+# ======================================================================
+if __name__ == '__main__':
+    doctest.testmod()
@@ -12,8 +12,12 @@ from __future__ import (
 # ======================================================================
 # :: Python Standard Library Imports
 import collections  # Container datatypes
+import contextlib  # Utilities for with-statement contexts
+import contextvars  # Context Variables
+import base64  # Base16, Base32, Base64, Base85 Data Encodings
 import string  # Common string operations
 import functools  # Higher-order functions and operations on callable objects
+import itertools  # Functions creating iterators for efficient looping
 import math  # Mathematical functions
 import re  # Regular expression operations
 import doctest  # Test interactive Python examples
@@ -57,6 +61,7 @@ _ROMAN_APOSTROPHUS = collections.OrderedDict((
     ('ↀ', 1000), ('ↁ', 5000), ('ↂ', 10000), ('ↇ', 50000), ('ↈ', 100000)))
 _ROMAN_APOSTROPHUS_R = collections.OrderedDict(
     [(v, k) for k, v in sorted(_ROMAN_APOSTROPHUS.items(), reverse=True)])
+_ROMAN_APOSTROPHUS_MIN_PLACE = len(str(min(_ROMAN_APOSTROPHUS.values()))) - 1
 _ROMAN_CLAUDIAN_TO_APOSTROPHUS = (
     ('ⅭⅭↀↃↃ', 'ↈ'), ('ⅮↃↃ', 'ↇ'), ('ⅭↀↃ', 'ↂ'), ('ⅮↃ', 'ↁ'))
 _ROMAN_CLAUDIAN_TO_APOSTROPHUS_R = tuple(
@@ -78,19 +83,394 @@ _ROMAN_ASCII_UPPER = collections.OrderedDict((
     (_ROMAN_CLAUDIAN_TO_ASCII, None)))
 _ROMAN_ASCII_LOWER = collections.OrderedDict((
     ('i', 1), ('v', 5), ('x', 10), ('l', 50),
-    ('cⅽ', 100), ('d', 500), ('m', 1000), ('n', 0),
+    ('c', 100), ('d', 500), ('m', 1000), ('n', 0),
     (_ROMAN_CLAUDIAN_TO_ASCII.lower(), None)))
 _ROMAN_ASCII = _ROMAN_ASCII_UPPER
 _ROMAN_ASCII_R = collections.OrderedDict(
     [(v, k) for k, v in sorted(_ROMAN_ASCII.items(), reverse=True)
      if v is not None])
 _ROMAN_MINUS = '-'
+_ROMAN_VINCULUM = '\u0305'  # combining overline
+_ROMAN_VINCULUM_FACTOR = 1000
 _ROMAN_MAX_CONSECUTIVE = {True: 4, False: 3}  # key -> `only_additive` option
 _ROMAN_STRICT_REGEX = \
     r'^M{0,3}(CM|CD|D?C{0,3})(XC|XL|L?X{0,3})(IX|IV|V?I{0,3})$'
 
 # ======================================================================
 ROMAN_ALTERNATIVES = (('Ⅵ', 'ↅ'), ('Ⅼ', 'ↆ'), ('Ⅿ', 'ↀ'))
+BATCH_ERRORS = ('raise', 'coerce', 'skip')
+LIMIT_NAMES = ('max_length', 'max_magnitude', 'max_output')
+
+# ======================================================================
+# :: global input-size limits, in the order of `LIMIT_NAMES` (see
+#    `set_limits()`), and their context-local override (see `use_limits()`)
+_LIMITS = (None, None, None)
+_CONTEXT_LIMITS = contextvars.ContextVar('_CONTEXT_LIMITS', default=None)
+
+# ======================================================================
+# :: precomputed tables, see `numeral.tables` (key is from `_table_key()`)
+_TABLES = {}
+
+# ======================================================================
+# :: standard digits for power-of-two bases (key is the number of bits)
+_POW2_DIGITS = {
+    1: '01',
+    2: '0123',
+    3: '01234567',
+    4: '0123456789abcdef',
+    5: 'ABCDEFGHIJKLMNOPQRSTUVWXYZ234567',  # Base32
+    6: string.ascii_uppercase + string.ascii_lowercase + string.digits + '+/',
+    8: ''.join(chr(i) for i in range(256)),  # Latin-1
+}
+_POW2_FORMATS = {1: 'b', 3: 'o', 4: 'x'}
+_HEX_TO_QUAD = dict(
+    [(ord(c), _POW2_DIGITS[2][i // 4] + _POW2_DIGITS[2][i % 4])
+     for i, c in enumerate(_POW2_DIGITS[4])])
+
+# ======================================================================
+# :: direct character-to-ASCII and character-to-values decoding tables
+_ROMAN_DECODE_ASCII = dict(
+    [(k, k.upper()) for k in _ROMAN_ASCII_UPPER]
+    + [(k, k.upper()) for k in _ROMAN_ASCII_LOWER]
+    + [(k, v) for k, v in _ROMAN_UNICODE_TO_ASCII]
+    + [(k.lower(), v) for k, v in _ROMAN_UNICODE_TO_ASCII])
+_ROMAN_DECODE_ASCII.update(
+    [(alt, _ROMAN_DECODE_ASCII[std]) for std, alt in ROMAN_ALTERNATIVES])
+_ROMAN_DECODE_VALUES = dict(
+    [(k, tuple(_ROMAN_ASCII[c] for c in v))
+     for k, v in _ROMAN_DECODE_ASCII.items()])
+_ROMAN_DECODE_TRANSLATE = dict(
+    [(ord(k), v) for k, v in _ROMAN_DECODE_ASCII.items()])
+
+
+# ======================================================================
+class InputLimitError(ValueError):
+    """
+    Input (or output) exceeding the configured size limits.
+
+    This is raised before any expensive work is done.
+
+    See Also:
+        set_limits(), use_limits()
+    """
+    pass
+
+
+# ======================================================================
+def _get_limits(limits):
+    """
+    Combine per-call limits with the limits in effect.
+
+    The limits in effect are those set by `use_limits()` in the current
+    context (if any), or otherwise the global limits.
+
+    Args:
+        limits (Mapping[str, int|None]|None): The per-call limits.
+            Keys must be in `LIMIT_NAMES`, and override the limits in effect.
+
+    Returns:
+        result (tuple[int|None]): The limits, in the order of `LIMIT_NAMES`.
+
+    Raises:
+        ValueError: if the limit names are not supported.
+
+    Examples:
+        >>> _get_limits({'max_length': 8})
+        (8, None, None)
+        >>> _get_limits({'max_size': 8})
+        Traceback (most recent call last):
+            ...
+        ValueError: Unsupported limits: ['max_size']
+    """
+    active = _CONTEXT_LIMITS.get()
+    if active is None:
+        active = _LIMITS
+    if not limits:
+        return active
+    unknown = set(limits) - set(LIMIT_NAMES)
+    if unknown:
+        raise ValueError('Unsupported limits: {}'.format(sorted(unknown)))
+    return tuple(
+        limits.get(name, limit) for name, limit in zip(LIMIT_NAMES, active))
+
+
+# ======================================================================
+def _check_limits(limits):
+    """
+    Check that the limits are valid.
+
+    Args:
+        limits (Iterable[int|None]): The limits.
+            Must be in the order of `LIMIT_NAMES`.
+
+    Returns:
+        limits (tuple[int|None]): The limits.
+
+    Raises:
+        ValueError: if a limit is negative.
+
+    Examples:
+        >>> _check_limits([8, None, -1])
+        Traceback (most recent call last):
+            ...
+        ValueError: Invalid `max_output=-1`
+    """
+    limits = tuple(limits)
+    for name, limit in zip(LIMIT_NAMES, limits):
+        if limit is not None and limit < 0:
+            raise ValueError('Invalid `{}={}`'.format(name, limit))
+    return limits
+
+
+# ======================================================================
+def _min_tokens_length(
+        num,
+        base):
+    """
+    Estimate a lower bound of the length of the representation of a number.
+
+    This only uses the number of bits, hence it runs in constant time.
+
+    Args:
+        num (int): The input number.
+            For negative numbers, the absolute value is used.
+        base (int): The number of tokens in the tokens set.
+
+    Returns:
+        result (int): The lower bound of the number of tokens.
+
+    Examples:
+        >>> all(_min_tokens_length(n, b) <= tokens_length(n, b)
+        ...     for n in range(0, 10 ** 6, 997) for b in (1, 2, 10, 26))
+        True
+        >>> _min_tokens_length(10 ** 1000, 10)
+        998
+    """
+    num = abs(num)
+    if base == 1:
+        return num + 1
+    return max(int((num.bit_length() - 1) / math.log2(base)) - 1, 0)
+
+
+# ======================================================================
+def _tokens_max_length(
+        max_magnitude,
+        tokens):
+    """
+    Compute the maximum length of the tokens representing a magnitude.
+
+    Args:
+        max_magnitude (int): The maximum absolute value of the numbers.
+        tokens (Sequence[str]): The tokens set.
+
+    Returns:
+        result (int): The maximum length (excluding the negative sign).
+
+    Examples:
+        >>> _tokens_max_length(99, string.digits)
+        2
+        >>> _tokens_max_length(702, ('a', 'bb'))
+        18
+    """
+    return tokens_length(max_magnitude, len(tokens)) \
+        * max(len(token) for token in tokens)
+
+
+# ======================================================================
+def _roman_max_length(
+        max_magnitude,
+        vinculum=None):
+    """
+    Estimate the maximum length of the Roman numbers representing a magnitude.
+
+    This assumes at most 5 symbols per decimal digit (e.g. `DCCCC`), each
+    followed by the vinculum markers of its group of three digits (if
+    any), plus a symbol for each thousand (e.g. `MMMMM` for 5000).
+    This covers all the outputs of `int2roman()` (that can be decoded),
+    while longer texts, e.g. `IIIIIIIIII` or `IIM`, are accepted by
+    `roman2int()` with `strict=False`.
+    This runs in constant time.
+
+    Args:
+        max_magnitude (int): The maximum absolute value of the numbers.
+        vinculum (str|None): The vinculum marker.
+            If None, vinculum notation is not accepted.
+
+    Returns:
+        result (int): The maximum length (excluding the negative sign).
+
+    Examples:
+        >>> _roman_max_length(3999), _roman_max_length(3999, '_')
+        (23, 43)
+        >>> all(len(int2roman(i, only_additive=True)) <= _roman_max_length(i)
+        ...     for i in range(4000))
+        True
+    """
+    num_digits = int(max_magnitude.bit_length() * math.log10(2)) + 1
+    num_markers = num_digits // 3 * len(vinculum) if vinculum else 0
+    return max_magnitude // 1000 + 5 * num_digits * (1 + num_markers)
+
+
+# ======================================================================
+def _limited_decoder(
+        func,
+        limits,
+        max_length_of=None,
+        sign_size=1):
+    """
+    Enforce the input-size limits on a non-raising decoder.
+
+    The input length is checked before decoding: if `max_length_of` is
+    given, the input must not be longer than the representation of
+    `max_magnitude`.
+    The magnitude of the result is checked after decoding.
+
+    Args:
+        func (callable): The decoder.
+            Must have the signature: func(text) -> (num, error).
+        limits (Mapping[str, int|None]|None): The per-call limits.
+            See `set_limits()` for more details.
+        max_length_of (callable|None): The maximum length of the input.
+            Must have the signature: max_length_of(max_magnitude) -> int,
+            excluding the negative sign, e.g. `_tokens_max_length()`.
+            Must run in constant time.
+        sign_size (int): The length of the negative sign.
+
+    Returns:
+        func (callable): The decoder enforcing the limits.
+            If no limit is set, this is the input decoder.
+
+    Examples:
+        >>> func = _limited_decoder(
+        ...     lambda text: (int(text), None), {'max_magnitude': 99},
+        ...     lambda n: _tokens_max_length(n, string.digits))
+        >>> func('-99')
+        (-99, None)
+        >>> num, error = func('100')
+        >>> num, error[0].__name__, error[1]
+        (None, 'InputLimitError', 'Input magnitude exceeds `max_magnitude=99`')
+        >>> num, error = func('1000')
+        >>> num, error[0].__name__, error[1]
+        (None, 'InputLimitError', 'Input length `4` exceeds `3`')
+    """
+    max_length, max_magnitude, _ = _get_limits(limits)
+    if max_length is None and max_magnitude is None:
+        return func
+    max_size = max_length
+    if max_magnitude is not None and max_length_of is not None:
+        magnitude_size = max_length_of(max_magnitude) + sign_size
+        if max_size is None or magnitude_size < max_size:
+            max_size = magnitude_size
+
+    def limited(text):
+        if max_size is not None and len(text) > max_size:
+            return None, (InputLimitError, 'Input length `{}` exceeds `{}`'
+                          .format(len(text), max_size))
+        num, error = func(text)
+        if error is None and max_magnitude is not None \
+                and abs(num) > max_magnitude:
+            return None, (InputLimitError, 'Input magnitude exceeds '
+                          '`max_magnitude={}`'.format(max_magnitude))
+        return num, error
+
+    return limited
+
+
+# ======================================================================
+def _limited_encoder(func):
+    """
+    Report the input-size limits violations of an encoder as errors.
+
+    This makes an encoder enforcing the limits (e.g. `int2tokens()`)
+    non-raising, so that it can be used with `_batch()`.
+
+    Args:
+        func (callable): The encoder.
+            Must have the signature: func(num) -> text, and may only raise
+            `InputLimitError` (other exceptions are propagated).
+
+    Returns:
+        func (callable): The non-raising encoder.
+            Its signature is: func(num) -> (text, error).
+
+    Examples:
+        >>> func = _limited_encoder(
+        ...     lambda num: int2tokens(num, 'ab', limits={'max_output': 3}))
+        >>> func(5), func(50)[0], func(50)[1][0].__name__
+        (('bb', None), None, 'InputLimitError')
+    """
+    def limited(num):
+        try:
+            return func(num), None
+        except InputLimitError as exc:
+            return None, (InputLimitError, str(exc))
+
+    return limited
+
+
+# ======================================================================
+def _check_encode_limits(
+        num,
+        limits,
+        min_length):
+    """
+    Enforce the input-size limits before encoding.
+
+    Args:
+        num (int): The input number to convert.
+        limits (Mapping[str, int|None]|None): The per-call limits.
+            See `set_limits()` for more details.
+        min_length (callable): The lower bound of the output length.
+            Must have the signature: min_length(num) -> int.
+            Must run in constant time.
+
+    Returns:
+        max_output (int|None): The maximum output length.
+
+    Raises:
+        InputLimitError: if the limits are exceeded.
+
+    Examples:
+        >>> _check_encode_limits(10 ** 9, {'max_output': 5}, lambda n: 5)
+        5
+        >>> _check_encode_limits(  # doctest: +IGNORE_EXCEPTION_DETAIL
+        ...     10 ** 9, {'max_magnitude': 5}, lambda n: 5)
+        Traceback (most recent call last):
+            ...
+        numeral.numeral.InputLimitError: Input magnitude exceeds \
+`max_magnitude=5`
+    """
+    _, max_magnitude, max_output = _get_limits(limits)
+    if max_magnitude is not None and abs(num) > max_magnitude:
+        raise InputLimitError(
+            'Input magnitude exceeds `max_magnitude={}`'.format(max_magnitude))
+    if max_output is not None and min_length(num) > max_output:
+        raise InputLimitError(
+            'Output length exceeds `max_output={}`'.format(max_output))
+    return max_output
+
+
+# ======================================================================
+def _check_output_length(
+        text,
+        max_output):
+    """
+    Enforce the maximum output length.
+
+    Args:
+        text (str): The output text.
+        max_output (int|None): The maximum output length.
+
+    Returns:
+        text (str): The output text.
+
+    Raises:
+        InputLimitError: if `text` is longer than `max_output`.
+    """
+    if max_output is not None and len(text) > max_output:
+        raise InputLimitError(
+            'Output length exceeds `max_output={}`'.format(max_output))
+    return text
 
 
 # ======================================================================
@@ -116,14 +496,1228 @@ def _multi_replace(
         >>> _multi_replace('x-x-', (('-x-', '.test'),))
         'x.test'
     """
-    return functools.reduce(lambda s, r: s.replace(*r), replaces, text)
+    return functools.reduce(lambda s, r: s.replace(*r), replaces, text)
+
+
+# ======================================================================
+def _indices(items):
+    """
+    Compute the position of each item within a sequence.
+
+    Args:
+        items (Sequence): The input items.
+
+    Returns:
+        indices (dict): The position of each item.
+            If an item is repeated, the first position is used.
+
+    Examples:
+        >>> sorted(_indices('abc').items())
+        [('a', 0), ('b', 1), ('c', 2)]
+        >>> _indices('abca')['a']
+        0
+    """
+    indices = {}
+    for i, item in enumerate(items):
+        indices.setdefault(item, i)
+    return indices
+
+
+# ======================================================================
+def _split_sign(
+        text,
+        negative_sign):
+    """
+    Separate the negative sign from the rest of the representation.
+
+    Args:
+        text (str): The input string to parse.
+        negative_sign (str): The symbol to use for negative numbers.
+            The negative sign must be the first character of the
+            representation.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - sign (int|None): The sign (+1 or -1) or None if invalid.
+             - text (str): The representation without the negative sign.
+
+    Examples:
+        >>> _split_sign('-abc', '-')
+        (-1, 'abc')
+        >>> _split_sign('abc', '-')
+        (1, 'abc')
+        >>> _split_sign('a-bc', '-')
+        (None, 'a-bc')
+    """
+    text = text.strip()
+    if negative_sign in text:
+        if text[0] == negative_sign:
+            return -1, text[1:]
+        else:
+            return None, text
+    return 1, text
+
+
+# ======================================================================
+def _letter2int(
+        text,
+        indices,
+        base,
+        negative_sign):
+    """
+    Convert a group of letters to a number without raising on bad input.
+
+    This is the core of `letter2int()` where the alphabet is assumed to be
+    already validated and precomputed.
+
+    Args:
+        text (str): The input string to parse.
+        indices (Mapping[str, int]): The position of each letter.
+        base (int): The number of letters in the alphabet.
+        negative_sign (str): The symbol to use for negative numbers.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - num (int|None): The integer represented or None if invalid.
+             - error (tuple|None): The exception type and message, if any.
+
+    Examples:
+        >>> _letter2int('bxh', _indices(string.ascii_lowercase), 26, '-')
+        (1983, None)
+        >>> _letter2int('b!h', _indices(string.ascii_lowercase), 26, '-')
+        (None, (<class 'ValueError'>, 'Text contains invalid characters'))
+    """
+    sign, text = _split_sign(text, negative_sign)
+    if sign is None:
+        return None, (ValueError, 'Negative sign is in wrong position')
+    num = 0
+    for letter in text:
+        index = indices.get(letter)
+        if index is None:
+            return None, (ValueError, 'Text contains invalid characters')
+        num = num * base + index + 1
+    return (num - 1 if text else 0) * sign, None
+
+
+# ======================================================================
+def _tokens2int(
+        text,
+        tokens,
+        negative_sign):
+    """
+    Convert a group of tokens to a number without raising on bad input.
+
+    This is the core of `tokens2int()` where the tokens set is assumed to
+    be already validated.
+
+    Args:
+        text (str): The input string to parse.
+        tokens (Sequence[str]): The tokens to use for the representation.
+        negative_sign (str): The symbol to use for negative numbers.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - num (int|None): The integer represented or None if invalid.
+             - error (tuple|None): The exception type and message, if any.
+
+    Examples:
+        >>> _tokens2int('potapopopotata', ('po', 'ta'), '-')
+        (161, None)
+        >>> _tokens2int('potapopopotat', ('po', 'ta'), '-')
+        (None, (<class 'ValueError'>, 'Text contains invalid tokens'))
+    """
+    sign, text = _split_sign(text, negative_sign)
+    if sign is None:
+        return None, (ValueError, 'Negative sign is in wrong position')
+    num = 0
+    base = len(tokens)
+    power = 1
+    offset = 0
+    end = len(text)
+    while end > 0:
+        for j, token in enumerate(tokens):
+            if token and text.endswith(token, 0, end):
+                end -= len(token)
+                num += (j + offset) * power
+                power *= base
+                offset = 1
+                break
+        else:
+            return None, (ValueError, 'Text contains invalid tokens')
+    return num * sign, None
+
+
+# ======================================================================
+def _decimal_digits(num):
+    """
+    Compute the decimal digits of a non-negative integer.
+
+    This also works beyond the integer string conversion length limit.
+
+    Args:
+        num (int): The input number. Must be non-negative.
+
+    Returns:
+        text (str): The decimal digits.
+
+    Examples:
+        >>> _decimal_digits(1983)
+        '1983'
+        >>> len(_decimal_digits(10 ** 12345))
+        12346
+    """
+    try:
+        return str(num)
+    except ValueError:  # exceeds the integer string conversion limit
+        size = num.bit_length() * 3 // 20  # about half the number of digits
+        high, low = divmod(num, 10 ** size)
+        return _decimal_digits(high) + _decimal_digits(low).zfill(size)
+
+
+# ======================================================================
+@functools.lru_cache(maxsize=None)
+def _roman_apostrophus_fragments(
+        place,
+        only_additive,
+        claudian):
+    """
+    Compute the Apostrophus representation of each digit at a given place.
+
+    Args:
+        place (int): The decimal place (the exponent of the power of ten).
+            Must be at least the place of the smallest Apostrophus symbol.
+        only_additive (bool): Force only-additive notation.
+        claudian (bool): Force the use of Claudian for apostrophus notation.
+
+    Returns:
+        fragments (tuple[str]): The representation of each digit (0-9).
+
+    Examples:
+        >>> _roman_apostrophus_fragments(3, False, False)[4]
+        'Ⅿↁ'
+        >>> _roman_apostrophus_fragments(5, False, True)[1]
+        'ⅭⅭↀↃↃ'
+        >>> _roman_apostrophus_fragments(4, True, False)[9]
+        'ↇↂↂↂↂ'
+    """
+    repeat = place - _ROMAN_APOSTROPHUS_MIN_PLACE
+    one = 'Ⅽ' * repeat + ('ↀ' if repeat else 'Ⅿ') + 'Ↄ' * repeat
+    five = 'Ⅾ' + 'Ↄ' * (repeat + 1)
+    if not claudian:
+        one = _multi_replace(one, _ROMAN_CLAUDIAN_TO_APOSTROPHUS)
+        five = _multi_replace(five, _ROMAN_CLAUDIAN_TO_APOSTROPHUS)
+    four = one * 4 if only_additive else one + five
+    return (
+        '', one, one * 2, one * 3, four,
+        five, five + one, five + one * 2, five + one * 3, five + four)
+
+
+# ======================================================================
+def _hashable(tokens):
+    """
+    Ensure that a tokens set can be used as a dictionary key.
+
+    Args:
+        tokens (Iterable[str]): The tokens set.
+
+    Returns:
+        tokens (str|tuple[str]): The hashable tokens set.
+
+    Examples:
+        >>> _hashable('abc')
+        'abc'
+        >>> _hashable(['a', 'b'])
+        ('a', 'b')
+    """
+    return tokens if isinstance(tokens, (str, tuple)) else tuple(tokens)
+
+
+# ======================================================================
+@functools.lru_cache(maxsize=64)
+def _pow2_codec(tokens):
+    """
+    Compute the bit-slicing codec for a tokens set, if supported.
+
+    This is only supported for tokens sets consisting of single characters
+    whose size is a power of two (up to 256, except 128).
+
+    Args:
+        tokens (str|tuple[str]): The tokens to use for the representation.
+            Must be hashable.
+
+    Returns:
+        codec (tuple|None): The codec or None if not supported.
+            Format: (bits, encode_table, decode_table, chars).
+
+    Examples:
+        >>> _pow2_codec('01234567')[0]
+        3
+        >>> _pow2_codec('abc') is None
+        True
+        >>> _pow2_codec(('po', 'ta')) is None
+        True
+    """
+    base = len(tokens)
+    bits = base.bit_length() - 1
+    if base < 2 or base & (base - 1) or bits not in _POW2_DIGITS \
+            or not all(len(token) == 1 for token in tokens) \
+            or len(set(tokens)) != base:
+        return None
+    chars = ''.join(tokens)
+    digits = _POW2_DIGITS[bits]
+    return (
+        bits, dict(zip(map(ord, digits), chars)),
+        dict(zip(map(ord, chars), digits)), frozenset(chars))
+
+
+# ======================================================================
+def _pow2_int2tokens(
+        num,
+        codec):
+    """
+    Convert a non-negative number to tokens using bit-slicing.
+
+    This is equivalent to `int2tokens()` for the supported tokens sets
+    (see `_pow2_codec()`), but the digits are computed in bulk.
+
+    Args:
+        num (int): The input number to convert. Must be non-negative.
+        codec (tuple): The codec as obtained from `_pow2_codec()`.
+
+    Returns:
+        text (str): The integer represented.
+
+    Examples:
+        >>> _pow2_int2tokens(12, _pow2_codec('!@#$'))
+        '#!'
+        >>> [_pow2_int2tokens(i, _pow2_codec('01')) for i in range(7)]
+        ['0', '1', '00', '01', '10', '11', '000']
+    """
+    bits, encode_table, _, _ = codec
+    base = 1 << bits
+    # : length of the representation and offset within the same length
+    length = tokens_length(num, base)
+    num -= first_index_of_length(length, base)
+    if bits in (1, 3, 4):
+        text = format(num, '0{}{}'.format(length, _POW2_FORMATS[bits]))
+    elif bits == 2:
+        text = format(num, '0{}x'.format((length + 1) // 2))
+        text = text.translate(_HEX_TO_QUAD)[-length:]
+    elif bits == 5:
+        size = -(-length // 8) * 5
+        text = base64.b32encode(num.to_bytes(size, 'big'))
+        text = text.decode('ascii')[-length:]
+    elif bits == 6:
+        size = -(-length // 4) * 3
+        text = base64.b64encode(num.to_bytes(size, 'big'))
+        text = text.decode('ascii')[-length:]
+    else:  # bits == 8
+        text = num.to_bytes(length, 'big').decode('latin-1')
+    return text.translate(encode_table)
+
+
+# ======================================================================
+def _pow2_tokens2int(
+        text,
+        codec,
+        negative_sign):
+    """
+    Convert tokens to a number using bit-slicing without raising.
+
+    This is equivalent to `_tokens2int()` for the supported tokens sets
+    (see `_pow2_codec()`), but the digits are parsed in bulk.
+
+    Args:
+        text (str): The input string to parse.
+        codec (tuple): The codec as obtained from `_pow2_codec()`.
+        negative_sign (str): The symbol to use for negative numbers.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - num (int|None): The integer represented or None if invalid.
+             - error (tuple|None): The exception type and message, if any.
+
+    Examples:
+        >>> _pow2_tokens2int('#!', _pow2_codec('!@#$'), '-')
+        (12, None)
+        >>> _pow2_tokens2int('-!@@', _pow2_codec('!@'), '-')
+        (-9, None)
+        >>> _pow2_tokens2int('#?', _pow2_codec('!@#$'), '-')
+        (None, (<class 'ValueError'>, 'Text contains invalid characters'))
+    """
+    sign, text = _split_sign(text, negative_sign)
+    if sign is None:
+        return None, (ValueError, 'Negative sign is in wrong position')
+    bits, _, decode_table, chars = codec
+    if not chars.issuperset(text):
+        return None, (ValueError, 'Text contains invalid characters')
+    if not text:
+        return 0, None
+    base = 1 << bits
+    length = len(text)
+    text = text.translate(decode_table)
+    if bits <= 4:
+        num = int(text, base)
+    elif bits == 5:
+        num = int.from_bytes(
+            base64.b32decode('A' * (-length % 8) + text), 'big')
+    elif bits == 6:
+        num = int.from_bytes(
+            base64.b64decode('A' * (-length % 4) + text), 'big')
+    else:  # bits == 8
+        num = int.from_bytes(text.encode('latin-1'), 'big')
+    num += first_index_of_length(length, base)
+    return num * sign, None
+
+
+# ======================================================================
+@functools.lru_cache(maxsize=64)
+def _sortable_codec(tokens):
+    """
+    Compute the codec for order-preserving representations.
+
+    Args:
+        tokens (str|tuple[str]): The tokens to use for the representation.
+            Must be hashable.
+            Must contain at least 2 tokens of the same length, in strictly
+            increasing order.
+
+    Returns:
+        codec (tuple): The codec.
+            Format: (tokens, base, size, indices, complement, block_table).
+
+    Raises:
+        ValueError: if the tokens set is not suitable.
+
+    Examples:
+        >>> codec = _sortable_codec('abc')
+        >>> codec[1:4]
+        (3, 1, {'a': 0, 'b': 1, 'c': 2})
+        >>> len(codec[5]), codec[5][:2]
+        (2187, ['aaaaaaa', 'aaaaaab'])
+        >>> _sortable_codec('acb')
+        Traceback (most recent call last):
+            ...
+        ValueError: Tokens must be of equal length and strictly increasing
+    """
+    base = len(tokens)
+    sizes = set(len(token) for token in tokens)
+    if base < 2 or len(sizes) != 1 \
+            or any(a >= b for a, b in zip(tokens[:-1], tokens[1:])):
+        raise ValueError(
+            'Tokens must be of equal length and strictly increasing')
+    tokens = tuple(tokens)
+    # : blocks of digits are computed at once (up to 4096 blocks)
+    block_size = max(_ilog(4096, base), 1)
+    block_table = [
+        ''.join(block)
+        for block in itertools.product(tokens, repeat=block_size)]
+    return (
+        tokens, base, sizes.pop(), _indices(tokens),
+        dict(zip(tokens, reversed(tokens))), block_table)
+
+
+# ======================================================================
+def _sortable_digits(
+        num,
+        width,
+        codec):
+    """
+    Convert a non-negative number to standard positional digits.
+
+    Args:
+        num (int): The input number to convert. Must be non-negative.
+        width (int): The number of digits.
+            Must be large enough to represent `num`.
+        codec (tuple): The codec as obtained from `_sortable_codec()`.
+
+    Returns:
+        text (str): The digits, padded to `width`.
+
+    Examples:
+        >>> _sortable_digits(5, 4, _sortable_codec('01'))
+        '0101'
+        >>> _sortable_digits(0, 0, _sortable_codec('01'))
+        ''
+    """
+    tokens, base, size, _, _, block_table = codec
+    block_base = len(block_table)
+    blocks = []
+    while num:
+        num, rem = divmod(num, block_base)
+        blocks.append(block_table[rem])
+    text = ''.join(reversed(blocks))
+    if len(text) > width * size:
+        return text[len(text) - width * size:]
+    return tokens[0] * (width - len(text) // size) + text
+
+
+# ======================================================================
+def _sortable_value(
+        text,
+        codec):
+    """
+    Convert standard positional digits to a number.
+
+    Args:
+        text (str): The digits.
+        codec (tuple): The codec as obtained from `_sortable_codec()`.
+
+    Returns:
+        num (int|None): The integer represented or None if invalid.
+
+    Examples:
+        >>> _sortable_value('0101', _sortable_codec('01'))
+        5
+        >>> _sortable_value('012', _sortable_codec('01')) is None
+        True
+    """
+    tokens, base, size, indices, _, _ = codec
+    num = 0
+    try:
+        for i in range(0, len(text), size):
+            num = num * base + indices[text[i:i + size]]
+    except KeyError:
+        return None
+    return num
+
+
+# ======================================================================
+def _int2sortable(
+        num,
+        codec,
+        width,
+        signed):
+    """
+    Convert a number to an order-preserving representation without raising.
+
+    This is the core of `int2sortable()`.
+
+    The representation consists of:
+     - the sign marker (only if `signed`): the first token for negative
+       numbers and the last token otherwise;
+     - the number of digits (only if `width` is None): a single token, if
+       smaller than `base - 1`, otherwise the last token followed by the
+       number of digits of the excess (written as a run of last tokens
+       followed by the remainder token) and the excess itself;
+     - the standard positional digits of the absolute value.
+    For negative numbers, all tokens after the sign marker are complemented
+    (i.e. the i-th token is replaced by the i-th token from the end).
+
+    Args:
+        num (int): The input number to convert.
+        codec (tuple): The codec as obtained from `_sortable_codec()`.
+        width (int|None): The number of digits (excluding the sign marker).
+            If None, the number of digits is encoded in a prefix.
+        signed (bool): Accept negative numbers.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - text (str|None): The representation or None if invalid.
+             - error (tuple|None): The exception type and message, if any.
+
+    Examples:
+        >>> codec = _sortable_codec('abc')
+        >>> [_int2sortable(i, codec, None, False)[0] for i in range(5)]
+        ['a', 'bb', 'bc', 'caba', 'cabb']
+        >>> [_int2sortable(i, codec, 2, True)[0] for i in range(-2, 3)]
+        ['aca', 'acb', 'caa', 'cab', 'cac']
+        >>> _int2sortable(9, codec, 2, True)
+        (None, (<class 'ValueError'>, '`9` does not fit in 2 tokens'))
+    """
+    tokens, base, size, _, complement, _ = codec
+    if num < 0 and not signed:
+        return None, (ValueError, '`{}` needs `signed` option'.format(num))
+    magnitude = abs(num)
+    length = _ilog(magnitude, base) + 1 if magnitude else 0
+    if width is None:
+        if length < base - 1:
+            text = tokens[length]
+        else:
+            excess = length - (base - 1)
+            excess_length = _ilog(excess, base) + 1 if excess else 0
+            runs, rem = divmod(excess_length, base - 1)
+            text = tokens[-1] * (runs + 1) + tokens[rem] \
+                + _sortable_digits(excess, excess_length, codec)
+        text += _sortable_digits(magnitude, length, codec)
+    elif length <= width:
+        text = _sortable_digits(magnitude, width, codec)
+    else:
+        return None, (
+            ValueError, '`{}` does not fit in {} tokens'.format(num, width))
+    if num < 0:
+        text = tokens[0] + ''.join(
+            complement[text[i:i + size]] for i in range(0, len(text), size))
+    elif signed:
+        text = tokens[-1] + text
+    return text, None
+
+
+# ======================================================================
+def _sortable2int(
+        text,
+        codec,
+        width,
+        signed):
+    """
+    Convert an order-preserving representation to a number without raising.
+
+    This is the core of `sortable2int()`.
+
+    Args:
+        text (str): The input string to parse.
+        codec (tuple): The codec as obtained from `_sortable_codec()`.
+        width (int|None): The number of digits (excluding the sign marker).
+            If None, the number of digits is encoded in a prefix.
+        signed (bool): Expect the sign marker.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - num (int|None): The integer represented or None if invalid.
+             - error (tuple|None): The exception type and message, if any.
+
+    Examples:
+        >>> codec = _sortable_codec('abc')
+        >>> [_sortable2int(s, codec, None, False)[0]
+        ...  for s in ['a', 'bb', 'bc', 'caba', 'cabb']]
+        [0, 1, 2, 3, 4]
+        >>> _sortable2int('bbb', codec, None, False)
+        (None, (<class 'ValueError'>, 'Invalid length of `bbb`'))
+        >>> _sortable2int('ba', codec, None, False)
+        (None, (<class 'ValueError'>, 'Invalid length of `ba`'))
+    """
+    tokens, base, size, indices, complement, _ = codec
+    sign = 1
+    if signed:
+        marker = text[:size]
+        text = text[size:]
+        if marker == tokens[0]:
+            sign = -1
+            try:
+                text = ''.join(
+                    complement[text[i:i + size]]
+                    for i in range(0, len(text), size))
+            except KeyError:
+                return None, (ValueError, 'Text contains invalid tokens')
+        elif marker != tokens[-1]:
+            return None, (ValueError, 'Text contains invalid tokens')
+    if width is None:
+        head = indices.get(text[:size])
+        if head is None:
+            return None, (ValueError, 'Text contains invalid tokens')
+        elif head < base - 1:
+            length = head
+            begin = size
+        else:
+            runs = 0
+            while text.startswith(tokens[-1], (runs + 1) * size):
+                runs += 1
+            begin = (runs + 2) * size
+            rem = indices.get(text[begin - size:begin])
+            if rem is None:
+                return None, (ValueError, 'Text contains invalid tokens')
+            excess_length = runs * (base - 1) + rem
+            excess = _sortable_value(
+                text[begin:begin + excess_length * size], codec)
+            if excess is None:
+                return None, (ValueError, 'Text contains invalid tokens')
+            elif excess_length and text[begin:begin + size] == tokens[0]:
+                return None, (
+                    ValueError, 'Invalid length of `{}`'.format(text))
+            length = excess + base - 1
+            begin += excess_length * size
+    else:
+        length = width
+        begin = 0
+    if len(text) != begin + length * size \
+            or width is None and text[begin:begin + size] == tokens[0]:
+        return None, (ValueError, 'Invalid length of `{}`'.format(text))
+    num = _sortable_value(text[begin:], codec)
+    if num is None:
+        return None, (ValueError, 'Text contains invalid tokens')
+    elif sign < 0 and not num:
+        return None, (ValueError, 'Text contains invalid tokens')
+    return sign * num, None
+
+
+# ======================================================================
+@functools.lru_cache(maxsize=None)
+def _roman_canonical_index():
+    """
+    Compute the index of all canonical Roman numbers.
+
+    Canonical Roman numbers are the ASCII uppercase representations of the
+    numbers from 1 to 3999 accepted by `_ROMAN_STRICT_REGEX`.
+    The index is computed on first use.
+
+    Returns:
+        index (dict[str, int]): The value of each canonical Roman number.
+
+    Examples:
+        >>> index = _roman_canonical_index()
+        >>> len(index), index['MCMXCIV'], index['MMMCMXCIX']
+        (3999, 1994, 3999)
+        >>> all(re.match(_ROMAN_STRICT_REGEX, text) for text in index)
+        True
+    """
+    units = ('', 'I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX')
+    tens = [text.translate(str.maketrans('IVX', 'XLC')) for text in units]
+    hundreds = [text.translate(str.maketrans('IVX', 'CDM')) for text in units]
+    thousands = ('', 'M', 'MM', 'MMM')
+    index = {}
+    for num in range(1, 4000):
+        index[
+            thousands[num // 1000] + hundreds[num // 100 % 10]
+            + tens[num // 10 % 10] + units[num % 10]] = num
+    return index
+
+
+# ======================================================================
+@functools.lru_cache(maxsize=None)
+def _roman_lookup_index():
+    """
+    Compute the index of the Roman numbers that can be looked up directly.
+
+    These are the canonical Roman numbers (see `_roman_canonical_index()`)
+    and the (ASCII uppercase) outputs of `int2roman()` from 1 to 3999,
+    which are not always canonical (e.g. `LXL` for 90).
+    This must not be used for strict validation.
+    The index is computed on first use.
+
+    Returns:
+        index (dict[str, int]): The value of each Roman number.
+
+    Examples:
+        >>> index = _roman_lookup_index()
+        >>> len(index), index['XC'], index['LXL'], index['MMMDCDLXLIX']
+        (4759, 90, 90, 3999)
+        >>> all(index[int2roman(i).translate(_ROMAN_DECODE_TRANSLATE)] == i
+        ...     for i in range(1, 4000))
+        True
+    """
+    no_limits = dict.fromkeys(LIMIT_NAMES)
+    index = dict(_roman_canonical_index())
+    for num in range(1, 4000):
+        index[int2roman(num, limits=no_limits).translate(
+            _ROMAN_DECODE_TRANSLATE)] = num
+    return index
+
+
+# ======================================================================
+def _vinculum_groups(
+        text,
+        marker):
+    """
+    Split a vinculum notation into groups of symbols of the same level.
+
+    Args:
+        text (str): The input string.
+        marker (str): The vinculum marker.
+
+    Returns:
+        groups (list[tuple]): The groups.
+            Format: ((<level>, <symbols>), ...).
+
+    Examples:
+        >>> _vinculum_groups('X__I_V_DI', '_')
+        [(2, 'X'), (1, 'IV'), (0, 'DI')]
+    """
+    groups = []
+    i = 0
+    while i < len(text):
+        j = i + 1
+        while j < len(text) and text[j] == marker:
+            j += 1
+        level = j - i - 1
+        if groups and groups[-1][0] == level:
+            groups[-1] = (level, groups[-1][1] + text[i])
+        else:
+            groups.append((level, text[i]))
+        i = j
+    return groups
+
+
+# ======================================================================
+def _roman2int(
+        text,
+        strict,
+        strict_regex,
+        negative_sign,
+        vinculum=None):
+    """
+    Convert a Roman number to integer without raising on bad input.
+
+    This is the core of `roman2int()`.
+
+    Args:
+        text (str): The input number to parse.
+        strict (bool): Only accept strictly formally valid Roman numbers.
+        strict_regex (str): The regular expression defining formal correctness.
+        negative_sign (str): The symbol to use for negative numbers.
+        vinculum (str|None): The vinculum marker.
+            If None, vinculum notation is not accepted.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - num (int|None): The integer represented or None if invalid.
+             - error (tuple|None): The exception type and message, if any.
+
+    Examples:
+        >>> _roman2int('I_V_D', False, _ROMAN_STRICT_REGEX, '-', '_')
+        (4500, None)
+        >>> _roman2int('MDCLXVI', False, _ROMAN_STRICT_REGEX, '-')
+        (1666, None)
+        >>> _roman2int('MDCLXVI!', False, _ROMAN_STRICT_REGEX, '-')
+        (None, (<class 'ValueError'>, 'Input contains invalid characters'))
+    """
+    text = text.strip()
+    if negative_sign and text.startswith(negative_sign):
+        sign = -1
+        start = len(negative_sign)
+    else:
+        sign = 1
+        start = 0
+    # : canonical numbers (and `int2roman()` outputs) are looked up directly
+    if not strict or strict_regex == _ROMAN_STRICT_REGEX:
+        index = _roman_canonical_index() if strict else _roman_lookup_index()
+        num = index.get(text[start:].translate(_ROMAN_DECODE_TRANSLATE))
+        if num is not None:
+            return sign * num, None
+    # : right-to-left single pass on the precomputed values
+    #   (a symbol is subtracted if any following symbol is larger)
+    num = 0
+    max_val = 0
+    count = 0
+    has_zero = has_claudian = False
+    level = 0
+    for i in range(len(text) - 1, start - 1, -1):
+        char = text[i]
+        if char == vinculum:
+            level += 1
+            continue
+        values = _ROMAN_DECODE_VALUES.get(char)
+        if values is None:
+            return None, (ValueError, 'Input contains invalid characters')
+        factor = _ROMAN_VINCULUM_FACTOR ** level if level else 1
+        level = 0
+        for val in reversed(values):
+            count += 1
+            if val is None:
+                has_claudian = True
+            elif val == 0:
+                has_zero = True
+            else:
+                val *= factor
+                if val < max_val:
+                    num -= val
+                else:
+                    num += val
+                    max_val = val
+    if level:
+        return None, (ValueError, 'Input contains invalid characters')
+    elif has_zero:
+        if count > 1:
+            return None, (
+                ValueError,
+                'Invalid: if `{}` in input, cannot contain else'.format(
+                    _ROMAN_ASCII_R[0]))
+    elif has_claudian:
+        return None, (NotImplementedError, 'Cannot parse large numbers yet!')
+    elif strict and vinculum and vinculum in text:
+        last_level = None
+        for level, group in _vinculum_groups(text[start:], vinculum):
+            group = group.translate(_ROMAN_DECODE_TRANSLATE)
+            if (last_level is not None and level >= last_level) \
+                    or not re.match(strict_regex, group):
+                return None, (
+                    ValueError, 'Formally invalid input `{}`'.format(text))
+            last_level = level
+    elif strict:
+        text = text[start:].translate(_ROMAN_DECODE_TRANSLATE)
+        if not re.match(strict_regex, text):
+            return None, (
+                ValueError, 'Formally invalid input `{}`'.format(text))
+    return sign * num, None
+
+
+# ======================================================================
+def _batch(
+        func,
+        items,
+        errors,
+        fill_value):
+    """
+    Apply a non-raising converter to a batch of items.
+
+    Args:
+        func (callable): The converter.
+            Must have the signature: func(item) -> (result, error),
+            where `error` is either None or a (exception type, message) pair.
+        items (Iterable): The input items.
+        errors (str): The policy for invalid items.
+            Accepted values are:
+             - 'raise': raise the corresponding exception at the first
+               invalid item;
+             - 'coerce': replace invalid items with `fill_value`;
+             - 'skip': drop invalid items from the results.
+        fill_value (Any): The value to use for invalid items.
+            This is only used if `errors == 'coerce'`.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - results (list): The converted items.
+             - invalid (list[int]): The indices of the invalid items.
+
+    Raises:
+        ValueError: if `errors` is not supported.
+
+    Examples:
+        >>> func = lambda x: (1 / x, None) if x else (None, (ValueError, ''))
+        >>> _batch(func, [1, 0, 2], 'coerce', -1)
+        ([1.0, -1, 0.5], [1])
+        >>> _batch(func, [1, 0, 2], 'skip', -1)
+        ([1.0, 0.5], [1])
+    """
+    if errors not in BATCH_ERRORS:
+        raise ValueError('Unknown `errors` policy `{}`'.format(errors))
+    results = []
+    invalid = []
+    for i, item in enumerate(items):
+        result, error = func(item)
+        if error is None:
+            results.append(result)
+        elif errors == 'raise':
+            raise error[0](error[1])
+        else:
+            invalid.append(i)
+            if errors == 'coerce':
+                results.append(fill_value)
+    return results, invalid
+
+
+# ======================================================================
+def _table_lookup(
+        key,
+        num):
+    """
+    Look up a number in the registered precomputed tables.
+
+    Args:
+        key (tuple): The function name followed by all its options.
+            The options must be in the same order as in the signature.
+        num (int): The input number.
+
+    Returns:
+        text (str|None): The precomputed representation, if available.
+
+    See Also:
+        numeral.tables.load_table()
+    """
+    try:
+        table = _TABLES.get(key)
+    except TypeError:  # unhashable options
+        return None
+    return table.get(num) if table is not None else None
+
+
+# ======================================================================
+def _ilog(
+        num,
+        base):
+    """
+    Compute the integer logarithm exactly.
+
+    Args:
+        num (int): The input number. Must be positive.
+        base (int): The base of the logarithm. Must be larger than 1.
+
+    Returns:
+        result (int): The largest integer `k` such that `base ** k <= num`.
+
+    Examples:
+        >>> [_ilog(x, 10) for x in (1, 9, 10, 99, 100, 10 ** 30 - 1)]
+        [0, 0, 1, 1, 2, 29]
+        >>> _ilog(2 ** 1000, 2), _ilog(2 ** 1000 - 1, 4)
+        (1000, 499)
+    """
+    if not base & (base - 1):
+        return (num.bit_length() - 1) // (base.bit_length() - 1)
+    # : estimate from the number of bits, then correct
+    result = int((num.bit_length() - 1) / math.log2(base))
+    power = base ** result
+    while power > num:
+        power //= base
+        result -= 1
+    while power * base <= num:
+        power *= base
+        result += 1
+    return result
+
+
+# ======================================================================
+def count_of_length(
+        length,
+        base):
+    """
+    Compute the number of labels with a given length.
+
+    Args:
+        length (int): The length of the labels (in number of tokens).
+        base (int): The number of tokens in the tokens set.
+
+    Returns:
+        result (int): The number of labels with the given length.
+
+    Examples:
+        >>> [count_of_length(k, 26) for k in range(4)]
+        [0, 26, 676, 17576]
+
+    See Also:
+        tokens_length(), first_index_of_length(), nth_label_of_length()
+    """
+    return base ** length if length > 0 else 0
+
+
+# ======================================================================
+def first_index_of_length(
+        length,
+        base):
+    """
+    Compute the number represented by the first label of a given length.
+
+    Args:
+        length (int): The length of the labels (in number of tokens).
+            Must be positive.
+        base (int): The number of tokens in the tokens set.
+
+    Returns:
+        result (int): The number represented by the first label.
+
+    Examples:
+        >>> [first_index_of_length(k, 26) for k in range(1, 5)]
+        [0, 26, 702, 18278]
+        >>> letter2int('aaaa')
+        18278
+
+    See Also:
+        tokens_length(), count_of_length(), nth_label_of_length()
+    """
+    if base == 1:
+        return length - 1
+    return (base ** length - base) // (base - 1)
+
+
+# ======================================================================
+def tokens_length(
+        num,
+        base):
+    """
+    Compute the length of the representation of a number.
+
+    This is the number of tokens used by `int2tokens()` (excluding the
+    negative sign), computed in closed form.
+
+    Args:
+        num (int): The input number.
+            For negative numbers, the absolute value is used.
+        base (int): The number of tokens in the tokens set.
+
+    Returns:
+        result (int): The number of tokens.
+
+    Examples:
+        >>> [tokens_length(n, 26) for n in (0, 25, 26, 701, 702, -702)]
+        [1, 1, 2, 2, 3, 3]
+        >>> d = ('mo', 'no', 'ke')
+        >>> all(tokens_length(n, 3) * 2 == len(int2tokens(n, d))
+        ...     for n in range(999))
+        True
+        >>> n = 10 ** 100
+        >>> tokens_length(n, 26) == len(int2letter(n))
+        True
+
+    See Also:
+        first_index_of_length(), count_of_length(), nth_label_of_length()
+    """
+    num = abs(num)
+    if base == 1:
+        return num + 1
+    return _ilog(num * (base - 1) + base, base)
+
+
+# ======================================================================
+def nth_label_of_length(
+        length,
+        index,
+        tokens,
+        negative_sign='-'):
+    """
+    Compute the label at a given position among those of a given length.
+
+    Args:
+        length (int): The length of the labels (in number of tokens).
+            Must be positive.
+        index (int): The position of the label within those of `length`.
+            Must be non-negative and smaller than the number of labels.
+        tokens (Iterable[str]): The tokens to use for the representation.
+            Items within the tokens set must not repeat or overlap.
+        negative_sign (str): The symbol to use for negative numbers.
+
+    Returns:
+        text (str): The label.
+
+    Raises:
+        ValueError: if `index` is out of range.
+
+    Examples:
+        >>> [nth_label_of_length(2, i, 'abc') for i in (0, 1, 8)]
+        ['aa', 'ab', 'cc']
+        >>> nth_label_of_length(2, 9, 'abc')
+        Traceback (most recent call last):
+            ...
+        ValueError: Index `9` out of range for length `2`
+
+    See Also:
+        tokens_length(), first_index_of_length(), count_of_length()
+    """
+    base = len(tokens)
+    if not 0 <= index < count_of_length(length, base):
+        raise ValueError('Index `{}` out of range for length `{}`'.format(
+            index, length))
+    return int2tokens(
+        first_index_of_length(length, base) + index, tokens, negative_sign)
+
+
+# ======================================================================
+def get_limits():
+    """
+    Get the input-size limits in effect.
+
+    These are the limits set by `use_limits()` in the current context (if
+    any), or otherwise the global limits set by `set_limits()`.
+
+    Returns:
+        limits (dict[str, int|None]): The limits.
+            Keys are the items of `LIMIT_NAMES`, None means unlimited.
+
+    Examples:
+        >>> get_limits()
+        {'max_length': None, 'max_magnitude': None, 'max_output': None}
+    """
+    return dict(zip(LIMIT_NAMES, _get_limits(None)))
+
+
+# ======================================================================
+def set_limits(
+        max_length=None,
+        max_magnitude=None,
+        max_output=None):
+    """
+    Set the global input-size limits.
+
+    The limits are meant for untrusted input: they are checked up front
+    (in constant time) and violations raise `InputLimitError` before any
+    expensive work is done.
+    The global limits apply to all threads, unless overridden in the
+    current context (e.g. thread or `asyncio` task) by `use_limits()`.
+    The conversion functions also accept per-call limits through their
+    `limits` parameter, which override the others.
+
+    Args:
+        max_length (int|None): The maximum length of the input text.
+            This applies to `letter2int()`, `tokens2int()`, `roman2int()`
+            and their batch counterparts.
+        max_magnitude (int|None): The maximum absolute value of the numbers.
+            This applies to both the input numbers (when encoding) and the
+            numbers represented (when decoding).
+            When decoding, texts longer than the representation of
+            `max_magnitude` are rejected up front (for Roman numbers, this
+            is an estimate allowing up to 5 symbols per decimal digit).
+        max_output (int|None): The maximum length of the output text.
+            This applies to `int2letter()`, `int2tokens()` and
+            `int2roman()`.
+            Numbers whose representation is certainly too long are rejected
+            up front.
+        If None, the corresponding limit is not enforced.
+
+    Returns:
+        None.
+
+    Raises:
+        ValueError: if a limit is negative.
+
+    Examples:
+        >>> set_limits(max_length=8)
+        >>> letter2int('abcdefghi')  # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+            ...
+        numeral.numeral.InputLimitError: Input length `9` exceeds `8`
+        >>> letter2int('abcdefghi', limits={'max_length': None})
+        225867353044
+        >>> set_limits()
+
+    See Also:
+        get_limits(), use_limits()
+    """
+    global _LIMITS
+    _LIMITS = _check_limits([max_length, max_magnitude, max_output])
+
+
+# ======================================================================
+@contextlib.contextmanager
+def use_limits(
+        max_length=None,
+        max_magnitude=None,
+        max_output=None):
+    """
+    Temporarily set the input-size limits in the current context.
+
+    The limits only apply to the current context (e.g. thread or `asyncio`
+    task), where they override the global limits.
+
+    Args:
+        max_length (int|None): The maximum length of the input text.
+        max_magnitude (int|None): The maximum absolute value of the numbers.
+        max_output (int|None): The maximum length of the output text.
+
+    Yields:
+        None.
+
+    Examples:
+        >>> with use_limits(max_output=10):
+        ...     int2roman(10 ** 100)  # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+            ...
+        numeral.numeral.InputLimitError: Output length exceeds \
+`max_output=10`
+        >>> get_limits()['max_output'] is None
+        True
+
+    See Also:
+        set_limits()
+    """
+    token = _CONTEXT_LIMITS.set(
+        _check_limits([max_length, max_magnitude, max_output]))
+    try:
+        yield
+    finally:
+        _CONTEXT_LIMITS.reset(token)
 
 
 # ======================================================================
 def int2letter(
         num,
         alphabet=string.ascii_lowercase,
-        negative_sign='-'):
+        negative_sign='-',
+        limits=None):
     """
     Convert a number to the least amount letters (within an alphabet).
 
@@ -138,10 +1732,15 @@ def int2letter(
         negative_sign (str): The symbol to use for negative numbers.
             The negative sign will be the first character of the
             representation.
+        limits (Mapping[str, int|None]|None): The per-call limits.
+            These override the global limits, see `set_limits()`.
 
     Returns:
         text (str): The integer represented.
 
+    Raises:
+        InputLimitError: if the limits are exceeded.
+
     Examples:
         >>> [int2letter(i) for i in range(14)]
         ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n']
@@ -153,14 +1752,20 @@ def int2letter(
     See Also:
         letter2int(), tokens2int(), int2tokens()
     """
-    return int2tokens(num, alphabet, negative_sign)
+    if _TABLES:
+        max_output = _check_encode_limits(num, limits, lambda n: 0)
+        text = _table_lookup(('int2letter', alphabet, negative_sign), num)
+        if text is not None:
+            return _check_output_length(text, max_output)
+    return int2tokens(num, alphabet, negative_sign, limits)
 
 
 # ======================================================================
 def letter2int(
         text,
         alphabet=string.ascii_lowercase,
-        negative_sign='-'):
+        negative_sign='-',
+        limits=None):
     """
     Convert a group of letters (within a given alphabet) to a number.
 
@@ -175,6 +1780,8 @@ def letter2int(
         negative_sign (str): The symbol to use for negative numbers.
             The negative sign must be the first character of the
             representation.
+        limits (Mapping[str, int|None]|None): The per-call limits.
+            These override the global limits, see `set_limits()`.
 
     Returns:
         num (int): The integer represented.
@@ -183,6 +1790,7 @@ def letter2int(
         ValueError: if text contains non-alphabet characters
         ValueError: if `negative_sign` is in `alphabet`
         ValueError: if `negative_sign` is present but not the first item
+        InputLimitError: if the limits are exceeded.
 
     Examples:
         >>> [letter2int(s)
@@ -194,30 +1802,30 @@ def letter2int(
     See Also:
         int2letter(), tokens2int(), int2tokens()
     """
-    num = 0
-    sign = 1
-    text = text.strip()
     if negative_sign in alphabet:
         raise ValueError('Alphabet and negative sign must not overlap')
-    if negative_sign in text:
-        if text[0] == negative_sign:
-            text = text[1:]
-            sign = -1
-        else:
-            raise ValueError('Negative sign is in wrong position')
-    if not set(text).issubset(set(alphabet)):
-        raise ValueError('Text contains invalid characters')
-    for i, letter in enumerate(text[::-1]):
-        offset = 0 if i == 0 else 1
-        num += (alphabet.index(letter) + offset) * len(alphabet) ** i
-    return num * sign
+    codec = _pow2_codec(_hashable(alphabet))
+    if codec:
+        func = functools.partial(
+            _pow2_tokens2int, codec=codec, negative_sign=negative_sign)
+    else:
+        func = functools.partial(
+            _letter2int, indices=_indices(alphabet), base=len(alphabet),
+            negative_sign=negative_sign)
+    num, error = _limited_decoder(
+        func, limits, lambda n: _tokens_max_length(n, alphabet),
+        len(negative_sign))(text)
+    if error:
+        raise error[0](error[1])
+    return num
 
 
 # ======================================================================
 def int2tokens(
         num,
         tokens,
-        negative_sign='-'):
+        negative_sign='-',
+        limits=None):
     """
     Convert a group of tokens (within a given set) to a number.
 
@@ -232,10 +1840,15 @@ def int2tokens(
         negative_sign (str): The symbol to use for negative numbers.
             The negative sign will be the first character of the
             representation.
+        limits (Mapping[str, int|None]|None): The per-call limits.
+            These override the global limits, see `set_limits()`.
 
     Returns:
         text (str): The integer represented.
 
+    Raises:
+        InputLimitError: if the limits are exceeded.
+
     Examples:
         >>> [int2tokens(i, ('0', '1')) for i in range(10)]
         ['0', '1', '00', '01', '10', '11', '000', '001', '010', '011']
@@ -250,27 +1863,47 @@ def int2tokens(
         >>> d = ('mo', 'no', 'ke')
         >>> all(n == tokens2int(int2tokens(n, d), d) for n in range(-999, 99))
         True
+        >>> int2tokens(  # doctest: +IGNORE_EXCEPTION_DETAIL
+        ...     10 ** 100, d, limits={'max_output': 100})
+        Traceback (most recent call last):
+            ...
+        numeral.numeral.InputLimitError: Output length exceeds \
+`max_output=100`
 
     See Also:
         letter2int(), int2letter(), tokens2int()
     """
-    text = ''
+    max_output = _check_encode_limits(
+        num, limits, lambda n: _min_tokens_length(n, len(tokens))
+        * min(len(token) for token in tokens))
     if num < 0:
         sign_text = negative_sign
         num = abs(num)
     else:
         sign_text = ''
-    while num >= 0:
-        text = tokens[num % len(tokens)] + text
-        num = num // len(tokens) - 1
-    return sign_text + text
+    codec = _pow2_codec(_hashable(tokens))
+    if codec:
+        return _check_output_length(
+            sign_text + _pow2_int2tokens(num, codec), max_output)
+    # : length of the representation and offset within the same length
+    base = len(tokens)
+    length = tokens_length(num, base)
+    num -= first_index_of_length(length, base)
+    text = [tokens[0]] * length
+    i = length
+    while num:
+        num, digit = divmod(num, base)
+        i -= 1
+        text[i] = tokens[digit]
+    return _check_output_length(sign_text + ''.join(text), max_output)
 
 
 # ======================================================================
 def tokens2int(
         text,
         tokens,
-        negative_sign='-'):
+        negative_sign='-',
+        limits=None):
     """
     Convert a number to the least amount tokens (within a tokens set).
 
@@ -285,10 +1918,15 @@ def tokens2int(
         negative_sign (str): The symbol to use for negative numbers.
             The negative sign must be the first character of the
             representation.
+        limits (Mapping[str, int|None]|None): The per-call limits.
+            These override the global limits, see `set_limits()`.
 
     Returns:
         num (int): The integer represented.
 
+    Raises:
+        InputLimitError: if the limits are exceeded.
+
     Examples:
         >>> [tokens2int(s, ('po', 'ta')) for s in ['po', 'ta', 'popo', 'pota']]
         [0, 1, 2, 3]
@@ -297,35 +1935,525 @@ def tokens2int(
         >>> d = ('mo', 'no', 'ke')
         >>> all(n == tokens2int(int2tokens(n, d), d) for n in range(-99, 999))
         True
+        >>> tokens2int(  # doctest: +IGNORE_EXCEPTION_DETAIL
+        ...     'mo' * 10 ** 6, d, limits={'max_magnitude': 10 ** 9})
+        Traceback (most recent call last):
+            ...
+        numeral.numeral.InputLimitError: Input length `2000000` exceeds `39`
 
     See Also:
         letter2int(), int2letter(), int2tokens()
     """
-    num = 0
-    sign = 1
-    text = text.strip()
     if negative_sign in tokens:
         raise ValueError('Negative sign must not be a token')
-    if negative_sign in text:
-        if text[0] == negative_sign:
-            text = text[1:]
-            sign = -1
-        else:
-            raise ValueError('Negative sign is in wrong position')
-    if not set(text).issubset(set(''.join(tokens))):
-        raise ValueError('Text contains invalid characters')
-    i = 0
-    found = True
-    while text or not found:
-        found = False
-        for j, token in enumerate(tokens):
-            if text.endswith(token):
-                text = text[:-len(token)]
-                offset = 0 if i == 0 else 1
-                num += (j + offset) * len(tokens) ** i
-                found = True
-                i += 1
-    return num * sign
+    tokens = _hashable(tokens)
+    codec = _pow2_codec(tokens)
+    if codec:
+        func = functools.partial(
+            _pow2_tokens2int, codec=codec, negative_sign=negative_sign)
+    else:
+        func = functools.partial(
+            _tokens2int, tokens=tokens, negative_sign=negative_sign)
+    num, error = _limited_decoder(
+        func, limits, lambda n: _tokens_max_length(n, tokens),
+        len(negative_sign))(text)
+    if error:
+        raise error[0](error[1])
+    return num
+
+
+# ======================================================================
+def letter2int_batch(
+        texts,
+        alphabet=string.ascii_lowercase,
+        negative_sign='-',
+        errors='raise',
+        fill_value=None,
+        limits=None):
+    """
+    Convert multiple groups of letters (within a given alphabet) to numbers.
+
+    This is equivalent to calling `letter2int()` on each item, except that
+    the alphabet is validated only once and invalid items are handled
+    according to the `errors` policy without raising exceptions.
+
+    Args:
+        texts (Iterable[str]): The input strings to parse.
+        alphabet (str): The alphabet to use for the representation.
+            Characters within the alphabet must not repeat.
+        negative_sign (str): The symbol to use for negative numbers.
+            The negative sign must be the first character of the
+            representation.
+        errors (str): The policy for invalid items.
+            Accepted values are:
+             - 'raise': raise the corresponding exception at the first
+               invalid item;
+             - 'coerce': replace invalid items with `fill_value`;
+             - 'skip': drop invalid items from the results.
+        fill_value (Any): The value to use for invalid items.
+            This is only used if `errors == 'coerce'`.
+        limits (Mapping[str, int|None]|None): The per-call limits.
+            These override the global limits, see `set_limits()`.
+            Items exceeding the limits are invalid.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - nums (list): The integers represented.
+             - invalid (list[int]): The indices of the invalid items.
+
+    Raises:
+        ValueError: if `negative_sign` is in `alphabet`
+        ValueError: if `errors` is not supported
+
+    Examples:
+        >>> letter2int_batch(['a', 'bxh', '-aa'])
+        ([0, 1983, -26], [])
+        >>> letter2int_batch(['a', 'b!', 'c', 'd-'], errors='coerce')
+        ([0, None, 2, None], [1, 3])
+        >>> letter2int_batch(['a', 'b!', 'c', 'd-'], errors='skip')
+        ([0, 2], [1, 3])
+        >>> letter2int_batch(['a', 'b!', 'c'])
+        Traceback (most recent call last):
+            ...
+        ValueError: Text contains invalid characters
+        >>> letter2int_batch(['zz', 'aaa', 'z' * 10 ** 6], errors='coerce',
+        ...     limits={'max_magnitude': 701})
+        ([701, None, None], [1, 2])
+
+    See Also:
+        letter2int(), tokens2int_batch(), roman2int_batch()
+    """
+    if negative_sign in alphabet:
+        raise ValueError('Alphabet and negative sign must not overlap')
+    codec = _pow2_codec(_hashable(alphabet))
+    if codec:
+        func = functools.partial(
+            _pow2_tokens2int, codec=codec, negative_sign=negative_sign)
+    else:
+        func = functools.partial(
+            _letter2int, indices=_indices(alphabet), base=len(alphabet),
+            negative_sign=negative_sign)
+    return _batch(
+        _limited_decoder(
+            func, limits, lambda n: _tokens_max_length(n, alphabet),
+            len(negative_sign)),
+        texts, errors, fill_value)
+
+
+# ======================================================================
+def tokens2int_batch(
+        texts,
+        tokens,
+        negative_sign='-',
+        errors='raise',
+        fill_value=None,
+        limits=None):
+    """
+    Convert multiple groups of tokens (within a given set) to numbers.
+
+    This is equivalent to calling `tokens2int()` on each item, except that
+    the tokens set is validated only once and invalid items are handled
+    according to the `errors` policy without raising exceptions.
+
+    Args:
+        texts (Iterable[str]): The input strings to parse.
+        tokens (Iterable[str]): The tokens to use for the representation.
+            Items within the tokens set must not repeat or overlap.
+        negative_sign (str): The symbol to use for negative numbers.
+            The negative sign must be the first character of the
+            representation.
+        errors (str): The policy for invalid items.
+            See `letter2int_batch()` for more details.
+        fill_value (Any): The value to use for invalid items.
+            This is only used if `errors == 'coerce'`.
+        limits (Mapping[str, int|None]|None): The per-call limits.
+            These override the global limits, see `set_limits()`.
+            Items exceeding the limits are invalid.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - nums (list): The integers represented.
+             - invalid (list[int]): The indices of the invalid items.
+
+    Raises:
+        ValueError: if `negative_sign` is in `tokens`
+        ValueError: if `errors` is not supported
+
+    Examples:
+        >>> tokens2int_batch(['pota', 'pox', 'tata'], ('po', 'ta'),
+        ...     errors='coerce', fill_value=-1)
+        ([3, -1, 5], [1])
+
+    See Also:
+        tokens2int(), letter2int_batch(), roman2int_batch()
+    """
+    tokens = _hashable(tokens)
+    if negative_sign in tokens:
+        raise ValueError('Negative sign must not be a token')
+    codec = _pow2_codec(tokens)
+    if codec:
+        func = functools.partial(
+            _pow2_tokens2int, codec=codec, negative_sign=negative_sign)
+    else:
+        func = functools.partial(
+            _tokens2int, tokens=tokens, negative_sign=negative_sign)
+    return _batch(
+        _limited_decoder(
+            func, limits, lambda n: _tokens_max_length(n, tokens),
+            len(negative_sign)),
+        texts, errors, fill_value)
+
+
+# ======================================================================
+def int2sortable(
+        num,
+        tokens=string.ascii_lowercase,
+        width=None,
+        signed=True):
+    """
+    Convert a number to an order-preserving representation.
+
+    Unlike `int2tokens()`, whose output sorts in shortlex order, the output
+    sorts lexicographically (hence, byte-wise, if UTF-8 encoded) in the
+    same order as the numbers, including negative numbers.
+    This is useful for keys in sorted stores, since range queries can be
+    performed directly on the representations.
+
+    The representation uses standard positional notation (not bijective)
+    either with a fixed number of digits (if `width` is specified) or with
+    a self-delimiting prefix encoding the number of digits.
+    If `signed`, a sign marker token is prepended and the representation
+    of negative numbers is complemented.
+    See `_int2sortable()` for the details.
+
+    With fixed width, the i-th token depends only on the i-th digit, so
+    that the representations can be computed column-wise.
+
+    Args:
+        num (int): The input number to convert.
+        tokens (Sequence[str]): The tokens to use for the representation.
+            Must contain at least 2 tokens of the same length, in strictly
+            increasing order.
+        width (int|None): The number of digits (excluding the sign marker).
+            If None, the number of digits is encoded in a prefix.
+        signed (bool): Accept negative numbers.
+
+    Returns:
+        text (str): The integer represented.
+
+    Raises:
+        ValueError: if `tokens` is not suitable.
+        ValueError: if `num` is negative and `signed` is False.
+        ValueError: if `num` does not fit in `width` digits.
+
+    Examples:
+        >>> [int2sortable(i) for i in (-1000, -27, -1, 0, 1, 26, 1000)]
+        ['awynn', 'axyy', 'ayy', 'za', 'zbb', 'zcba', 'zdbmm']
+        >>> [int2sortable(i, '0123456789', 4) for i in (-12, 7, 123)]
+        ['09987', '90007', '90123']
+        >>> int2sortable(123, '0123456789', 4, False)
+        '0123'
+        >>> nums = list(range(-3000, 3000, 7)) + [10 ** 40, -(10 ** 40)]
+        >>> sorted(nums) == sorted(nums, key=int2sortable)
+        True
+
+    See Also:
+        sortable2int(), int2sortable_batch()
+    """
+    text, error = _int2sortable(
+        num, _sortable_codec(_hashable(tokens)), width, signed)
+    if error:
+        raise error[0](error[1])
+    return text
+
+
+# ======================================================================
+def sortable2int(
+        text,
+        tokens=string.ascii_lowercase,
+        width=None,
+        signed=True):
+    """
+    Convert an order-preserving representation to a number.
+
+    Args:
+        text (str): The input string to parse.
+        tokens (Sequence[str]): The tokens to use for the representation.
+            Must contain at least 2 tokens of the same length, in strictly
+            increasing order.
+        width (int|None): The number of digits (excluding the sign marker).
+            If None, the number of digits is encoded in a prefix.
+        signed (bool): Expect the sign marker.
+
+    Returns:
+        num (int): The integer represented.
+
+    Raises:
+        ValueError: if `tokens` is not suitable.
+        ValueError: if `text` is not a valid representation.
+
+    Examples:
+        >>> [sortable2int(s) for s in ('awynn', 'za', 'zdbmm')]
+        [-1000, 0, 1000]
+        >>> sortable2int('09987', '0123456789', 4)
+        -12
+        >>> all(i == sortable2int(int2sortable(i, ('po', 'ta')), ('po', 'ta'))
+        ...     for i in range(-1000, 1000))
+        True
+
+    See Also:
+        int2sortable(), sortable2int_batch()
+    """
+    num, error = _sortable2int(
+        text, _sortable_codec(_hashable(tokens)), width, signed)
+    if error:
+        raise error[0](error[1])
+    return num
+
+
+# ======================================================================
+def int2sortable_batch(
+        nums,
+        tokens=string.ascii_lowercase,
+        width=None,
+        signed=True,
+        errors='raise',
+        fill_value=None):
+    """
+    Convert multiple numbers to order-preserving representations.
+
+    This is equivalent to calling `int2sortable()` on each item, except that
+    the tokens set is validated only once and invalid items are handled
+    according to the `errors` policy without raising exceptions.
+
+    Args:
+        nums (Iterable[int]): The input numbers to convert.
+        tokens (Sequence[str]): The tokens to use for the representation.
+            See `int2sortable()` for more details.
+        width (int|None): The number of digits (excluding the sign marker).
+            If None, the number of digits is encoded in a prefix.
+        signed (bool): Accept negative numbers.
+        errors (str): The policy for invalid items.
+            See `letter2int_batch()` for more details.
+        fill_value (Any): The value to use for invalid items.
+            This is only used if `errors == 'coerce'`.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - texts (list): The representations.
+             - invalid (list[int]): The indices of the invalid items.
+
+    Examples:
+        >>> int2sortable_batch([5, 100, -5], '0123456789', 2, errors='skip')
+        (['905', '094'], [1])
+
+    See Also:
+        int2sortable(), sortable2int_batch()
+    """
+    codec = _sortable_codec(_hashable(tokens))
+    return _batch(
+        lambda num: _int2sortable(num, codec, width, signed),
+        nums, errors, fill_value)
+
+
+# ======================================================================
+def sortable2int_batch(
+        texts,
+        tokens=string.ascii_lowercase,
+        width=None,
+        signed=True,
+        errors='raise',
+        fill_value=None):
+    """
+    Convert multiple order-preserving representations to numbers.
+
+    Args:
+        texts (Iterable[str]): The input strings to parse.
+        tokens (Sequence[str]): The tokens to use for the representation.
+            See `int2sortable()` for more details.
+        width (int|None): The number of digits (excluding the sign marker).
+            If None, the number of digits is encoded in a prefix.
+        signed (bool): Expect the sign marker.
+        errors (str): The policy for invalid items.
+            See `letter2int_batch()` for more details.
+        fill_value (Any): The value to use for invalid items.
+            This is only used if `errors == 'coerce'`.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - nums (list): The integers represented.
+             - invalid (list[int]): The indices of the invalid items.
+
+    Examples:
+        >>> sortable2int_batch(['zbb', 'zb', 'ayy'], errors='coerce')
+        ([1, None, -1], [1])
+
+    See Also:
+        sortable2int(), int2sortable_batch()
+    """
+    codec = _sortable_codec(_hashable(tokens))
+    return _batch(
+        lambda text: _sortable2int(text, codec, width, signed),
+        texts, errors, fill_value)
+
+
+# ======================================================================
+class TokensDecoder(object):
+    """
+    Incremental decoder for groups of tokens (within a given set).
+
+    The input can be fed in chunks of arbitrary size (e.g. as received from
+    the network), and is parsed left-to-right, carrying partial tokens
+    across chunk boundaries.
+    Only the integer being computed and the last partial token are kept in
+    memory.
+
+    The result is the same as `tokens2int()` on the whole input.
+
+    Args:
+        tokens (Iterable[str]): The tokens to use for the representation.
+            Items within the tokens set must not repeat, and no token can be
+            the beginning of another token (i.e. the set must be prefix-free).
+        negative_sign (str): The symbol to use for negative numbers.
+            The negative sign must be the first character of the
+            representation.
+
+    Raises:
+        ValueError: if `negative_sign` is in `tokens`
+        ValueError: if `tokens` is not prefix-free
+
+    Examples:
+        >>> decoder = TokensDecoder(('po', 'ta'))
+        >>> for chunk in ['p', 'otap', 'opo', 'po', 'ta', 'ta']:
+        ...     decoder.feed(chunk)
+        >>> decoder.finish()
+        161
+        >>> decoder.feed('pox')
+        Traceback (most recent call last):
+            ...
+        ValueError: Text contains invalid tokens
+        >>> decoder.reset()
+        >>> decoder.feed('tap')
+        >>> decoder.finish()
+        Traceback (most recent call last):
+            ...
+        ValueError: Text contains invalid tokens
+        >>> decoder = TokensDecoder(('mo', 'no', 'ke'))
+        >>> decoder.feed(' -mo')
+        >>> decoder.feed('no ')
+        >>> decoder.finish() == tokens2int(' -mono ', ('mo', 'no', 'ke'))
+        True
+        >>> decoder.feed('mo-')
+        Traceback (most recent call last):
+            ...
+        ValueError: Negative sign is in wrong position
+    """
+
+    def __init__(
+            self,
+            tokens,
+            negative_sign='-'):
+        tokens = _hashable(tokens)
+        if negative_sign in tokens:
+            raise ValueError('Negative sign must not be a token')
+        self.tokens = tokens
+        self.negative_sign = negative_sign
+        self._indices = _indices(tokens)
+        self._lengths = sorted(set(len(token) for token in tokens if token))
+        self._prefixes = set(
+            token[:i] for token in tokens for i in range(1, len(token)))
+        if any(token in self._prefixes for token in tokens):
+            raise ValueError('Tokens must be prefix-free')
+        self.reset()
+
+    # --------------------------------
+    def reset(self):
+        """Discard any input fed so far."""
+        self._num = 0
+        self._count = 0
+        self._sign = None
+        self._buffer = ''
+        self._ended = False
+
+    # --------------------------------
+    def feed(self, chunk):
+        """
+        Parse the next chunk of the input.
+
+        Args:
+            chunk (str): The next chunk of the input.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: if the input is not valid.
+        """
+        text = self._buffer + chunk
+        size = len(text)
+        pos = 0
+        if self._sign is None:
+            while pos < size and text[pos].isspace():
+                pos += 1
+            if text.startswith(self.negative_sign, pos):
+                self._sign = -1
+                pos += len(self.negative_sign)
+            elif self.negative_sign.startswith(text[pos:]):
+                self._buffer = text[pos:]
+                return
+            else:
+                self._sign = 1
+        base = len(self.tokens)
+        num = 0
+        count = 0
+        self._buffer = ''
+        while pos < size:
+            if self._ended:
+                if not text[pos].isspace():
+                    raise ValueError('Text contains invalid tokens')
+                pos += 1
+                continue
+            for length in self._lengths:
+                index = self._indices.get(text[pos:pos + length])
+                if index is not None:
+                    num = num * base + index + 1
+                    count += 1
+                    pos += length
+                    break
+            else:
+                if text[pos:] in self._prefixes:
+                    self._buffer = text[pos:]
+                    break
+                elif text[pos].isspace():
+                    self._ended = True
+                elif text.startswith(self.negative_sign, pos):
+                    raise ValueError('Negative sign is in wrong position')
+                else:
+                    raise ValueError('Text contains invalid tokens')
+        self._num = self._num * base ** count + num
+        self._count += count
+
+    # --------------------------------
+    def finish(self):
+        """
+        Complete the parsing and reset the decoder.
+
+        Returns:
+            num (int): The integer represented.
+
+        Raises:
+            ValueError: if the input ends with an incomplete token.
+        """
+        is_valid = not self._buffer
+        num = (self._num - 1 if self._count else 0) * (self._sign or 1)
+        self.reset()
+        if not is_valid:
+            raise ValueError('Text contains invalid tokens')
+        return num
 
 
 # ======================================================================
@@ -338,7 +2466,9 @@ def int2roman(
         claudian=False,
         alternatives=None,
         signed=True,
-        negative_sign=_ROMAN_MINUS):
+        negative_sign=_ROMAN_MINUS,
+        vinculum=None,
+        limits=None):
     """
     Convert an integer to its corresponding Roman number representation.
 
@@ -369,12 +2499,24 @@ def int2roman(
         negative_sign (str): The symbol to use for negative numbers.
             The negative sign will be the first character of the
             representation.
+        vinculum (bool|str|None): Use vinculum notation for large numbers.
+            If True, the combining overline character is used as marker,
+            otherwise the (single character) marker must be specified.
+            Each symbol followed by `k` markers is multiplied by `1000 ** k`.
+            This replaces the Apostrophus notation for large numbers, and
+            large numbers are supported regardless of `extended`.
+            The number of symbols grows linearly with the number of digits.
+        limits (Mapping[str, int|None]|None): The per-call limits.
+            These override the global limits, see `set_limits()`.
 
     Returns:
         text (str): The converted Roman number.
             By default the dedicated uppercase Unicode characters are used.
             This can be tweaked through the appropriate options.
 
+    Raises:
+        InputLimitError: if the limits are exceeded.
+
     Examples:
         >>> [int2roman(i) for i in range(13)]
         ['N', 'Ⅰ', 'Ⅱ', 'Ⅲ', 'Ⅳ', 'Ⅴ', 'Ⅵ', 'Ⅶ', 'Ⅷ', 'Ⅸ', 'Ⅹ', 'Ⅺ', 'Ⅻ']
@@ -390,6 +2532,9 @@ def int2roman(
         ['Ⅿↁ', 'ↁ', 'ↂ', 'ↂↇ', 'ↇ', 'ↈ', 'ↈↇↃ', 'ↇↃ', 'ⅭↈↃ']
         >>> [int2roman(2 ** i) for i in range(14, 17)]
         ['ↂↁⅯⅭⅭⅭⅬⅩⅩⅩⅣ', 'ↂↂↂⅯⅯⅮⅭⅭⅬⅩⅧ', 'ↇↂↁⅮⅩⅩⅩⅥ']
+        >>> int2roman(10 ** 16 - 1) == (
+        ...     int2roman(9 * 10 ** 15) + int2roman(10 ** 15 - 1))
+        True
         >>> [int2roman(i, only_ascii=True) for i in [1666, 3999, 4000, 189000]]
         ['MDCLXVI', 'MMMDCDLXLIX', 'MDO', 'CCCDOODOOCCDOCCDOCCDODOMDO']
         >>> [int2roman(i, only_additive=True) for i in [4, 49, 949, 9494]]
@@ -409,7 +2554,21 @@ def int2roman(
         Traceback (most recent call last):
             ...
         ValueError: `-1666` needs `signed` option
+        >>> [int2roman(i, only_ascii=True, vinculum='_')
+        ...  for i in [3999, 4000, 189000, -4500, 10 ** 7 + 1]]
+        ['MMMDCDLXLIX', 'I_V_', 'C_L_X_X_X_I_X_', '-I_V_D', 'X__I']
+        >>> int2roman(4000, vinculum=True) == 'Ⅳ\u0305'
+        True
     """
+    # : each group of three digits (except the last) takes at least a symbol
+    max_output = _check_encode_limits(
+        num, limits, lambda n: _min_tokens_length(n, 10) // 3 - 1)
+    if _TABLES:
+        text = _table_lookup(
+            ('int2roman', only_ascii, only_additive, extended, uppercase,
+             claudian, alternatives, signed, negative_sign, vinculum), num)
+        if text is not None:
+            return _check_output_length(text, max_output)
     text = ''
     # update max_consecutive
     max_consecutive = _ROMAN_MAX_CONSECUTIVE[only_additive]
@@ -420,6 +2579,26 @@ def int2roman(
             num = abs(num)
         else:
             raise ValueError('`{}` needs `signed` option'.format(num))
+    # handles large numbers with vinculum notation
+    max_standard = max(_ROMAN_UNICODE_R.keys())
+    if vinculum and num >= max_standard * (max_consecutive + 1):
+        marker = _ROMAN_VINCULUM if vinculum is True else vinculum
+        groups = []
+        while num >= max_standard * (max_consecutive + 1):
+            num, group = divmod(num, _ROMAN_VINCULUM_FACTOR)
+            groups.append(group)
+        groups.append(num)
+        for level, group in reversed(list(enumerate(groups))):
+            if group:
+                group_text = int2roman(
+                    group, only_ascii=only_ascii, only_additive=only_additive,
+                    extended=False, uppercase=uppercase,
+                    alternatives=alternatives, signed=False, limits=limits)
+                if level:
+                    group_text = ''.join(
+                        char + marker * level for char in group_text)
+                text = _check_output_length(text + group_text, max_output)
+        return text
     # handles the zero
     if num == 0:
         if extended:
@@ -427,47 +2606,39 @@ def int2roman(
         else:
             raise ValueError('`{}` needs `extended` option'.format(num))
     else:  # handles positive integers
+        if num >= max_standard * (max_consecutive + 1):
+            if not extended:
+                raise ValueError('`{}` needs `extended` option'.format(num))
+            # : exact digit-by-digit Apostrophus for the thousands and above
+            num, rest = divmod(num, max_standard)
+            digits = _decimal_digits(num)
+            place = len(digits) + _ROMAN_APOSTROPHUS_MIN_PLACE - 1
+            for i, digit in enumerate(digits):
+                text = _check_output_length(
+                    text + _roman_apostrophus_fragments(
+                        place - i, only_additive, claudian)[int(digit)],
+                    max_output)
+            num = rest
         last_key, prev_key = None, None
         consecutive = 0
-        max_standard = max(_ROMAN_UNICODE_R.keys())
         compound_over10 = (11, 12)
         while num > 0:
-            if num < max_standard * (max_consecutive + 1):
-                for val, key in _ROMAN_UNICODE_R.items():
-                    if val and num - val >= 0 and val not in compound_over10:
-                        if key == last_key:
-                            consecutive += 1
-                        else:
-                            consecutive = 0
-                        if 0 <= consecutive < max_consecutive:
-                            text += key
-                            num -= val
-                            last_key = key
-                            break
-                        else:
-                            text = text[:-max_consecutive + 1] + prev_key
-                            num -= val
-                            break
-                    prev_key = key if val not in compound_over10 else prev_key
-            elif extended:
-                # max_apostrophus = max(_ROMAN_APOSTROPHUS.values())
-                min_apostrophus = min(_ROMAN_APOSTROPHUS.values())
-                log_m = math.log10(min_apostrophus)
-                log_num = math.log10(num)
-                is_half = num >= 5 * 10 ** int(log_num)
-                repeat = int(log_num) - int(log_m) + (1 if is_half else 0)
-                num_to_add = (5 if is_half else 1) * 10 ** int(log_num)
-                correction = -2 * num_to_add \
-                    if num >= num_to_add * (max_consecutive + 1) else 0
-                char_to_append = ('Ⅾ' if is_half else (
-                    'Ⅽ' * repeat + ('ↀ' if repeat else 'Ⅿ'))) + 'Ↄ' * repeat
-                if not claudian:
-                    char_to_append = _multi_replace(
-                        char_to_append, _ROMAN_CLAUDIAN_TO_APOSTROPHUS)
-                text += char_to_append
-                num -= num_to_add + correction
-            else:
-                raise ValueError('`{}` needs `extended` option'.format(num))
+            for val, key in _ROMAN_UNICODE_R.items():
+                if val and num - val >= 0 and val not in compound_over10:
+                    if key == last_key:
+                        consecutive += 1
+                    else:
+                        consecutive = 0
+                    if 0 <= consecutive < max_consecutive:
+                        text += key
+                        num -= val
+                        last_key = key
+                        break
+                    else:
+                        text = text[:-max_consecutive + 1] + prev_key
+                        num -= val
+                        break
+                prev_key = key if val not in compound_over10 else prev_key
     # ensure use of compact chars for 11 and 12
     text = _multi_replace(text, (('ⅩⅠ', 'Ⅺ'), ('ⅩⅡ', 'Ⅻ')))
     if only_additive:
@@ -480,7 +2651,7 @@ def int2roman(
         text = _multi_replace(text, _ROMAN_CLAUDIAN_TO_APOSTROPHUS_R).lower()
     else:  # should not be necessary
         text = text.upper()
-    return text
+    return _check_output_length(text, max_output)
 
 
 # ======================================================================
@@ -488,7 +2659,9 @@ def roman2int(
         text,
         strict=False,
         strict_regex=_ROMAN_STRICT_REGEX,
-        negative_sign=_ROMAN_MINUS):
+        negative_sign=_ROMAN_MINUS,
+        vinculum=None,
+        limits=None):
     """
     Convert a string representation of a Roman number to integer.
 
@@ -510,14 +2683,34 @@ def roman2int(
         negative_sign (str): The symbol to use for negative numbers.
             The negative sign must be the first character of the
             representation.
+        vinculum (bool|str|None): Accept vinculum notation for large numbers.
+            If True, the combining overline character is used as marker,
+            otherwise the (single character) marker must be specified.
+            Each symbol followed by `k` markers is multiplied by `1000 ** k`.
+            If `strict` is True, each group of symbols with the same number
+            of markers must be formally valid and the groups must be sorted
+            by decreasing number of markers.
+        limits (Mapping[str, int|None]|None): The per-call limits.
+            These override the global limits, see `set_limits()`.
+            The magnitude is checked on the result, since the parsing
+            time is bounded by the input length.
 
     Returns:
         num (int): The integer represented.
 
+    Raises:
+        InputLimitError: if the limits are exceeded.
+
     Notes:
         - Large numbers using the apostrophus notation cannot be parsed yet,
           but if no apostrophus notation is used (and strict parsing is not
           set) the parsing works.
+        - Canonical Roman numbers (from 1 to 3999, in any supported
+          character set) are looked up in a precomputed index, unless a
+          custom `strict_regex` is used in strict mode.
+        - Otherwise, the input is decoded in a single pass using precomputed
+          character-to-values tables, which cover ASCII and Unicode
+          symbols (in both cases) as well as `ROMAN_ALTERNATIVES`.
 
     Examples:
         >>> [roman2int(s) for s in ['MDCLXVI', 'iv', 'Ⅵ', 'IC', 'IIM', 'VL']]
@@ -535,6 +2728,8 @@ def roman2int(
         Invalid: 3
         >>> roman2int('MMMMMM')
         6000
+        >>> [roman2int(s) for s in ['ⅿⅾⅽⅼⅹⅵ', 'mdclxvi', 'ⅯⅮⅭⅬⅩⅥ', 'ↀↆↅ']]
+        [1666, 1666, 1666, 1056]
         >>> roman2int('MMMMMM', strict=True)
         Traceback (most recent call last):
             ...
@@ -549,39 +2744,105 @@ def roman2int(
         Traceback (most recent call last):
             ...
         NotImplementedError: Cannot parse large numbers yet!
+        >>> [roman2int(s, vinculum='_') for s in ['I_V_', 'X__I', '-I_V_D']]
+        [4000, 10000001, -4500]
+        >>> roman2int('I_V_X__', strict=True, vinculum='_')
+        Traceback (most recent call last):
+            ...
+        ValueError: Formally invalid input `I_V_X__`
+        >>> all(i == roman2int(int2roman(i, vinculum=True), vinculum=True)
+        ...     for i in range(1, 10 ** 7, 9973))
+        True
+        >>> roman2int('M' * 100, limits={'max_length': 15})  # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+            ...
+        numeral.numeral.InputLimitError: Input length `100` exceeds `15`
+        >>> roman2int(  # doctest: +IGNORE_EXCEPTION_DETAIL
+        ...     'M' * 10 ** 7, limits={'max_magnitude': 100})
+        Traceback (most recent call last):
+            ...
+        numeral.numeral.InputLimitError: Input length `10000000` exceeds `16`
     """
-    text = text.strip().upper()
-    if negative_sign in text and text[0] == negative_sign:
-        sign = -1
-        text = text[1:]
-    else:
-        sign = 1
-    text = _multi_replace(text, _ROMAN_UNICODE_TO_ASCII)
-    text = _multi_replace(text, tuple([(i, j) for j, i in ROMAN_ALTERNATIVES]))
-    valid_chars = set(''.join([a for u, a in _ROMAN_UNICODE_TO_ASCII]))
-    if set(text).issubset(valid_chars):
-        num = 0
-        if text != _ROMAN_ASCII_R[0]:
-            is_valid = re.match(strict_regex, text)
-            if _ROMAN_ASCII_R[0] in text:
-                raise ValueError(
-                    'Invalid: if `{}` in input, cannot contain else'.format(
-                        _ROMAN_ASCII_R[0]))
-            elif _ROMAN_CLAUDIAN_TO_ASCII in text:
-                raise NotImplementedError('Cannot parse large numbers yet!')
-            elif not strict or is_valid:
-                for i, char in enumerate(text):
-                    if i + 1 < len(text) and any(
-                            [_ROMAN_ASCII[tmp_char] > _ROMAN_ASCII[char]
-                             for tmp_char in text[i + 1:]]):
-                        num -= _ROMAN_ASCII[char]
-                    else:
-                        num += _ROMAN_ASCII[char]
-            else:
-                raise ValueError('Formally invalid input `{}`'.format(text))
-    else:
-        raise ValueError('Input contains invalid characters')
-    return sign * num
+    if vinculum is True:
+        vinculum = _ROMAN_VINCULUM
+    num, error = _limited_decoder(
+        lambda text: _roman2int(
+            text, strict, strict_regex, negative_sign, vinculum),
+        limits, lambda n: _roman_max_length(n, vinculum),
+        len(negative_sign or ''))(text)
+    if error:
+        raise error[0](error[1])
+    return num
+
+
+# ======================================================================
+def roman2int_batch(
+        texts,
+        strict=False,
+        strict_regex=_ROMAN_STRICT_REGEX,
+        negative_sign=_ROMAN_MINUS,
+        vinculum=None,
+        errors='raise',
+        fill_value=None,
+        limits=None):
+    """
+    Convert multiple string representations of Roman numbers to integers.
+
+    This is equivalent to calling `roman2int()` on each item, except that
+    invalid items are handled according to the `errors` policy without
+    raising exceptions.
+
+    Args:
+        texts (Iterable[str]): The input numbers to parse.
+        strict (bool): Only accept strictly formally valid Roman numbers.
+            See `roman2int()` for more details.
+        strict_regex (str): The regular expression defining formal correctness.
+            If `strict` is False, this parameter is ignored.
+        negative_sign (str): The symbol to use for negative numbers.
+            The negative sign must be the first character of the
+            representation.
+        vinculum (bool|str|None): Accept vinculum notation for large numbers.
+            See `roman2int()` for more details.
+        errors (str): The policy for invalid items.
+            See `letter2int_batch()` for more details.
+        fill_value (Any): The value to use for invalid items.
+            This is only used if `errors == 'coerce'`.
+        limits (Mapping[str, int|None]|None): The per-call limits.
+            These override the global limits, see `set_limits()`.
+            Items exceeding the limits are invalid.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - nums (list): The integers represented.
+             - invalid (list[int]): The indices of the invalid items.
+
+    Raises:
+        ValueError: if `errors` is not supported
+
+    Examples:
+        >>> roman2int_batch(['MDCLXVI', 'IIM', 'MDO', 'Ⅻ'], errors='coerce')
+        ([1666, 998, None, 12], [2])
+        >>> roman2int_batch(['MDCLXVI', 'IIM', 'MDO', 'Ⅻ'], True,
+        ...     errors='skip')
+        ([1666, 12], [1, 2])
+        >>> roman2int_batch(['MDCLXVI', 'MDO'])
+        Traceback (most recent call last):
+            ...
+        NotImplementedError: Cannot parse large numbers yet!
+
+    See Also:
+        roman2int(), letter2int_batch(), tokens2int_batch()
+    """
+    if vinculum is True:
+        vinculum = _ROMAN_VINCULUM
+    return _batch(
+        _limited_decoder(
+            lambda text: _roman2int(
+                text, strict, strict_regex, negative_sign, vinculum),
+            limits, lambda n: _roman_max_length(n, vinculum),
+            len(negative_sign or '')),
+        texts, errors, fill_value)
 
 
 # ======================================================================
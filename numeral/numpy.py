@@ -0,0 +1,585 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Numeral: NumPy vectorized conversions.
+
+The conversions operate on whole fixed-width string arrays (`numpy.str_`
+or `numpy.bytes_`) at once, e.g. as loaded from columnar files.
+
+This module requires `numpy`, which is otherwise not needed by `numeral`.
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals)
+
+# ======================================================================
+# :: Python Standard Library Imports
+import string  # Common string operations
+import functools  # Higher-order functions and operations on callable objects
+import doctest  # Test interactive Python examples
+
+# ======================================================================
+# :: External Imports
+import numpy as np  # Fundamental package for scientific computing
+
+# ======================================================================
+# :: Internal Imports
+from numeral.numeral import (
+    _ROMAN_DECODE_VALUES, _ROMAN_ASCII, _ROMAN_ASCII_R, _ROMAN_MINUS)
+from numeral.numeral import _get_limits, _roman_max_length
+from numeral.cells import MAX_COLUMN, MAX_ROW
+from numeral.cells import _column_tables
+
+# ======================================================================
+# :: character kinds of the decoding tables
+_KIND_INVALID = 0
+_KIND_SYMBOL = 1
+_KIND_BLANK = 2
+_KIND_ZERO = 3
+_KIND_SIGN = 4
+
+# :: character classes of the cell reference scanner
+_CELL_BLANK = 0
+_CELL_DOLLAR = 1
+_CELL_LETTER = 2
+_CELL_ZERO = 3
+_CELL_DIGIT = 4
+_CELL_INVALID = 5
+
+# :: maximum number of letters and digits fitting in int64
+_CELL_MAX_LETTERS = 13
+_CELL_MAX_DIGITS = 18
+
+# :: number of rows processed at once (bounds the temporary memory)
+CHUNK_SIZE = 65536
+
+# :: characters ignored at both ends of Roman numbers: the null character
+#    (as used for padding by NumPy) and the whitespace characters (those for
+#    which `str.isspace()` is True, as removed by `str.strip()`)
+_BLANKS = (
+    '\0\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680'
+    '\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a'
+    '\u2028\u2029\u202f\u205f\u3000')
+
+
+# ======================================================================
+def _as_codes(texts):
+    """
+    Get the code points of a string array.
+
+    Args:
+        texts (np.ndarray|Iterable[str]): The input strings.
+            Arrays of `numpy.str_` or `numpy.bytes_` are processed directly,
+            anything else is converted to an array of `numpy.str_` first.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - codes (np.ndarray): The code points, one string per row.
+             - shape (tuple[int]): The shape of the input strings.
+    """
+    texts = np.asarray(texts)
+    if texts.dtype.kind not in 'US':
+        texts = texts.astype(np.str_)
+    shape = texts.shape
+    texts = np.ascontiguousarray(texts).reshape(-1)
+    code_dtype = np.uint32 if texts.dtype.kind == 'U' else np.uint8
+    if texts.dtype.itemsize:
+        codes = texts.view(code_dtype).reshape(len(texts), -1)
+    else:
+        codes = np.zeros((len(texts), 1), dtype=code_dtype)
+    return codes, shape
+
+
+# ======================================================================
+def _lengths(codes):
+    """
+    Compute the lengths of the strings from their code points.
+
+    Args:
+        codes (np.ndarray): The code points, one string per row.
+            Strings are padded with trailing null characters.
+
+    Returns:
+        lengths (np.ndarray[int]): The length of each string.
+
+    Examples:
+        >>> _lengths(_as_codes(['MDC', '', 'X'])[0]).tolist()
+        [3, 0, 1]
+    """
+    nonzero = codes[:, ::-1] != 0
+    return np.where(
+        nonzero.any(axis=1), codes.shape[1] - np.argmax(nonzero, axis=1), 0)
+
+
+# ======================================================================
+@functools.lru_cache(maxsize=8)
+def _roman_tables(negative_sign):
+    """
+    Compute the lookup tables for vectorized Roman number decoding.
+
+    Each character may represent multiple (ASCII) symbols, e.g. `Ⅳ`, hence
+    its contribution depends on the maximum value of the following
+    characters, which is encoded as an index of the distinct values.
+
+    Args:
+        negative_sign (str): The symbol to use for negative numbers.
+            Must be a single character.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - kinds (np.ndarray[uint8]): The kind of each code point.
+               The last item is used for all unsupported code points.
+             - levels (np.ndarray[uint8]): The index of the maximum value
+               of each code point.
+             - contribs (np.ndarray[int16]): The contribution of each code
+               point (first axis) for each index of the maximum value of
+               the following characters (second axis).
+             - symbols (np.ndarray[int8]): The symbols of each code point.
+               Each row contains the indices of the (ASCII) symbols
+               represented by the character, padded with -1.
+             - transitions (np.ndarray[int16]): The transitions of the
+               automaton accepting the standard forms (first axis: state,
+               second axis: symbol index, where -1 leaves the state
+               unchanged). The initial state is 1 and the rejecting state
+               is 0. All other states are accepting.
+
+    Examples:
+        >>> kinds, levels, contribs, symbols, transitions = _roman_tables('-')
+        >>> code = ord('Ⅳ')
+        >>> kinds[code].tolist() == _KIND_SYMBOL, symbols[code].tolist()
+        (True, [0, 1, -1, -1])
+        >>> contribs[ord('Ⅳ'), [0, levels[ord('X')]]].tolist()
+        [4, -6]
+        >>> kinds[[ord(' '), ord('\u3000'), 0]].tolist() == [_KIND_BLANK] * 3
+        True
+    """
+    # : Claudian (i.e. Apostrophus) symbols cannot be decoded
+    symbols = dict(
+        (char, values) for char, values in _ROMAN_DECODE_VALUES.items()
+        if None not in values)
+    size = max(
+        max(ord(char) for char in symbols), max(ord(char) for char in _BLANKS),
+        ord(negative_sign)) + 1
+    kinds = np.full(size + 1, _KIND_INVALID, dtype=np.uint8)
+    values = np.zeros(
+        (size + 1, max(len(v) for v in symbols.values())), dtype=np.int16)
+    for char, char_values in symbols.items():
+        if char_values == (0,):
+            kinds[ord(char)] = _KIND_ZERO
+        else:
+            kinds[ord(char)] = _KIND_SYMBOL
+            values[ord(char), :len(char_values)] = char_values
+    for char in _BLANKS:
+        kinds[ord(char)] = _KIND_BLANK
+    kinds[ord(negative_sign)] = _KIND_SIGN
+    # : contributions for each maximum value of the following characters
+    max_values = sorted(set(values.ravel().tolist()))
+    levels = np.searchsorted(max_values, values.max(axis=1)).astype(np.uint8)
+    contribs = np.zeros((size + 1, len(max_values)), dtype=np.int16)
+    for code in np.flatnonzero(kinds == _KIND_SYMBOL):
+        for level, max_value in enumerate(max_values):
+            for value in values[code, ::-1].tolist():
+                if value < max_value:
+                    contribs[code, level] -= value
+                elif value:
+                    contribs[code, level] += value
+                    max_value = value
+    # : automaton of the standard forms, as accepted by `_ROMAN_STRICT_REGEX`
+    #   (i.e. a trie over the ASCII symbols, where 0 is the rejecting state)
+    items = [
+        (1000, 'M'), (900, 'CM'), (500, 'D'), (400, 'CD'), (100, 'C'),
+        (90, 'XC'), (50, 'L'), (40, 'XL'), (10, 'X'),
+        (9, 'IX'), (5, 'V'), (4, 'IV'), (1, 'I')]
+    symbol_values = sorted(set(_ROMAN_ASCII_R) - {0})
+    states = {'': 1}
+    for num in range(4000):
+        form = ''
+        for value, text in items:
+            count, num = divmod(num, value)
+            form += text * count
+        for i in range(len(form)):
+            states.setdefault(form[:i + 1], len(states) + 1)
+    # : the last symbol index (i.e. -1) is the padding, which is ignored
+    transitions = np.zeros(
+        (len(states) + 1, len(symbol_values) + 1), np.int16)
+    transitions[:, -1] = np.arange(len(states) + 1)
+    for form, state in states.items():
+        if form:
+            transitions[states[form[:-1]], symbol_values.index(
+                _ROMAN_ASCII[form[-1]])] = state
+    symbols = np.searchsorted(symbol_values, values).astype(np.int8)
+    symbols[values == 0] = -1
+    return kinds, levels, contribs, symbols, transitions
+
+
+# ======================================================================
+def _roman2int_rows(
+        codes,
+        strict,
+        tables):
+    """
+    Convert rows of code points of Roman numbers to integers.
+
+    Args:
+        codes (np.ndarray): The code points of the Roman numbers.
+            Must be a 2D array with one Roman number per row.
+        strict (bool): Only accept strictly formally valid Roman numbers.
+        tables (tuple): The tables as obtained from `_roman_tables()`.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - nums (np.ndarray[int64]): The integers represented.
+             - invalid (np.ndarray[bool]): The invalid rows mask.
+    """
+    kinds, levels, contribs, symbols, transitions = tables
+    num_rows, width = codes.shape
+    rows = np.arange(num_rows)
+    if np.iinfo(codes.dtype).max >= len(kinds):
+        codes = np.minimum(codes, len(kinds) - 1)
+    kind = kinds[codes]
+    # : blanks are only allowed at both ends (a single sign at the start)
+    filled = kind != _KIND_BLANK
+    count = filled.sum(axis=1)
+    first = filled.argmax(axis=1)
+    last = width - 1 - filled[:, ::-1].argmax(axis=1)
+    invalid = (count > 0) & (last - first + 1 != count)
+    negative = (count > 0) & (kind[rows, first] == _KIND_SIGN)
+    kind[rows[negative], first[negative]] = _KIND_BLANK
+    count -= negative
+    invalid |= ((kind == _KIND_INVALID) | (kind == _KIND_SIGN)).any(axis=1)
+    # : the zero must be alone
+    invalid |= (kind == _KIND_ZERO).any(axis=1) & (count > 1)
+    # : a value is subtracted if smaller than the maximum of the following
+    suffix_levels = np.zeros(codes.shape, dtype=levels.dtype)
+    suffix_levels[:, :-1] = np.maximum.accumulate(
+        levels[codes[:, :0:-1]], axis=1)[:, ::-1]
+    nums = contribs[codes, suffix_levels].sum(axis=1, dtype=np.int64)
+    if strict:
+        # : the symbols must be accepted by the automaton
+        states = np.ones(num_rows, dtype=transitions.dtype)
+        for j in range(width):
+            column = symbols[codes[:, j]]
+            for k in range(column.shape[1]):
+                if k and column[:, k].max() < 0:
+                    break
+                states = transitions[states, column[:, k]]
+        invalid |= states == 0
+    nums[negative] *= -1
+    nums[invalid] = 0
+    return nums, invalid
+
+
+# ======================================================================
+def roman2int_array(
+        texts,
+        strict=False,
+        negative_sign=_ROMAN_MINUS,
+        chunk_size=CHUNK_SIZE,
+        limits=None):
+    """
+    Convert an array of Roman numbers to integers.
+
+    This is the vectorized equivalent of `roman2int()`: the characters are
+    mapped to their values through a lookup table, the subtractive rule is
+    applied by comparing each value with the maximum of the following ones,
+    and the values are summed along each row.
+
+    Args:
+        texts (np.ndarray|Iterable[str]): The input numbers to parse.
+            Arrays of `numpy.str_` or `numpy.bytes_` are processed directly,
+            anything else is converted to an array of `numpy.str_` first.
+        strict (bool): Only accept strictly formally valid Roman numbers.
+            This is equivalent to `roman2int()` with the default
+            `strict_regex`.
+        negative_sign (str): The symbol to use for negative numbers.
+            Must be a single character.
+        chunk_size (int): The number of items processed at once.
+        limits (Mapping[str, int|None]|None): The per-call limits.
+            These override the global limits, see `numeral.set_limits()`.
+            Items exceeding the limits are considered invalid.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - nums (np.ndarray[int64]): The integers represented.
+               Invalid items are set to 0.
+             - invalid (np.ndarray[bool]): The invalid items mask.
+            Both have the same shape as `texts`.
+
+    Raises:
+        ValueError: if `negative_sign` is not a single character.
+
+    Notes:
+        - Large numbers using the Apostrophus notation, as well as the
+          vinculum notation, are considered invalid.
+
+    Examples:
+        >>> texts = np.array(['MDCLXVI', ' -iv ', 'Ⅻ', 'IC', 'X I', 'N', ''])
+        >>> nums, invalid = roman2int_array(texts)
+        >>> nums.tolist(), np.flatnonzero(invalid).tolist()
+        ([1666, -4, 12, 99, 0, 0, 0], [4])
+        >>> roman2int_array(['\\xa0XII', 'XII\\u3000'])[0].tolist()
+        [12, 12]
+        >>> roman2int_array(texts, strict=True)[1].tolist()
+        [False, False, False, True, True, False, False]
+        >>> roman2int_array(np.array([b'MMXXIV', b'MMXXIV!']))
+        (array([2024,    0]), array([False,  True]))
+        >>> limits = {'max_length': 10, 'max_magnitude': 100}
+        >>> roman2int_array(['I' * 20, 'MMM', '-XC'], limits=limits)
+        (array([  0,   0, -90]), array([ True,  True, False]))
+    """
+    if len(negative_sign) != 1:
+        raise ValueError('Negative sign must be a single character')
+    max_length, max_magnitude, _ = _get_limits(limits)
+    if max_magnitude is not None:
+        magnitude_size = _roman_max_length(max_magnitude) + 1
+        if max_length is None or magnitude_size < max_length:
+            max_length = magnitude_size
+    codes, shape = _as_codes(texts)
+    tables = _roman_tables(negative_sign)
+    nums = np.zeros(len(codes), dtype=np.int64)
+    invalid = np.zeros(len(codes), dtype=bool)
+    for i in range(0, len(codes), chunk_size):
+        chunk = codes[i:i + chunk_size]
+        # : the input length is checked only if the items may be too long
+        if max_length is not None and chunk.shape[1] > max_length:
+            too_long = _lengths(chunk) > max_length
+        else:
+            too_long = False
+        nums[i:i + chunk_size], invalid[i:i + chunk_size] = _roman2int_rows(
+            chunk, strict, tables)
+        invalid[i:i + chunk_size] |= too_long
+    if max_magnitude is not None:
+        invalid |= np.abs(nums) > max_magnitude
+    nums[invalid] = 0
+    return nums.reshape(shape), invalid.reshape(shape)
+
+
+# ======================================================================
+@functools.lru_cache(maxsize=None)
+def _cell_ref_tables():
+    """
+    Compute the lookup tables for vectorized cell reference parsing.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - classes (np.ndarray[uint8]): The class of each code point.
+               The last item is used for all unsupported code points.
+             - values (np.ndarray[int64]): The value of each code point,
+               i.e. 1 to 26 for letters and 0 to 9 for digits.
+             - transitions (np.ndarray[uint8]): The transitions of the
+               automaton accepting the cell references (first axis: state,
+               second axis: character class). The initial state is 1 and
+               the rejecting state is 0. The accepting states are 5 and 6.
+
+    Examples:
+        >>> classes, values, transitions = _cell_ref_tables()
+        >>> code = ord('b')
+        >>> classes[code].tolist() == _CELL_LETTER, values[code].tolist()
+        (True, 2)
+    """
+    size = 128
+    classes = np.full(size + 1, _CELL_INVALID, dtype=np.uint8)
+    values = np.zeros(size + 1, dtype=np.int64)
+    for i, (upper, lower) in enumerate(
+            zip(string.ascii_uppercase, string.ascii_lowercase)):
+        classes[[ord(upper), ord(lower)]] = _CELL_LETTER
+        values[[ord(upper), ord(lower)]] = i + 1
+    for i, digit in enumerate(string.digits):
+        classes[ord(digit)] = _CELL_DIGIT if i else _CELL_ZERO
+        values[ord(digit)] = i
+    for char in '\0' + string.whitespace:
+        classes[ord(char)] = _CELL_BLANK
+    classes[ord('$')] = _CELL_DOLLAR
+    # : states: 1 start, 2 first `$`, 3 letters, 4 second `$`, 5 digits,
+    #   6 trailing blanks
+    transitions = np.zeros((7, _CELL_INVALID + 1), dtype=np.uint8)
+    for state, cell_class, next_state in (
+            (1, _CELL_BLANK, 1), (1, _CELL_DOLLAR, 2), (1, _CELL_LETTER, 3),
+            (2, _CELL_LETTER, 3),
+            (3, _CELL_LETTER, 3), (3, _CELL_DOLLAR, 4), (3, _CELL_DIGIT, 5),
+            (4, _CELL_DIGIT, 5),
+            (5, _CELL_ZERO, 5), (5, _CELL_DIGIT, 5), (5, _CELL_BLANK, 6),
+            (6, _CELL_BLANK, 6)):
+        transitions[state, cell_class] = next_state
+    return classes, values, transitions
+
+
+# ======================================================================
+def _parse_cell_ref_rows(
+        codes,
+        tables):
+    """
+    Convert rows of code points of cell references to rows and columns.
+
+    Args:
+        codes (np.ndarray): The code points of the cell references.
+            Must be a 2D array with one cell reference per row.
+        tables (tuple): The tables as obtained from `_cell_ref_tables()`.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - refs (np.ndarray[int64]): The (row, column) pairs.
+             - invalid (np.ndarray[bool]): The invalid rows mask.
+    """
+    classes, values, transitions = tables
+    if np.iinfo(codes.dtype).max >= len(classes):
+        codes = np.minimum(codes, len(classes) - 1)
+    states = np.ones(len(codes), dtype=transitions.dtype)
+    refs = np.zeros((len(codes), 2), dtype=np.int64)
+    num_letters = np.zeros(len(codes), dtype=np.int64)
+    num_digits = np.zeros(len(codes), dtype=np.int64)
+    for j in range(codes.shape[1]):
+        column = classes[codes[:, j]]
+        value = values[codes[:, j]]
+        states = transitions[states, column]
+        is_letter = column == _CELL_LETTER
+        is_digit = (column == _CELL_ZERO) | (column == _CELL_DIGIT)
+        refs[:, 1] = np.where(is_letter, refs[:, 1] * 26 + value, refs[:, 1])
+        refs[:, 0] = np.where(is_digit, refs[:, 0] * 10 + value, refs[:, 0])
+        num_letters += is_letter
+        num_digits += is_digit
+    invalid = (states < 5) \
+        | (num_letters > _CELL_MAX_LETTERS) | (num_digits > _CELL_MAX_DIGITS) \
+        | (refs[:, 0] > MAX_ROW) | (refs[:, 1] > MAX_COLUMN)
+    refs[invalid] = 0
+    return refs, invalid
+
+
+# ======================================================================
+def parse_cell_ref_array(
+        texts,
+        chunk_size=CHUNK_SIZE):
+    """
+    Convert an array of cell references to rows and columns.
+
+    This is the vectorized equivalent of `numeral.cells.parse_cell_ref()`:
+    the characters are classified through a lookup table, the structure is
+    checked by an automaton, and the rows and columns are accumulated
+    column by column.
+
+    Args:
+        texts (np.ndarray|Iterable[str]): The input references to parse.
+            Arrays of `numpy.str_` or `numpy.bytes_` are processed directly,
+            anything else is converted to an array of `numpy.str_` first.
+        chunk_size (int): The number of items processed at once.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - refs (np.ndarray[int64]): The 1-based (row, column) pairs,
+               along the last axis. Invalid items are set to 0.
+             - invalid (np.ndarray[bool]): The invalid items mask.
+               It has the same shape as `texts`.
+
+    Examples:
+        >>> texts = np.array(['A1', '$ab$12', 'XFD1048576', 'A0', 'A1:B2'])
+        >>> refs, invalid = parse_cell_ref_array(texts)
+        >>> refs.tolist(), np.flatnonzero(invalid).tolist()
+        ([[1, 1], [12, 28], [1048576, 16384], [0, 0], [0, 0]], [3, 4])
+        >>> parse_cell_ref_array(['XFE1', 'A1048577'])[1].tolist()
+        [True, True]
+    """
+    codes, shape = _as_codes(texts)
+    tables = _cell_ref_tables()
+    refs = np.zeros((len(codes), 2), dtype=np.int64)
+    invalid = np.zeros(len(codes), dtype=bool)
+    for i in range(0, len(codes), chunk_size):
+        refs[i:i + chunk_size], invalid[i:i + chunk_size] = \
+            _parse_cell_ref_rows(codes[i:i + chunk_size], tables)
+    return refs.reshape(shape + (2,)), invalid.reshape(shape)
+
+
+# ======================================================================
+def parse_range_ref_array(
+        texts,
+        chunk_size=CHUNK_SIZE):
+    """
+    Convert an array of range references to their corner cells.
+
+    This is the vectorized equivalent of `numeral.cells.parse_range_ref()`.
+
+    Args:
+        texts (np.ndarray|Iterable[str]): The input references to parse.
+            Arrays of `numpy.str_` or `numpy.bytes_` are processed directly,
+            anything else is converted to an array of `numpy.str_` first.
+            A single cell reference is interpreted as a one-cell range.
+        chunk_size (int): The number of items processed at once.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - refs (np.ndarray[int64]): The 1-based (start, stop) cells,
+               i.e. the top-left and bottom-right corners, along the
+               second-to-last axis, each as (row, column) pair, along the
+               last axis. Invalid items are set to 0.
+             - invalid (np.ndarray[bool]): The invalid items mask.
+               It has the same shape as `texts`.
+
+    Examples:
+        >>> refs, invalid = parse_range_ref_array(['A2:B1', 'C3', 'C3:'])
+        >>> refs.tolist(), invalid.tolist()
+        ([[[1, 1], [2, 2]], [[3, 3], [3, 3]], [[0, 0], [0, 0]]], \
+[False, False, True])
+    """
+    texts = np.asarray(texts)
+    if texts.dtype.kind not in 'US':
+        texts = texts.astype(np.str_)
+    parts = np.char.partition(texts, ':' if texts.dtype.kind == 'U' else b':')
+    starts, invalid = parse_cell_ref_array(parts[..., 0], chunk_size)
+    stops, stop_invalid = parse_cell_ref_array(parts[..., 2], chunk_size)
+    single = np.char.str_len(parts[..., 1]) == 0
+    stops[single] = starts[single]
+    invalid |= stop_invalid & ~single
+    refs = np.stack(
+        [np.minimum(starts, stops), np.maximum(starts, stops)], axis=-2)
+    refs[invalid] = 0
+    return refs, invalid
+
+
+# ======================================================================
+def format_cell_ref_array(refs):
+    """
+    Convert an array of rows and columns to cell references.
+
+    This is the vectorized equivalent of `numeral.cells.format_cell_ref()`:
+    the letters of the columns are gathered from the precomputed table.
+
+    Args:
+        refs (np.ndarray|Iterable): The 1-based (row, column) pairs,
+            along the last axis.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - texts (np.ndarray[str]): The cell references.
+               Invalid items are set to the empty string.
+             - invalid (np.ndarray[bool]): The invalid items mask.
+
+    Examples:
+        >>> texts, invalid = format_cell_ref_array([[1, 1], [12, 28], [0, 1]])
+        >>> texts.tolist(), invalid.tolist()
+        (['A1', 'AB12', ''], [False, False, True])
+        >>> format_cell_ref_array([[1, 16385], [1048577, 1]])[1].tolist()
+        [True, True]
+    """
+    refs = np.asarray(refs, dtype=np.int64)
+    rows, cols = refs[..., 0], refs[..., 1]
+    invalid = (rows < 1) | (rows > MAX_ROW) | (cols < 1) | (cols > MAX_COLUMN)
+    names = np.array(_column_tables()[0])
+    letters = names[np.clip(cols, 1, MAX_COLUMN) - 1]
+    texts = np.char.add(letters, rows.astype(np.str_))
+    texts[invalid] = ''
+    return texts, invalid
+
+
+# ======================================================================
+if __name__ == '__main__':
+    doctest.testmod()
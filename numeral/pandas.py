@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Numeral: pandas integration.
+
+Importing this module registers the `numeral` accessor for `pandas.Series`,
+e.g. `s.numeral.to_roman()` or `s.numeral.from_letters()`.
+
+This module requires `pandas`, which is otherwise not needed by `numeral`.
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals)
+
+# ======================================================================
+# :: Python Standard Library Imports
+import string  # Common string operations
+import numbers  # Numeric abstract base classes
+import doctest  # Test interactive Python examples
+
+# ======================================================================
+# :: External Imports
+import numpy as np  # N-dimensional arrays
+import pandas as pd  # Data analysis and manipulation tool
+
+# ======================================================================
+# :: Internal Imports
+from numeral.backends import int2letter, int2tokens, int2roman
+from numeral.numeral import (
+    letter2int_batch, tokens2int_batch, roman2int_batch, BATCH_ERRORS)
+from numeral.numeral import _ROMAN_STRICT_REGEX, _ROMAN_MINUS
+
+
+# ======================================================================
+def _to_int_array(nums):
+    """
+    Convert a sequence of integers (or None) to the most suitable array.
+
+    Args:
+        nums (Sequence[int|None]): The input integers.
+            None values are interpreted as missing.
+
+    Returns:
+        arr (pd.api.extensions.ExtensionArray|np.ndarray): The array.
+            If all values fit in 64 bits, a nullable `Int64` array is used,
+            otherwise a NumPy `object` array is used.
+
+    Examples:
+        >>> _to_int_array([1, None, 3]).dtype
+        Int64Dtype()
+        >>> _to_int_array([1, None, 2 ** 80]).dtype
+        dtype('O')
+    """
+    try:
+        return pd.array(nums, dtype='Int64')
+    except (OverflowError, TypeError, ValueError):
+        return np.array(
+            [pd.NA if num is None else num for num in nums], dtype=object)
+
+
+# ======================================================================
+@pd.api.extensions.register_series_accessor('numeral')
+class NumeralAccessor(object):
+    """
+    Numeral conversions for `pandas.Series`.
+
+    The conversions are computed only once for each distinct value and then
+    broadcast through a lookup table.
+    Missing values are preserved.
+
+    Examples:
+        >>> s = pd.Series([1, 4, None, 1666])
+        >>> s.numeral.to_roman(only_ascii=True).tolist()
+        ['I', 'IV', <NA>, 'MDCLXVI']
+        >>> s.numeral.to_roman(only_ascii=True).numeral.from_roman().tolist()
+        [1, 4, <NA>, 1666]
+        >>> pd.Series(['a', 'bxh', None]).numeral.from_letters().dtype
+        Int64Dtype()
+        >>> pd.Series([1.5]).numeral.to_roman()
+        Traceback (most recent call last):
+            ...
+        ValueError: Value `1.5` is not an integer
+        >>> pd.Series(['I']).numeral.from_roman(errors='ignore')
+        Traceback (most recent call last):
+            ...
+        ValueError: Unknown `errors` policy `ignore`
+    """
+
+    def __init__(self, series):
+        self._series = series
+
+    # --------------------------------
+    def _encode(self, func, *_args, **_kws):
+        """
+        Apply an integer-to-numeral converter to the series.
+
+        Only integral values (e.g. `1` or `1.0`, but not `1.5`) are accepted.
+
+        Args:
+            func (callable): The converter.
+                Must have the signature: func(int, *_args, **_kws) -> str.
+            *_args: Positional arguments for `func`.
+            **_kws: Keyword arguments for `func`.
+
+        Returns:
+            result (pd.Series): The converted series with `string` dtype.
+
+        Raises:
+            ValueError: if the series contains non-integral values.
+        """
+        series = self._series
+        mask = series.notna()
+        values = series[mask]
+        uniques = pd.unique(values)
+        for value in uniques:
+            if not isinstance(value, numbers.Number) or value != int(value):
+                raise ValueError(
+                    'Value `{}` is not an integer'.format(value))
+        table = {
+            value: func(int(value), *_args, **_kws) for value in uniques}
+        result = pd.Series(
+            pd.NA, index=series.index, dtype='string', name=series.name)
+        result[mask] = values.map(table)
+        return result
+
+    # --------------------------------
+    def _decode(self, batch_func, errors, *_args, **_kws):
+        """
+        Apply a numeral-to-integer batch converter to the series.
+
+        Args:
+            batch_func (callable): The batch converter.
+                Must follow the conventions of `numeral.roman2int_batch()`.
+            errors (str): The policy for invalid items.
+                Accepted values are:
+                 - 'raise': raise the corresponding exception;
+                 - 'coerce': replace invalid items with missing values;
+                 - 'skip': drop invalid items from the results.
+            *_args: Positional arguments for `batch_func`.
+            **_kws: Keyword arguments for `batch_func`.
+
+        Returns:
+            result (pd.Series): The converted series.
+                If possible, the nullable `Int64` dtype is used.
+
+        Raises:
+            ValueError: if `errors` is not supported.
+        """
+        if errors not in BATCH_ERRORS:
+            raise ValueError('Unknown `errors` policy `{}`'.format(errors))
+        series = self._series
+        mask = series.notna()
+        values = series[mask]
+        uniques = pd.unique(values)
+        nums, invalid = batch_func(
+            uniques, *_args,
+            errors='raise' if errors == 'raise' else 'coerce', **_kws)
+        table = dict(zip(uniques, nums))
+        nums = [table[value] if is_valid else None
+                for value, is_valid in zip(series, mask)]
+        result = pd.Series(
+            _to_int_array(nums), index=series.index, name=series.name)
+        if errors == 'skip' and invalid:
+            invalid_values = set(uniques[i] for i in invalid)
+            result = result[~series.isin(invalid_values)]
+        return result
+
+    # --------------------------------
+    def to_letters(
+            self,
+            alphabet=string.ascii_lowercase,
+            negative_sign='-'):
+        """
+        Convert the series values to letters.
+
+        See `numeral.int2letter()` for more details.
+        """
+        return self._encode(int2letter, alphabet, negative_sign)
+
+    # --------------------------------
+    def from_letters(
+            self,
+            alphabet=string.ascii_lowercase,
+            negative_sign='-',
+            errors='raise'):
+        """
+        Convert the series values from letters.
+
+        See `numeral.letter2int()` for more details.
+        """
+        return self._decode(
+            letter2int_batch, errors, alphabet, negative_sign)
+
+    # --------------------------------
+    def to_tokens(
+            self,
+            tokens,
+            negative_sign='-'):
+        """
+        Convert the series values to tokens.
+
+        See `numeral.int2tokens()` for more details.
+        """
+        return self._encode(int2tokens, tokens, negative_sign)
+
+    # --------------------------------
+    def from_tokens(
+            self,
+            tokens,
+            negative_sign='-',
+            errors='raise'):
+        """
+        Convert the series values from tokens.
+
+        See `numeral.tokens2int()` for more details.
+        """
+        return self._decode(
+            tokens2int_batch, errors, tokens, negative_sign)
+
+    # --------------------------------
+    def to_roman(self, **_kws):
+        """
+        Convert the series values to Roman numbers.
+
+        See `numeral.int2roman()` for more details.
+        """
+        return self._encode(int2roman, **_kws)
+
+    # --------------------------------
+    def from_roman(
+            self,
+            strict=False,
+            strict_regex=_ROMAN_STRICT_REGEX,
+            negative_sign=_ROMAN_MINUS,
+            vinculum=None,
+            errors='raise'):
+        """
+        Convert the series values from Roman numbers.
+
+        See `numeral.roman2int()` for more details.
+        """
+        return self._decode(
+            roman2int_batch, errors, strict, strict_regex, negative_sign,
+            vinculum)
+
+
+# ======================================================================
+if __name__ == '__main__':
+    doctest.testmod()
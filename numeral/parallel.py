@@ -0,0 +1,451 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Numeral: multi-core conversion of single gigantic integers.
+
+The bijective representation of a number `n` with `L` tokens is the
+standard positional representation of `n - first_index_of_length(L)`,
+padded to `L` digits.
+Hence, the conversion can be split into independent chunks of digits:
+ - on encoding, the number is split by powers of the base (using a
+   divide-and-conquer strategy) and each chunk is encoded in parallel;
+ - on decoding, each chunk of tokens is evaluated in parallel and the
+   results are combined with a balanced reduction.
+
+The benchmark can be run from the command line, e.g.:
+
+    $ python -m numeral.parallel --digits 200000
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals)
+
+# ======================================================================
+# :: Python Standard Library Imports
+import argparse  # Parser for command-line options, arguments and sub-commands
+import concurrent.futures  # Launching parallel tasks
+import os  # Miscellaneous operating system interfaces
+import random  # Generate pseudo-random numbers
+import string  # Common string operations
+import time  # Time access and conversions
+
+# ======================================================================
+# :: Internal Imports
+from numeral.backends import int2tokens, tokens2int
+from numeral.numeral import tokens_length, first_index_of_length
+from numeral.numeral import _split_sign
+
+# ======================================================================
+# minimum number of tokens per chunk, below which no parallelism is used
+MIN_CHUNK_SIZE = 2048
+
+
+# ======================================================================
+def _encode_chunk(args):
+    """
+    Encode a chunk as standard positional digits (worker function).
+
+    Args:
+        args (tuple): The chunk value, its number of digits, the tokens and
+            the negative sign.
+
+    Returns:
+        text (str): The digits of the chunk, padded to the required size.
+    """
+    value, size, tokens, negative_sign = args
+    return int2tokens(
+        first_index_of_length(size, len(tokens)) + value, tokens,
+        negative_sign)
+
+
+# ======================================================================
+def _decode_chunk(args):
+    """
+    Decode a chunk of standard positional digits (worker function).
+
+    Args:
+        args (tuple): The chunk text, its number of digits, the tokens and
+            the negative sign.
+
+    Returns:
+        value (int): The value of the chunk.
+    """
+    text, size, tokens, negative_sign = args
+    return (
+        tokens2int(text, tokens, negative_sign)
+        - first_index_of_length(size, len(tokens)))
+
+
+# ======================================================================
+def _map(
+        func,
+        args,
+        processes):
+    """
+    Apply a worker function to each item, using multiple processes.
+
+    Args:
+        func (callable): The worker function.
+        args (list): The arguments of each call.
+        processes (int): The number of processes.
+            If 1, the calls are done in the current process.
+
+    Returns:
+        results (list): The results of each call.
+
+    Examples:
+        >>> _map(abs, [-1, 2, -3], 1)
+        [1, 2, 3]
+    """
+    if processes == 1:
+        return list(map(func, args))
+    with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+        return list(executor.map(func, args))
+
+
+# ======================================================================
+def _split(
+        num,
+        size,
+        chunk_size,
+        base,
+        powers):
+    """
+    Split a number into chunks of digits using divide-and-conquer.
+
+    Args:
+        num (int): The input number. Must be non-negative.
+        size (int): The number of digits of `num` (including padding).
+        chunk_size (int): The number of digits of each chunk.
+            The most significant chunk may be smaller.
+        base (int): The base of the positional representation.
+        powers (dict): The cache of the powers of the base.
+
+    Returns:
+        chunks (list[tuple]): The chunks, most significant first.
+            Format: [(<value>, <number of digits>), ...].
+
+    Examples:
+        >>> _split(123456789, 9, 4, 10, {})
+        [(1, 1), (2345, 4), (6789, 4)]
+    """
+    if size <= chunk_size:
+        return [(num, size)]
+    low_size = -(-size // chunk_size) // 2 * chunk_size
+    if low_size not in powers:
+        powers[low_size] = base ** low_size
+    high, low = divmod(num, powers[low_size])
+    return (
+        _split(high, size - low_size, chunk_size, base, powers)
+        + _split(low, low_size, chunk_size, base, powers))
+
+
+# ======================================================================
+def _combine(
+        chunks,
+        base):
+    """
+    Combine chunks of digits using a balanced reduction.
+
+    Args:
+        chunks (list[tuple]): The chunks, most significant first.
+            Format: [(<value>, <number of digits>), ...].
+        base (int): The base of the positional representation.
+
+    Returns:
+        num (int): The combined number.
+
+    Examples:
+        >>> _combine([(1, 1), (2345, 4), (6789, 4)], 10)
+        123456789
+    """
+    powers = {}
+    while len(chunks) > 1:
+        combined = []
+        for i in range(0, len(chunks) - 1, 2):
+            (high, high_size), (low, low_size) = chunks[i], chunks[i + 1]
+            if low_size not in powers:
+                powers[low_size] = base ** low_size
+            combined.append(
+                (high * powers[low_size] + low, high_size + low_size))
+        if len(chunks) % 2:
+            combined.append(chunks[-1])
+        chunks = combined
+    return chunks[0][0] if chunks else 0
+
+
+# ======================================================================
+def _chunk_size(
+        size,
+        processes,
+        chunk_size):
+    """
+    Determine the number of digits per chunk.
+
+    Args:
+        size (int): The total number of digits.
+        processes (int): The number of processes.
+        chunk_size (int|None): The requested number of digits per chunk.
+            If None, it is determined from `size` and `processes`.
+
+    Returns:
+        chunk_size (int): The number of digits per chunk.
+    """
+    if chunk_size is None and processes == 1:
+        chunk_size = MIN_CHUNK_SIZE
+    elif chunk_size is None:
+        chunk_size = max(-(-size // (4 * processes)), MIN_CHUNK_SIZE)
+    return chunk_size
+
+
+# ======================================================================
+def int2tokens_parallel(
+        num,
+        tokens,
+        negative_sign='-',
+        processes=None,
+        chunk_size=None):
+    """
+    Convert a gigantic number to tokens using multiple processes.
+
+    This is equivalent to `int2tokens()`.
+    With a single process, the chunks are converted in the current process,
+    which is still faster than `int2tokens()` for gigantic numbers.
+
+    Args:
+        num (int): The input number to convert.
+        tokens (Sequence[str]): The tokens to use for the representation.
+            Items within the tokens set must not repeat or overlap.
+        negative_sign (str): The symbol to use for negative numbers.
+        processes (int|None): The number of processes to use.
+            If None, the number of CPUs is used.
+        chunk_size (int|None): The number of tokens per chunk.
+            If None, it is determined automatically.
+
+    Returns:
+        text (str): The integer represented.
+
+    Examples:
+        >>> n = 7 ** 5000
+        >>> text = int2tokens_parallel(n, 'abc', chunk_size=100, processes=2)
+        >>> text == int2tokens(n, 'abc')
+        True
+        >>> int2tokens_parallel(n, 'abc', chunk_size=100, processes=1) == text
+        True
+    """
+    processes = processes or os.cpu_count() or 1
+    sign_text = negative_sign if num < 0 else ''
+    num = abs(num)
+    base = len(tokens)
+    size = tokens_length(num, base)
+    chunk_size = _chunk_size(size, processes, chunk_size)
+    if size <= chunk_size:
+        return sign_text + int2tokens(num, tokens, negative_sign)
+    num -= first_index_of_length(size, base)
+    chunks = _split(num, size, chunk_size, base, {})
+    texts = _map(
+        _encode_chunk,
+        [(value, chunk, tokens, negative_sign) for value, chunk in chunks],
+        processes)
+    return sign_text + ''.join(texts)
+
+
+# ======================================================================
+def tokens2int_parallel(
+        text,
+        tokens,
+        negative_sign='-',
+        processes=None,
+        chunk_size=None):
+    """
+    Convert a gigantic group of tokens to a number using multiple processes.
+
+    This is equivalent to `tokens2int()`.
+    If the tokens do not have the same length, no parallelism is used.
+    With a single process, the chunks are converted in the current process.
+
+    Args:
+        text (str): The input string to parse.
+        tokens (Sequence[str]): The tokens to use for the representation.
+            Items within the tokens set must not repeat or overlap.
+        negative_sign (str): The symbol to use for negative numbers.
+        processes (int|None): The number of processes to use.
+            If None, the number of CPUs is used.
+        chunk_size (int|None): The number of tokens per chunk.
+            If None, it is determined automatically.
+
+    Returns:
+        num (int): The integer represented.
+
+    Examples:
+        >>> n = 7 ** 5000
+        >>> text = int2tokens(n, ('mo', 'no', 'ke'))
+        >>> tokens2int_parallel(text, ('mo', 'no', 'ke'), chunk_size=100,
+        ...     processes=2) == n
+        True
+        >>> text = int2tokens(-n, 'ab-', '~')
+        >>> tokens2int_parallel(text, 'ab-', '~', chunk_size=100,
+        ...     processes=2) == -n
+        True
+        >>> tokens2int_parallel(text, 'ab-', '~', chunk_size=100,
+        ...     processes=1) == -n
+        True
+    """
+    processes = processes or os.cpu_count() or 1
+    token_sizes = set(len(token) for token in tokens)
+    sign, stripped = _split_sign(text, negative_sign)
+    token_size = token_sizes.pop() if len(token_sizes) == 1 else None
+    size = len(stripped) // token_size if token_size else 0
+    chunk_size = _chunk_size(size, processes, chunk_size)
+    if not sign or not token_size or size <= chunk_size \
+            or len(stripped) % token_size or negative_sign in tokens:
+        return tokens2int(text, tokens, negative_sign)
+    base = len(tokens)
+    bounds = list(range(size, 0, -chunk_size))[::-1]
+    bounds = [0] + bounds if bounds[0] else bounds
+    args = [
+        (stripped[begin * token_size:end * token_size], end - begin, tokens,
+         negative_sign)
+        for begin, end in zip(bounds[:-1], bounds[1:])]
+    values = _map(_decode_chunk, args, processes)
+    num = _combine(
+        [(value, arg[1]) for value, arg in zip(values, args)], base)
+    return sign * (num + first_index_of_length(size, base))
+
+
+# ======================================================================
+def int2letter_parallel(
+        num,
+        alphabet=string.ascii_lowercase,
+        negative_sign='-',
+        processes=None,
+        chunk_size=None):
+    """
+    Convert a gigantic number to letters using multiple processes.
+
+    This is equivalent to `int2letter()`.
+
+    Args:
+        num (int): The input number to convert.
+        alphabet (str): The characters to use for the representation.
+        negative_sign (str): The symbol to use for negative numbers.
+        processes (int|None): The number of processes to use.
+            If None, the number of CPUs is used.
+        chunk_size (int|None): The number of letters per chunk.
+            If None, it is determined automatically.
+
+    Returns:
+        text (str): The integer represented.
+
+    See Also:
+        int2tokens_parallel()
+    """
+    return int2tokens_parallel(
+        num, alphabet, negative_sign, processes, chunk_size)
+
+
+# ======================================================================
+def letter2int_parallel(
+        text,
+        alphabet=string.ascii_lowercase,
+        negative_sign='-',
+        processes=None,
+        chunk_size=None):
+    """
+    Convert a gigantic group of letters to a number using multiple processes.
+
+    This is equivalent to `letter2int()`.
+
+    Args:
+        text (str): The input string to parse.
+        alphabet (str): The characters to use for the representation.
+        negative_sign (str): The symbol to use for negative numbers.
+        processes (int|None): The number of processes to use.
+            If None, the number of CPUs is used.
+        chunk_size (int|None): The number of letters per chunk.
+            If None, it is determined automatically.
+
+    Returns:
+        num (int): The integer represented.
+
+    Examples:
+        >>> n = -(3 ** 20000)
+        >>> letter2int_parallel(int2letter_parallel(n, processes=2),
+        ...     processes=2, chunk_size=500) == n
+        True
+
+    See Also:
+        tokens2int_parallel()
+    """
+    return tokens2int_parallel(
+        text, alphabet, negative_sign, processes, chunk_size)
+
+
+# ======================================================================
+def benchmark(
+        num_digits=100000,
+        tokens=string.ascii_lowercase,
+        processes=None,
+        seed=0):
+    """
+    Measure the speedup of the parallel conversions by number of processes.
+
+    The same chunked conversion is used for all numbers of processes
+    (including 1), so that the speedup is only due to parallelism.
+
+    Args:
+        num_digits (int): The approximate number of decimal digits.
+        tokens (Sequence[str]): The tokens to use for the representation.
+        processes (Iterable[int]|None): The numbers of processes to test.
+            If None, powers of two up to the number of CPUs are used.
+        seed (int): The seed of the pseudo-random number generator.
+
+    Returns:
+        result (list[tuple]): The timings in seconds.
+            Format: [(<processes>, <encode time>, <decode time>), ...].
+    """
+    if processes is None:
+        max_processes = os.cpu_count() or 1
+        processes = [2 ** i for i in range(max_processes.bit_length())]
+    num = random.Random(seed).getrandbits(int(num_digits * 3.3219280948873626))
+    text = int2tokens(num, tokens)
+    result = []
+    for num_processes in processes:
+        begin_time = time.perf_counter()
+        encoded = int2tokens_parallel(num, tokens, processes=num_processes)
+        encode_time = time.perf_counter() - begin_time
+        begin_time = time.perf_counter()
+        decoded = tokens2int_parallel(text, tokens, processes=num_processes)
+        decode_time = time.perf_counter() - begin_time
+        if encoded != text or decoded != num:
+            raise ValueError('Parallel and serial conversions differ')
+        result.append((num_processes, encode_time, decode_time))
+    return result
+
+
+# ======================================================================
+def main():
+    arg_parser = argparse.ArgumentParser(
+        description='Benchmark the parallel conversions.')
+    arg_parser.add_argument(
+        '-d', '--digits', type=int, default=100000,
+        help='The approximate number of decimal digits.')
+    arg_parser.add_argument(
+        '-p', '--processes', type=int, nargs='+', default=None,
+        help='The numbers of processes to test.')
+    args = arg_parser.parse_args()
+    timings = benchmark(args.digits, processes=args.processes)
+    base_encode_time, base_decode_time = timings[0][1:]
+    print('{:>9}  {:>16}  {:>16}'.format('processes', 'encode', 'decode'))
+    for num_processes, encode_time, decode_time in timings:
+        print('{:>9}  {:>8.3f}s ({:>4.1f}x)  {:>8.3f}s ({:>4.1f}x)'.format(
+            num_processes,
+            encode_time, base_encode_time / encode_time,
+            decode_time, base_decode_time / decode_time))
+
+
+# ======================================================================
+if __name__ == '__main__':
+    main()
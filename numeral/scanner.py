@@ -0,0 +1,426 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Numeral: finding and converting Roman numbers in free text.
+
+The text is scanned by a single compiled regular expression matching the
+runs of Roman symbols (optionally delimited by word boundaries), which are
+then validated and decoded through the same tables as `roman2int()`.
+In strict mode, only the canonical Roman numbers (from 1 to 3999, i.e.
+those accepted by `roman2int()` with `strict=True`) are found.
+
+Both `str` and bytes-like objects (e.g. `bytes` or `mmap.mmap`) are
+supported: bytes are assumed to be UTF-8 encoded and the offsets are then
+byte offsets. Matches are yielded lazily, so that large memory-mapped files
+are never loaded (or decoded) as a whole.
+
+Examples:
+    >>> text = 'Chapter XIV: Louis XVI and the MIX of Ⅻ things.'
+    >>> list(find_romans(text))
+    [(8, 11, 14), (19, 22, 16), (31, 34, 1009)]
+    >>> list(find_romans(text, unicode=True))[-1]
+    (38, 39, 12)
+    >>> sub_romans('Henry VIII had VI wives.')
+    'Henry 8 had 6 wives.'
+    >>> sub_integers('Henry 8 had 6 wives.')
+    'Henry Ⅷ had Ⅵ wives.'
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals)
+
+# ======================================================================
+# :: Python Standard Library Imports
+import re  # Regular expression operations
+import functools  # Higher-order functions and operations on callable objects
+import doctest  # Test interactive Python examples
+
+# ======================================================================
+# :: Internal Imports
+from numeral.backends import int2roman
+from numeral.numeral import (
+    _ROMAN_ASCII_UPPER, _ROMAN_ASCII_LOWER, _ROMAN_DECODE_VALUES,
+    _ROMAN_DECODE_TRANSLATE, _ROMAN_STRICT_REGEX,
+    _roman2int, _roman_canonical_index)
+
+# ======================================================================
+SCAN_CASES = ('upper', 'lower', 'any')
+
+_INTEGER_REGEX = re.compile(r'[0-9]+')
+
+_WORD_REGEX = re.compile(r'\w')
+
+
+# ======================================================================
+def _is_bytes_boundary(
+        text,
+        start,
+        end):
+    """
+    Check if a span of UTF-8 bytes is delimited by non-word characters.
+
+    Only non-ASCII neighbours are checked, since the ASCII ones are already
+    checked by the (bytes) regular expressions, whose `\\w` is ASCII-only.
+    This ensures the same word boundaries as for the decoded text.
+
+    Args:
+        text (bytes|mmap.mmap): The input text.
+            Must be UTF-8 encoded.
+        start (int): The offset of the first byte of the span.
+        end (int): The offset after the last byte of the span.
+
+    Returns:
+        result (bool): True if the span is delimited by non-word characters.
+
+    Examples:
+        >>> text = 'éIV «IV»'.encode('utf-8')
+        >>> _is_bytes_boundary(text, 2, 4), _is_bytes_boundary(text, 7, 9)
+        (False, True)
+    """
+    if start and text[start - 1] >= 0x80:
+        begin = start - 1
+        while begin > max(start - 4, 0) and 0x80 <= text[begin] < 0xc0:
+            begin -= 1
+        if _WORD_REGEX.match(text[begin:start].decode('utf-8', 'replace')):
+            return False
+    if end < len(text) and text[end] >= 0x80:
+        stop = end + 1
+        while stop < min(end + 4, len(text)) and 0x80 <= text[stop] < 0xc0:
+            stop += 1
+        if _WORD_REGEX.match(text[end:stop].decode('utf-8', 'replace')):
+            return False
+    return True
+
+
+# ======================================================================
+def _scan_symbols(
+        unicode,
+        uppercase):
+    """
+    Get the Roman symbols of a given case.
+
+    The zero (`N`) and the symbols of the Apostrophus notation that cannot
+    be decoded are excluded.
+    Symbols without case (e.g. `ↀ`) are included in both cases.
+
+    Args:
+        unicode (bool): Include the dedicated Unicode symbols.
+        uppercase (bool): Get the uppercase symbols.
+
+    Returns:
+        symbols (str): The symbols.
+
+    Examples:
+        >>> _scan_symbols(False, True)
+        'CDILMVX'
+        >>> _scan_symbols(True, False)
+        'cdilmvxⅰⅱⅲⅳⅴⅵⅶⅷⅸⅹⅺⅻⅼⅽⅾⅿↀↅↆ'
+    """
+    ascii_symbols = _ROMAN_ASCII_UPPER if uppercase else _ROMAN_ASCII_LOWER
+    symbols = []
+    for char, values in sorted(_ROMAN_DECODE_VALUES.items()):
+        if None in values or values == (0,):
+            continue
+        elif not unicode and char not in ascii_symbols:
+            continue
+        elif char == char.swapcase() \
+                or (char.isupper() if uppercase else char.islower()):
+            symbols.append(char)
+    return ''.join(symbols)
+
+
+# ======================================================================
+@functools.lru_cache(maxsize=32)
+def _compile_scanner(
+        unicode,
+        case,
+        boundary,
+        is_bytes):
+    """
+    Compile the regular expression matching the runs of Roman symbols.
+
+    Args:
+        unicode (bool): Include the dedicated Unicode symbols.
+        case (str): The case of the symbols.
+            Accepted values are the items of `SCAN_CASES`.
+            If 'any', each run must be either uppercase or lowercase.
+        boundary (bool): Only match runs delimited by word boundaries.
+        is_bytes (bool): Compile for UTF-8 encoded bytes.
+
+    Returns:
+        regex (re.Pattern): The compiled regular expression.
+
+    Raises:
+        ValueError: if `case` is not supported.
+
+    Examples:
+        >>> _compile_scanner(False, 'any', True, False).pattern
+        '(?<!\\\\w)(?:[CDILMVX]+|[cdilmvx]+)(?!\\\\w)'
+    """
+    if case not in SCAN_CASES:
+        raise ValueError('Unknown `case` `{}`'.format(case))
+    runs = []
+    for uppercase in (True, False):
+        if case == 'any' or uppercase == (case == 'upper'):
+            symbols = _scan_symbols(unicode, uppercase)
+            if is_bytes:
+                runs.append('(?:{})+'.format('|'.join(
+                    re.escape(symbol.encode('utf-8')).decode('latin-1')
+                    for symbol in symbols)))
+            else:
+                runs.append('[{}]+'.format(symbols))
+    pattern = runs[0] if len(runs) == 1 else '(?:{})'.format('|'.join(runs))
+    if boundary:
+        pattern = r'(?<!\w)' + pattern + r'(?!\w)'
+    if is_bytes:
+        return re.compile(pattern.encode('latin-1'))
+    else:
+        return re.compile(pattern)
+
+
+# ======================================================================
+def _scan(
+        text,
+        strict,
+        unicode,
+        case,
+        boundary,
+        min_length,
+        context):
+    """
+    Find the Roman numbers in a text.
+
+    Args:
+        text (str|bytes|mmap.mmap): The input text.
+        strict (bool): Only accept strictly formally valid Roman numbers.
+        unicode (bool): Include the dedicated Unicode symbols.
+        case (str): The case of the symbols.
+        boundary (bool): Only match runs delimited by word boundaries.
+        min_length (int): The minimum number of symbols.
+        context (callable|None): The additional acceptance rule.
+
+    Yields:
+        result (tuple): The tuple
+            contains:
+             - match (re.Match): The match.
+             - num (int): The integer represented.
+    """
+    is_bytes = not isinstance(text, str)
+    regex = _compile_scanner(unicode, case, boundary, is_bytes)
+    index = _roman_canonical_index()
+    for match in regex.finditer(text):
+        run = match.group()
+        if is_bytes:
+            if boundary and not _is_bytes_boundary(
+                    text, match.start(), match.end()):
+                continue
+            run = run.decode('utf-8')
+        if len(run) < min_length:
+            continue
+        if strict:
+            num = index.get(run.translate(_ROMAN_DECODE_TRANSLATE))
+            if num is None:
+                continue
+        else:
+            num, _ = _roman2int(run, False, _ROMAN_STRICT_REGEX, None)
+        if context is None or context(text, match.start(), match.end()):
+            yield match, num
+
+
+# ======================================================================
+def find_romans(
+        text,
+        strict=True,
+        unicode=False,
+        case='upper',
+        boundary=True,
+        min_length=1,
+        context=None):
+    """
+    Find the Roman numbers in a text.
+
+    Args:
+        text (str|bytes|mmap.mmap): The input text.
+            Bytes-like objects are assumed to be UTF-8 encoded.
+        strict (bool): Only accept strictly formally valid Roman numbers.
+            If False, any run of Roman symbols is accepted and decoded as
+            by `roman2int()`, e.g. `IIM` is 998.
+        unicode (bool): Include the dedicated Unicode symbols (e.g. `Ⅻ`).
+        case (str): The case of the symbols.
+            Accepted values are:
+             - 'upper': only uppercase symbols;
+             - 'lower': only lowercase symbols;
+             - 'any': either uppercase or lowercase (but not mixed) symbols.
+        boundary (bool): Only find whole words.
+            If False, Roman numbers are also found within words.
+        min_length (int): The minimum number of symbols.
+        context (callable|None): The additional acceptance rule.
+            Must have the signature: context(text, start, end) -> bool.
+            This is only called for valid Roman numbers.
+
+    Yields:
+        result (tuple): The tuple
+            contains:
+             - start (int): The offset of the first symbol.
+             - end (int): The offset after the last symbol.
+             - num (int): The integer represented.
+
+    Raises:
+        ValueError: if `case` is not supported.
+
+    Examples:
+        >>> text = 'I read XII pages of Vol. ii, not MMMM nor DID.'
+        >>> list(find_romans(text))
+        [(0, 1, 1), (7, 10, 12)]
+        >>> list(find_romans(text, min_length=2, case='any'))
+        [(7, 10, 12), (25, 27, 2)]
+        >>> list(find_romans(text, strict=False, min_length=2))
+        [(7, 10, 12), (33, 37, 4000), (42, 45, 999)]
+        >>> not_pronoun = lambda text, start, end: text[start:end] != 'I'
+        >>> [n for _, _, n in find_romans(text, context=not_pronoun)]
+        [12]
+        >>> list(find_romans('ⅩⅣ. Ⅻ'.encode('utf-8'), unicode=True))
+        [(0, 6, 14), (8, 11, 12)]
+        >>> list(find_romans('CaféIV')), list(find_romans('CaféIV'.encode()))
+        ([], [])
+        >>> list(find_romans('«IV»')), list(find_romans('«IV»'.encode()))
+        ([(1, 3, 4)], [(2, 4, 4)])
+
+    See Also:
+        sub_romans(), roman2int()
+    """
+    for match, num in _scan(
+            text, strict, unicode, case, boundary, min_length, context):
+        yield match.start(), match.end(), num
+
+
+# ======================================================================
+def sub_romans(
+        text,
+        repl=str,
+        strict=True,
+        unicode=False,
+        case='upper',
+        boundary=True,
+        min_length=1,
+        context=None):
+    """
+    Replace the Roman numbers in a text.
+
+    Args:
+        text (str|bytes|mmap.mmap): The input text.
+            Bytes-like objects are assumed to be UTF-8 encoded.
+        repl (callable): The replacement of each Roman number.
+            Must have the signature: repl(num) -> str.
+        strict (bool): Only accept strictly formally valid Roman numbers.
+        unicode (bool): Include the dedicated Unicode symbols (e.g. `Ⅻ`).
+        case (str): The case of the symbols.
+            Accepted values are the items of `SCAN_CASES`.
+        boundary (bool): Only replace whole words.
+        min_length (int): The minimum number of symbols.
+        context (callable|None): The additional acceptance rule.
+            Must have the signature: context(text, start, end) -> bool.
+        See `find_romans()` for more details.
+
+    Returns:
+        text (str|bytes): The text with the Roman numbers replaced.
+            This is `bytes` for bytes-like inputs.
+
+    Examples:
+        >>> sub_romans('Article IV, paragraph ii', case='any')
+        'Article 4, paragraph 2'
+        >>> sub_romans(b'Pope Pius IX', lambda n: '#{}'.format(n))
+        b'Pope Pius #9'
+
+    See Also:
+        find_romans(), sub_integers()
+    """
+    is_bytes = not isinstance(text, str)
+    chunks = []
+    last = 0
+    for match, num in _scan(
+            text, strict, unicode, case, boundary, min_length, context):
+        replacement = repl(num)
+        chunks.append(text[last:match.start()])
+        chunks.append(replacement.encode('utf-8') if is_bytes else replacement)
+        last = match.end()
+    chunks.append(text[last:])
+    return (b'' if is_bytes else '').join(chunks)
+
+
+# ======================================================================
+def sub_integers(
+        text,
+        repl=int2roman,
+        min_value=1,
+        max_value=3999,
+        boundary=True):
+    """
+    Replace the (non-negative decimal) integers in a text.
+
+    This is the reverse of `sub_romans()`.
+
+    Args:
+        text (str|bytes|mmap.mmap): The input text.
+            Bytes-like objects are assumed to be UTF-8 encoded.
+        repl (callable): The replacement of each integer.
+            Must have the signature: repl(num) -> str.
+        min_value (int): The minimum integer to replace.
+        max_value (int|None): The maximum integer to replace.
+            If None, there is no maximum, except for the integer string
+            conversion length limit (see `sys.set_int_max_str_digits()`).
+        boundary (bool): Only replace whole words.
+
+    Returns:
+        text (str|bytes): The text with the integers replaced.
+            This is `bytes` for bytes-like inputs.
+
+    Examples:
+        >>> sub_integers('Louis 14 (1638-1715), 0 heirs', max_value=100)
+        'Louis ⅩⅣ (1638-1715), 0 heirs'
+        >>> to_ascii = functools.partial(int2roman, only_ascii=True)
+        >>> sub_integers(b'Part 3', to_ascii)
+        b'Part III'
+        >>> sub_integers('Ü2 3'), sub_integers('Ü2 3'.encode()).decode()
+        ('Ü2 Ⅲ', 'Ü2 Ⅲ')
+        >>> sub_integers('x ' + '9' * 5000) == 'x ' + '9' * 5000
+        True
+        >>> sub_integers('x 0004 ' + '9' * 5000, max_value=None)[:6]
+        'x Ⅳ 99'
+
+    See Also:
+        sub_romans(), int2roman()
+    """
+    is_bytes = not isinstance(text, str)
+    pattern = _INTEGER_REGEX.pattern
+    if boundary:
+        pattern = r'(?<!\w)' + pattern + r'(?!\w)'
+    regex = re.compile(pattern.encode('ascii') if is_bytes else pattern)
+    max_size = None if max_value is None else len(str(max_value))
+
+    def replace(match):
+        group = match.group()
+        if is_bytes and boundary and not _is_bytes_boundary(
+                text, match.start(), match.end()):
+            return group
+        # : the length is checked first, since `int()` is quadratic
+        digits = group.lstrip(b'0' if is_bytes else '0')
+        if max_size is not None and len(digits) > max_size:
+            return group
+        try:
+            num = int(digits or 0)
+        except ValueError:  # exceeds the integer string conversion limit
+            return group
+        if num < min_value or (max_value is not None and num > max_value):
+            return group
+        replacement = repl(num)
+        return replacement.encode('utf-8') if is_bytes else replacement
+
+    return regex.sub(replace, text)
+
+
+# ======================================================================
+if __name__ == '__main__':
+    doctest.testmod()
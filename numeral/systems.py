@@ -0,0 +1,773 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Numeral: table-driven engine for additive numeral systems.
+
+A numeral system is declared as symbol/value tables plus some rules
+(subtractive pairs, maximum repetition, place multipliers, etc.), see
+`NumeralSystem`, and it is compiled (on first use) into lookup tables
+for encoding and decoding.
+
+The following systems are available in `NUMERAL_SYSTEMS`:
+ - 'roman': Roman numerals, using the dedicated Unicode characters
+ - 'roman_ascii': Roman numerals, using ASCII characters
+ - 'attic': Greek acrophonic (Attic) numerals
+ - 'greek': Greek alphabetic (Ionic) numerals
+ - 'hebrew': Hebrew numerals
+ - 'cyrillic': Cyrillic numerals
+ - 'chinese': Chinese numerals
+ - 'japanese': Japanese numerals
+
+The Roman systems encode numbers exactly as `int2roman()` does (e.g. `LXL`
+for 90), while their strict decoding follows the same grammar as
+`roman2int()` (e.g. only `XC` for 90).
+
+Examples:
+    >>> [int2numeral(2024, name) for name in ('roman', 'greek', 'chinese')]
+    ['ⅯⅯⅩⅩⅣ', '͵βκδ', '二千零二十四']
+    >>> numeral2int('תשפ״ד', 'hebrew'), numeral2int('二十万', 'chinese')
+    (784, 200000)
+    >>> all(int2numeral(i, 'roman') == int2roman(i)
+    ...     and int2numeral(i, 'roman_ascii') == int2roman(i, only_ascii=True)
+    ...     for i in range(1, 4000))
+    True
+    >>> all(numeral2int(text, 'roman_ascii', strict=True) == i
+    ...     for text, i in _roman_canonical_index().items())
+    True
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals)
+
+# ======================================================================
+# :: Python Standard Library Imports
+import re  # Regular expression operations
+import doctest  # Test interactive Python examples
+
+# ======================================================================
+# :: Internal Imports
+from numeral.backends import int2roman
+from numeral.numeral import (
+    _multi_replace, _split_sign, _batch, _roman_canonical_index)
+from numeral.numeral import (
+    _ROMAN_UNICODE_R, _ROMAN_ASCII_R, _ROMAN_MINUS, _ROMAN_DECODE_TRANSLATE)
+
+
+# ======================================================================
+class NumeralSystem(object):
+    """
+    Additive (or multiplicative-additive) numeral system.
+
+    Numbers are encoded greedily, using the largest symbols (including the
+    subtractive pairs) first, or, if `multipliers` are specified, as sums
+    of digits multiplied by the place multipliers.
+    Numbers are decoded by summing the values of the symbols, subtracting
+    a symbol followed by a larger one (only if subtractive pairs are
+    specified), or multiplying the digits by the following multipliers.
+
+    Args:
+        name (str): The name of the system.
+        symbols (Mapping[str,int]|Iterable[Iterable]): The symbols values.
+            If `multipliers` is specified, these are the digits (1 to 9).
+            Symbols may consist of multiple characters, e.g. for
+            irregular combinations.
+        subtractive (Iterable[str]): The subtractive pairs.
+            Each pair is a symbol followed by a larger one, whose value
+            is the difference of their values.
+        max_repeat (int|None): The maximum repetition of a symbol.
+            This determines `max_value` if not specified.
+        max_value (int|None): The maximum number that can be represented.
+            If None, it is determined by `max_repeat` or it is unbounded.
+        multipliers (Mapping[str,int]|None): The place multipliers values.
+            Must be powers of 10.
+        zero (str|None): The symbol for zero.
+            If None, zero cannot be represented.
+        gap_zero (bool): Mark gaps between multipliers with `zero`.
+        implicit_one (Iterable[str]): Multipliers with implicit one.
+        implicit_leading_one (Iterable[str]): Multipliers with implicit one,
+            only at the beginning of the number.
+        ligatures (Iterable[Iterable[str]]): Replacements after encoding.
+            The replaced symbols are also accepted when decoding.
+        marks (str): Punctuation characters ignored when decoding.
+        canonical (callable|None): The value of canonical representations.
+            Must have the signature: canonical(str) -> int|None, returning
+            None for non-canonical representations (without `marks`).
+            If None, canonical representations are those produced by
+            `encode()`.
+        table_size (int): The maximum size of the lookup tables.
+
+    Examples:
+        >>> egyptian = NumeralSystem(
+        ...     'egyptian', dict(zip('𓏺𓎆𓍢𓆼𓂭𓆐𓁨', [10 ** i for i in range(7)])))
+        >>> egyptian.encode(1312), egyptian.decode('𓆼𓆼𓍢')
+        ('𓆼𓍢𓍢𓍢𓎆𓏺𓏺', 2100)
+    """
+
+    def __init__(
+            self,
+            name,
+            symbols,
+            subtractive=(),
+            max_repeat=None,
+            max_value=None,
+            multipliers=None,
+            zero=None,
+            gap_zero=False,
+            implicit_one=(),
+            implicit_leading_one=(),
+            ligatures=(),
+            marks='',
+            canonical=None,
+            table_size=10000):
+        self.name = name
+        self.symbols = dict(symbols)
+        self.subtractive = tuple(subtractive)
+        self.multipliers = dict(multipliers) if multipliers else {}
+        self.zero = zero
+        self.gap_zero = gap_zero
+        self.implicit_one = frozenset(implicit_one)
+        self.implicit_leading_one = frozenset(implicit_leading_one)
+        self.ligatures = tuple(tuple(x) for x in ligatures)
+        self.marks = marks
+        self.canonical = canonical
+        if max_value is None and max_repeat:
+            max_value = max(self.symbols.values()) * (max_repeat + 1) - 1
+        self.max_value = max_value
+        self.table_size = table_size
+        # : encoding items (including subtractive pairs), largest first
+        values = dict(self.symbols)
+        for pair in self.subtractive:
+            small, large = _tokenize(pair, self.symbols)
+            values[pair] = self.symbols[large] - self.symbols[small]
+        self._encode_items = sorted(
+            [(v, k) for k, v in values.items()], reverse=True)
+        self._digits = dict((v, k) for k, v in self.symbols.items())
+        self._multiplier_items = sorted(
+            [(v, k) for k, v in self.multipliers.items()], reverse=True)
+        # : decoding values (subtractive pairs follow from the rules)
+        self._decode_values = dict(self.symbols)
+        self._decode_values.update(self.multipliers)
+        for replaced, ligature in self.ligatures:
+            self._decode_values[ligature] = sum(
+                self.symbols[x] for x in _tokenize(replaced, self.symbols))
+        if zero:
+            self._decode_values[zero] = 0
+        self._token_regex = re.compile('|'.join(
+            re.escape(x) for x in sorted(self._decode_values, key=len,
+                                         reverse=True)))
+        self._marks_table = dict((ord(x), None) for x in marks)
+        self._tables = None
+
+    # --------------------------------
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self.name)
+
+    # --------------------------------
+    def compile(self):
+        """
+        Build the lookup tables for encoding and decoding.
+
+        This is done automatically on first use.
+
+        Returns:
+            self (NumeralSystem): The numeral system.
+        """
+        size = self.table_size if self.max_value is None \
+            else min(self.table_size, self.max_value + 1)
+        encode_table = [self._encode_value(i) for i in range(size)]
+        decode_table = dict(
+            (text, i) for i, text in enumerate(encode_table) if text)
+        self._tables = encode_table, decode_table
+        return self
+
+    # --------------------------------
+    def _encode_value(self, num):
+        """
+        Encode a non-negative number without using the lookup tables.
+
+        Args:
+            num (int): The input number. Must be non-negative.
+
+        Returns:
+            text (str|None): The encoded number or None if not representable.
+        """
+        if num == 0:
+            return self.zero
+        elif self.multipliers:
+            return self._encode_multiplicative(num, True)
+        text = ''
+        for value, symbol in self._encode_items:
+            if num >= value:
+                count, num = divmod(num, value)
+                text += symbol * count
+        return _multi_replace(text, self.ligatures)
+
+    # --------------------------------
+    def _encode_multiplicative(self, num, leading):
+        """
+        Encode a positive number using the place multipliers.
+
+        Args:
+            num (int): The input number. Must be positive.
+            leading (bool): The number is at the beginning of the text.
+
+        Returns:
+            text (str): The encoded number.
+        """
+        for value, symbol in self._multiplier_items:
+            if num >= value:
+                count, rest = divmod(num, value)
+                if count == 1 and (
+                        symbol in self.implicit_one
+                        or leading and symbol in self.implicit_leading_one):
+                    text = symbol
+                else:
+                    text = self._encode_multiplicative(count, leading) + symbol
+                if rest:
+                    if self.gap_zero and rest < value // 10:
+                        text += self.zero
+                    text += self._encode_multiplicative(rest, False)
+                return text
+        return self._digits[num]
+
+    # --------------------------------
+    def _encode(self, num, negative_sign):
+        """
+        Encode a number without raising on bad input.
+
+        Args:
+            num (int): The input number.
+            negative_sign (str): The symbol to use for negative numbers.
+
+        Returns:
+            result (tuple): The tuple
+                contains:
+                 - text (str|None): The encoded number or None if invalid.
+                 - error (tuple|None): The exception type and message, if any.
+        """
+        encode_table = (self._tables or self.compile()._tables)[0]
+        sign_text = ''
+        if num < 0:
+            sign_text = negative_sign
+            num = -num
+        if num < len(encode_table):
+            text = encode_table[num]
+        elif self.max_value is not None and num > self.max_value:
+            text = None
+        else:
+            text = self._encode_value(num)
+        if text is None:
+            return None, (
+                ValueError, '`{}` cannot be represented in `{}`'.format(
+                    num, self.name))
+        return sign_text + text, None
+
+    # --------------------------------
+    def _decode(self, text, strict, negative_sign):
+        """
+        Decode a text without raising on bad input.
+
+        Args:
+            text (str): The input string to parse.
+            strict (bool): Only accept canonical representations.
+            negative_sign (str): The symbol to use for negative numbers.
+
+        Returns:
+            result (tuple): The tuple
+                contains:
+                 - num (int|None): The integer represented or None if invalid.
+                 - error (tuple|None): The exception type and message, if any.
+        """
+        decode_table = (self._tables or self.compile()._tables)[1]
+        sign, text = _split_sign(text, negative_sign)
+        if sign is None:
+            return None, (ValueError, 'Negative sign is in wrong position')
+        if self._marks_table:
+            text = text.translate(self._marks_table)
+        num = decode_table.get(text)
+        if num is not None:
+            return sign * num, None
+        tokens = self._token_regex.findall(text)
+        if not tokens or sum(len(token) for token in tokens) != len(text):
+            return None, (ValueError, 'Input contains invalid characters')
+        if self.multipliers:
+            num = self._decode_multiplicative(tokens)
+        else:
+            values = [self._decode_values[token] for token in tokens]
+            if self.subtractive:
+                num = max_val = 0
+                for val in reversed(values):
+                    if val < max_val:
+                        num -= val
+                    else:
+                        num += val
+                        max_val = val
+            else:
+                num = sum(values)
+        if strict and not self._is_canonical(text, num):
+            return None, (
+                ValueError, 'Formally invalid input `{}`'.format(text))
+        return sign * num, None
+
+    # --------------------------------
+    def _is_canonical(self, text, num):
+        """
+        Check if a (non-negative) representation is canonical.
+
+        Args:
+            text (str): The input string, without sign and `marks`.
+            num (int): The integer represented.
+
+        Returns:
+            result (bool): True if the representation is canonical.
+        """
+        if self.canonical is not None:
+            return self.canonical(text) == num
+        return (
+            num >= len((self._tables or self.compile()._tables)[0])
+            and self._encode(num, '')[0] == text)
+
+    # --------------------------------
+    def _decode_multiplicative(self, tokens):
+        """
+        Decode tokens using the place multipliers.
+
+        Args:
+            tokens (Iterable[str]): The input tokens.
+
+        Returns:
+            num (int): The integer represented.
+        """
+        stack = []  # items are: (value, multiplier)
+        digit = None
+        for token in tokens:
+            value = self.multipliers.get(token)
+            if value is None:
+                digit = (digit or 0) * 10 + self._decode_values[token]
+            else:
+                count = digit or 0
+                while stack and stack[-1][1] <= value:
+                    count += stack.pop()[0]
+                stack.append(((count or 1) * value, value))
+                digit = None
+        return sum(x for x, _ in stack) + (digit or 0)
+
+    # --------------------------------
+    def encode(
+            self,
+            num,
+            negative_sign='-'):
+        """
+        Convert an integer to its representation.
+
+        Args:
+            num (int): The input number to convert.
+            negative_sign (str): The symbol to use for negative numbers.
+
+        Returns:
+            text (str): The converted number.
+
+        Raises:
+            ValueError: if the number cannot be represented.
+        """
+        text, error = self._encode(num, negative_sign)
+        if error:
+            raise error[0](error[1])
+        return text
+
+    # --------------------------------
+    def decode(
+            self,
+            text,
+            strict=False,
+            negative_sign='-'):
+        """
+        Convert a representation to integer.
+
+        Args:
+            text (str): The input string to parse.
+            strict (bool): Only accept canonical representations.
+                These are the representations produced by `encode()`,
+                (ignoring `marks`), unless `canonical` is specified.
+            negative_sign (str): The symbol to use for negative numbers.
+
+        Returns:
+            num (int): The integer represented.
+
+        Raises:
+            ValueError: if the input is invalid.
+        """
+        num, error = self._decode(text, strict, negative_sign)
+        if error:
+            raise error[0](error[1])
+        return num
+
+    # --------------------------------
+    def encode_batch(
+            self,
+            nums,
+            negative_sign='-',
+            errors='raise',
+            fill_value=None):
+        """
+        Convert many integers to their representations.
+
+        Args:
+            nums (Iterable[int]): The input numbers to convert.
+            negative_sign (str): The symbol to use for negative numbers.
+            errors (str): The policy for invalid items.
+                Accepted values are the items of `numeral.BATCH_ERRORS`.
+            fill_value (Any): The value to use for invalid items.
+                This is only used if `errors == 'coerce'`.
+
+        Returns:
+            result (tuple): The tuple
+                contains:
+                 - texts (list): The converted numbers.
+                 - invalid (list[int]): The indices of the invalid items.
+        """
+        return _batch(
+            lambda num: self._encode(num, negative_sign),
+            nums, errors, fill_value)
+
+    # --------------------------------
+    def decode_batch(
+            self,
+            texts,
+            strict=False,
+            negative_sign='-',
+            errors='raise',
+            fill_value=None):
+        """
+        Convert many representations to integers.
+
+        Args:
+            texts (Iterable[str]): The input strings to parse.
+            strict (bool): Only accept canonical representations.
+            negative_sign (str): The symbol to use for negative numbers.
+            errors (str): The policy for invalid items.
+                Accepted values are the items of `numeral.BATCH_ERRORS`.
+            fill_value (Any): The value to use for invalid items.
+                This is only used if `errors == 'coerce'`.
+
+        Returns:
+            result (tuple): The tuple
+                contains:
+                 - nums (list): The integers represented.
+                 - invalid (list[int]): The indices of the invalid items.
+        """
+        return _batch(
+            lambda text: self._decode(text, strict, negative_sign),
+            texts, errors, fill_value)
+
+
+# ======================================================================
+def _tokenize(
+        text,
+        symbols):
+    """
+    Split a text into symbols (longest first).
+
+    Args:
+        text (str): The input string.
+        symbols (Iterable[str]): The symbols.
+
+    Returns:
+        tokens (list[str]): The symbols.
+
+    Raises:
+        ValueError: if the text cannot be split into symbols.
+
+    Examples:
+        >>> _tokenize('XIV', 'IVX')
+        ['X', 'I', 'V']
+    """
+    symbols = sorted(symbols, key=len, reverse=True)
+    tokens = []
+    while text:
+        for symbol in symbols:
+            if text.startswith(symbol):
+                tokens.append(symbol)
+                text = text[len(symbol):]
+                break
+        else:
+            raise ValueError('Text contains invalid tokens')
+    return tokens
+
+
+# ======================================================================
+_GREEK_DIGITS = 'αβγδεϛζηθ', 'ικλμνξοπϟ', 'ρστυφχψωϡ'
+_HEBREW_DIGITS = 'אבגדהוזחט', 'יכלמנסעפצ', 'קרשת'
+_CYRILLIC_DIGITS = 'авгдєѕзиѳ', 'іклмнѯопч', 'рстуфхѱѿц'
+_ATTIC_DIGITS = 'ΙΠΔ𐅄Η𐅅Χ𐅆Μ𐅇'
+
+
+# ======================================================================
+def _roman_canonical(text):
+    """
+    Compute the value of a canonical Roman number.
+
+    This is the same grammar used by `roman2int()` with `strict=True`.
+
+    Args:
+        text (str): The input string.
+
+    Returns:
+        num (int|None): The integer represented or None if not canonical.
+
+    Examples:
+        >>> _roman_canonical('ⅩⅭ'), _roman_canonical('MCMXCIV')
+        (90, 1994)
+        >>> _roman_canonical('LXL') is None
+        True
+    """
+    return _roman_canonical_index().get(
+        text.translate(_ROMAN_DECODE_TRANSLATE))
+
+
+# ======================================================================
+NUMERAL_SYSTEMS = dict((system.name, system) for system in (
+    NumeralSystem(
+        'roman',
+        [(k, v) for v, k in _ROMAN_UNICODE_R.items() if v not in (0, 11, 12)],
+        subtractive=('ⅭⅮ', 'ⅩⅬ'), max_repeat=3, zero=_ROMAN_UNICODE_R[0],
+        ligatures=(('ⅩⅠ', _ROMAN_UNICODE_R[11]),
+                   ('ⅩⅡ', _ROMAN_UNICODE_R[12])),
+        canonical=_roman_canonical),
+    NumeralSystem(
+        'roman_ascii',
+        [(k, v) for v, k in _ROMAN_ASCII_R.items() if v],
+        subtractive=('CD', 'XL', 'IX', 'IV'), max_repeat=3,
+        zero=_ROMAN_ASCII_R[0], canonical=_roman_canonical),
+    NumeralSystem(
+        'attic',
+        dict(zip(
+            _ATTIC_DIGITS, [k * 10 ** i for i in range(5) for k in (1, 5)])),
+        max_repeat=4, max_value=99999),
+    NumeralSystem(
+        'greek',
+        [(c, (i + 1) * 10 ** p)
+         for p, digits in enumerate(_GREEK_DIGITS)
+         for i, c in enumerate(digits)]
+        + [('͵' + c, (i + 1) * 1000) for i, c in enumerate(_GREEK_DIGITS[0])],
+        max_value=9999, marks='ʹʹ'),
+    NumeralSystem(
+        'hebrew',
+        [(c, (i + 1) * 10 ** p)
+         for p, digits in enumerate(_HEBREW_DIGITS)
+         for i, c in enumerate(digits)],
+        max_value=999, ligatures=(('יה', 'טו'), ('יו', 'טז')),
+        marks='׳״\'"'),
+    NumeralSystem(
+        'cyrillic',
+        [(c, (i + 1) * 10 ** p)
+         for p, digits in enumerate(_CYRILLIC_DIGITS)
+         for i, c in enumerate(digits)]
+        + [('҂' + c, (i + 1) * 1000)
+           for i, c in enumerate(_CYRILLIC_DIGITS[0])],
+        max_value=9999, marks='҃',
+        ligatures=[('і' + c, c + 'і') for c in _CYRILLIC_DIGITS[0]]),
+    NumeralSystem(
+        'chinese',
+        dict(zip('一二三四五六七八九', range(1, 10))),
+        multipliers=dict(zip('十百千万亿', (10, 100, 1000, 10 ** 4, 10 ** 8))),
+        zero='零', gap_zero=True, implicit_leading_one='十'),
+    NumeralSystem(
+        'japanese',
+        dict(zip('一二三四五六七八九', range(1, 10))),
+        multipliers=dict(zip(
+            '十百千万億兆', (10, 100, 1000, 10 ** 4, 10 ** 8, 10 ** 12))),
+        zero='〇', implicit_one='十百千'),
+))
+
+
+# ======================================================================
+def _get_system(system):
+    """
+    Get a numeral system by name.
+
+    Args:
+        system (str|NumeralSystem): The numeral system or its name.
+            Accepted names are the keys of `NUMERAL_SYSTEMS`.
+
+    Returns:
+        system (NumeralSystem): The numeral system.
+
+    Raises:
+        ValueError: if the numeral system is unknown.
+    """
+    if isinstance(system, NumeralSystem):
+        return system
+    elif system in NUMERAL_SYSTEMS:
+        return NUMERAL_SYSTEMS[system]
+    else:
+        raise ValueError('Unknown numeral system `{}`'.format(system))
+
+
+# ======================================================================
+def int2numeral(
+        num,
+        system='roman',
+        negative_sign=_ROMAN_MINUS):
+    """
+    Convert an integer to its representation in a numeral system.
+
+    Args:
+        num (int): The input number to convert.
+        system (str|NumeralSystem): The numeral system or its name.
+            Accepted names are the keys of `NUMERAL_SYSTEMS`.
+        negative_sign (str): The symbol to use for negative numbers.
+
+    Returns:
+        text (str): The converted number.
+
+    Raises:
+        ValueError: if the number cannot be represented.
+
+    Examples:
+        >>> [int2numeral(i, 'roman_ascii') for i in (4, 90, 1666, -12)]
+        ['IV', 'LXL', 'MDCLXVI', '-XII']
+        >>> int2numeral(1994, 'roman')
+        'ⅯⅮⅭⅮⅬⅩⅬⅣ'
+        >>> [int2numeral(i, 'greek') for i in (15, 666, 1821)]
+        ['ιε', 'χξϛ', '͵αωκα']
+        >>> [int2numeral(i, 'hebrew') for i in (15, 16, 17, 770)]
+        ['טו', 'טז', 'יז', 'תשע']
+        >>> [int2numeral(i, 'cyrillic') for i in (11, 1706, 999)]
+        ['аі', '҂аѱѕ', 'цчѳ']
+        >>> [int2numeral(i, 'attic') for i in (9, 1234, 50000)]
+        ['ΠΙΙΙΙ', 'ΧΗΗΔΔΔΙΙΙΙ', '𐅇']
+        >>> [int2numeral(i, 'chinese') for i in (0, 10, 110, 1001, 10 ** 5)]
+        ['零', '十', '一百一十', '一千零一', '十万']
+        >>> [int2numeral(i, 'japanese') for i in (10, 1100, 2024, 10 ** 12)]
+        ['十', '千百', '二千二十四', '一兆']
+        >>> int2numeral(4000, 'roman')
+        Traceback (most recent call last):
+            ...
+        ValueError: `4000` cannot be represented in `roman`
+    """
+    return _get_system(system).encode(num, negative_sign)
+
+
+# ======================================================================
+def numeral2int(
+        text,
+        system='roman',
+        strict=False,
+        negative_sign=_ROMAN_MINUS):
+    """
+    Convert a representation in a numeral system to integer.
+
+    Args:
+        text (str): The input string to parse.
+        system (str|NumeralSystem): The numeral system or its name.
+            Accepted names are the keys of `NUMERAL_SYSTEMS`.
+        strict (bool): Only accept canonical representations.
+        negative_sign (str): The symbol to use for negative numbers.
+
+    Returns:
+        num (int): The integer represented.
+
+    Raises:
+        ValueError: if the input is invalid.
+
+    Examples:
+        >>> [numeral2int(s, 'roman_ascii') for s in ('MDCLXVI', 'IC', 'XC')]
+        [1666, 99, 90]
+        >>> [numeral2int(s, 'roman_ascii', strict=True) for s in ('XC', 'CM')]
+        [90, 900]
+        >>> numeral2int('ⅩⅭ', 'roman', strict=True)
+        90
+        >>> numeral2int('IC', 'roman_ascii', strict=True)
+        Traceback (most recent call last):
+            ...
+        ValueError: Formally invalid input `IC`
+        >>> [numeral2int(s, 'greek') for s in ('χξϛʹ', '͵αωκα')]
+        [666, 1821]
+        >>> [numeral2int(s, 'cyrillic') for s in ('аі', '҂аѱ҃ѕ')]
+        [11, 1706]
+        >>> [numeral2int(s, 'chinese') for s in ('一千零一', '十万', '二零二四')]
+        [1001, 100000, 2024]
+        >>> numeral2int('二千零二十四万三', 'chinese')
+        20240003
+        >>> numeral2int('一万兆', 'japanese') == 10 ** 16
+        True
+    """
+    return _get_system(system).decode(text, strict, negative_sign)
+
+
+# ======================================================================
+def int2numeral_batch(
+        nums,
+        system='roman',
+        negative_sign=_ROMAN_MINUS,
+        errors='raise',
+        fill_value=None):
+    """
+    Convert many integers to their representations in a numeral system.
+
+    Args:
+        nums (Iterable[int]): The input numbers to convert.
+        system (str|NumeralSystem): The numeral system or its name.
+            Accepted names are the keys of `NUMERAL_SYSTEMS`.
+        negative_sign (str): The symbol to use for negative numbers.
+        errors (str): The policy for invalid items.
+            Accepted values are the items of `numeral.BATCH_ERRORS`.
+        fill_value (Any): The value to use for invalid items.
+            This is only used if `errors == 'coerce'`.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - texts (list): The converted numbers.
+             - invalid (list[int]): The indices of the invalid items.
+
+    Examples:
+        >>> int2numeral_batch([1, 4000, 12], errors='coerce')
+        (['Ⅰ', None, 'Ⅻ'], [1])
+    """
+    return _get_system(system).encode_batch(
+        nums, negative_sign, errors, fill_value)
+
+
+# ======================================================================
+def numeral2int_batch(
+        texts,
+        system='roman',
+        strict=False,
+        negative_sign=_ROMAN_MINUS,
+        errors='raise',
+        fill_value=None):
+    """
+    Convert many representations in a numeral system to integers.
+
+    Args:
+        texts (Iterable[str]): The input strings to parse.
+        system (str|NumeralSystem): The numeral system or its name.
+            Accepted names are the keys of `NUMERAL_SYSTEMS`.
+        strict (bool): Only accept canonical representations.
+        negative_sign (str): The symbol to use for negative numbers.
+        errors (str): The policy for invalid items.
+            Accepted values are the items of `numeral.BATCH_ERRORS`.
+        fill_value (Any): The value to use for invalid items.
+            This is only used if `errors == 'coerce'`.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - nums (list): The integers represented.
+             - invalid (list[int]): The indices of the invalid items.
+
+    Examples:
+        >>> numeral2int_batch(['יז', 'x', 'טו'], 'hebrew', errors='skip')
+        ([17, 15], [1])
+    """
+    return _get_system(system).decode_batch(
+        texts, strict, negative_sign, errors, fill_value)
+
+
+# ======================================================================
+if __name__ == '__main__':
+    doctest.testmod()
@@ -0,0 +1,317 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Numeral: persistent precomputed tables.
+
+A table stores the output of `int2roman()` or `int2letter()` for a range of
+integers in a compact file (a header, an offsets array and a concatenated
+UTF-8 blob), which is memory-mapped when loaded, so that it can be shared
+across processes through the page cache.
+
+Once loaded (and registered), the table is used transparently by
+`int2roman()` and `int2letter()` when called with the same options.
+Tables created with a different format version or by a different version
+of `numeral` (whose output may differ) are refused.
+
+The tables can be generated from the command line, e.g.:
+
+    $ python -m numeral.tables roman.tbl int2roman 1 1000000
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals)
+
+# ======================================================================
+# :: Python Standard Library Imports
+import array  # Efficient arrays of numeric values
+import argparse  # Parser for command-line options, arguments and sub-commands
+import inspect  # Inspect live objects
+import json  # JSON encoder and decoder
+import mmap  # Memory-mapped file support
+import struct  # Interpret bytes as packed binary data
+import sys  # System-specific parameters and functions
+
+# ======================================================================
+# :: Internal Imports
+from numeral.numeral import int2letter, int2roman
+from numeral.numeral import _TABLES, __version__
+
+# ======================================================================
+TABLE_FUNCS = {'int2roman': int2roman, 'int2letter': int2letter}
+
+_TABLE_MAGIC = b'NUMTBL01'
+_TABLE_VERSION = 2
+_TABLE_HEADER_SIZE = struct.Struct('<8sI')
+_TABLE_ALIGN = 8
+
+
+# ======================================================================
+def _table_key(
+        func_name,
+        kws):
+    """
+    Compute the registry key for a table.
+
+    This is consistent with the key used by `int2roman()` and
+    `int2letter()` to look up the registered tables.
+
+    Args:
+        func_name (str): The name of the function.
+        kws (Mapping): The options of the function.
+            Missing options are replaced by their default values.
+
+    Returns:
+        key (tuple): The function name followed by all its options.
+
+    Examples:
+        >>> _table_key('int2letter', {})
+        ('int2letter', 'abcdefghijklmnopqrstuvwxyz', '-')
+        >>> _table_key('int2roman', {'alternatives': [['Ⅵ', 'ↅ']]})[6]
+        (('Ⅵ', 'ↅ'),)
+    """
+    kws = dict(kws)
+    if kws.get('alternatives'):
+        kws['alternatives'] = tuple(tuple(x) for x in kws['alternatives'])
+    bound = inspect.signature(TABLE_FUNCS[func_name]).bind(0, **kws)
+    bound.apply_defaults()
+    # : the limits do not affect the output
+    bound.arguments.pop('limits', None)
+    return (func_name,) + tuple(bound.arguments.values())[1:]
+
+
+# ======================================================================
+def dump_table(
+        filepath,
+        func_name,
+        start,
+        stop,
+        **_kws):
+    """
+    Precompute a conversion function over a range and save it to file.
+
+    Args:
+        filepath (str): The output file path.
+        func_name (str): The name of the function.
+            Accepted values are the keys of `TABLE_FUNCS`.
+        start (int): The first number of the range (included).
+        stop (int): The last number of the range (excluded).
+        **_kws: Keyword arguments for the function.
+
+    Returns:
+        None.
+
+    Examples:
+        >>> import os, tempfile
+        >>> filepath = os.path.join(tempfile.mkdtemp(), 'letters.tbl')
+        >>> dump_table(filepath, 'int2letter', 0, 1000)
+        >>> with NumeralTable(filepath) as table:
+        ...     print(len(table), table[27], table.get(1000))
+        1000 ab None
+    """
+    func = TABLE_FUNCS[func_name]
+    offsets = array.array('Q', [0])
+    blob = bytearray()
+    for num in range(start, stop):
+        blob += func(num, **_kws).encode('utf-8')
+        offsets.append(len(blob))
+    header = json.dumps(dict(
+        func=func_name, kws=_kws, start=start, stop=stop,
+        byteorder=sys.byteorder, version=_TABLE_VERSION,
+        numeral_version=__version__)).encode('utf-8')
+    header += b' ' * (-(_TABLE_HEADER_SIZE.size + len(header)) % _TABLE_ALIGN)
+    with open(filepath, 'wb') as file_obj:
+        file_obj.write(_TABLE_HEADER_SIZE.pack(_TABLE_MAGIC, len(header)))
+        file_obj.write(header)
+        file_obj.write(offsets.tobytes())
+        file_obj.write(blob)
+
+
+# ======================================================================
+class NumeralTable(object):
+    """
+    Memory-mapped precomputed table.
+
+    Lookups are O(1) slice reads from the memory-mapped file.
+
+    Args:
+        filepath (str): The input file path, as created by `dump_table()`.
+
+    Raises:
+        ValueError: if the file is not a table, or if it was created with a
+            different byte order, format version or `numeral` version.
+
+    Attributes:
+        func_name (str): The name of the function.
+        kws (dict): The options of the function.
+        start (int): The first number of the range (included).
+        stop (int): The last number of the range (excluded).
+    """
+
+    __slots__ = (
+        'func_name', 'kws', 'start', 'stop', '_file_obj', '_mmap',
+        '_offsets', '_data_offset')
+
+    def __init__(self, filepath):
+        self._file_obj = open(filepath, 'rb')
+        self._mmap = mmap.mmap(
+            self._file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, header_size = _TABLE_HEADER_SIZE.unpack_from(self._mmap)
+        if magic != _TABLE_MAGIC:
+            self.close()
+            raise ValueError('Invalid table file `{}`'.format(filepath))
+        begin = _TABLE_HEADER_SIZE.size
+        header = json.loads(
+            bytes(self._mmap[begin:begin + header_size]).decode('utf-8'))
+        if header['byteorder'] != sys.byteorder:
+            self.close()
+            raise ValueError('Incompatible byte order `{}`'.format(filepath))
+        if header.get('version') != _TABLE_VERSION:
+            self.close()
+            raise ValueError(
+                'Incompatible table version `{}`'.format(filepath))
+        if header.get('numeral_version') != __version__:
+            self.close()
+            raise ValueError(
+                'Table `{}` was created by a different version of `numeral`'
+                .format(filepath))
+        self.func_name = header['func']
+        self.kws = header['kws']
+        self.start = header['start']
+        self.stop = header['stop']
+        begin += header_size
+        size = (self.stop - self.start + 1) * 8
+        self._offsets = memoryview(self._mmap)[begin:begin + size].cast('Q')
+        self._data_offset = begin + size
+
+    # --------------------------------
+    def __len__(self):
+        return self.stop - self.start
+
+    # --------------------------------
+    def __contains__(self, num):
+        return self.start <= num < self.stop
+
+    # --------------------------------
+    def __getitem__(self, num):
+        if not self.start <= num < self.stop:
+            raise KeyError(num)
+        i = num - self.start
+        return self._mmap[
+            self._data_offset + self._offsets[i]:
+            self._data_offset + self._offsets[i + 1]].decode('utf-8')
+
+    # --------------------------------
+    def __enter__(self):
+        return self
+
+    # --------------------------------
+    def __exit__(self, *_args):
+        self.close()
+
+    # --------------------------------
+    def get(self, num, default=None):
+        """
+        Get the precomputed representation of a number.
+
+        Args:
+            num (int): The input number.
+            default (Any): The value to return if `num` is not available.
+
+        Returns:
+            text (str|Any): The precomputed representation or `default`.
+        """
+        return self[num] if self.start <= num < self.stop else default
+
+    # --------------------------------
+    @property
+    def key(self):
+        """The registry key of the table."""
+        return _table_key(self.func_name, self.kws)
+
+    # --------------------------------
+    def close(self):
+        """Release the memory-mapped file."""
+        for key, table in list(_TABLES.items()):
+            if table is self:
+                del _TABLES[key]
+        offsets = getattr(self, '_offsets', None)
+        if offsets is not None:
+            offsets.release()
+            self._offsets = None
+        self._mmap.close()
+        self._file_obj.close()
+
+
+# ======================================================================
+def load_table(
+        filepath,
+        register=True):
+    """
+    Load a precomputed table.
+
+    Args:
+        filepath (str): The input file path, as created by `dump_table()`.
+        register (bool): Use the table in the corresponding function.
+            If True, the table is used by `int2roman()` or `int2letter()`
+            whenever they are called with the same options.
+            Any previously registered table with the same options is
+            replaced.
+
+    Returns:
+        table (NumeralTable): The memory-mapped table.
+
+    Examples:
+        >>> import os, tempfile
+        >>> filepath = os.path.join(tempfile.mkdtemp(), 'roman.tbl')
+        >>> dump_table(filepath, 'int2roman', 1, 4000, only_ascii=True)
+        >>> table = load_table(filepath)
+        >>> int2roman(1666, only_ascii=True), table[1666]
+        ('MDCLXVI', 'MDCLXVI')
+        >>> int2roman(1666, only_ascii=True, limits={'max_output': 5})
+        Traceback (most recent call last):
+            ...
+        numeral.numeral.InputLimitError: Output length exceeds `max_output=5`
+        >>> table.close()
+        >>> header = json.dumps(dict(
+        ...     func='int2roman', kws={}, start=1, stop=2,
+        ...     byteorder=sys.byteorder)).encode('utf-8')
+        >>> with open(filepath, 'wb') as file_obj:
+        ...     _ = file_obj.write(
+        ...         _TABLE_HEADER_SIZE.pack(_TABLE_MAGIC, len(header)) + header)
+        >>> load_table(filepath)  # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+            ...
+        ValueError: Incompatible table version `...roman.tbl`
+    """
+    table = NumeralTable(filepath)
+    if register:
+        _TABLES[table.key] = table
+    return table
+
+
+# ======================================================================
+def main():
+    arg_parser = argparse.ArgumentParser(
+        description='Precompute a numeral conversion table.')
+    arg_parser.add_argument('filepath', help='The output file path.')
+    arg_parser.add_argument(
+        'func_name', choices=sorted(TABLE_FUNCS),
+        help='The conversion function.')
+    arg_parser.add_argument(
+        'start', type=int, help='The first number of the range (included).')
+    arg_parser.add_argument(
+        'stop', type=int, help='The last number of the range (excluded).')
+    arg_parser.add_argument(
+        '-k', '--kws', default='{}',
+        help='The function options, as a JSON object.')
+    args = arg_parser.parse_args()
+    dump_table(
+        args.filepath, args.func_name, args.start, args.stop,
+        **json.loads(args.kws))
+
+
+# ======================================================================
+if __name__ == '__main__':
+    main()
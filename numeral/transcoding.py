@@ -0,0 +1,374 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Numeral: direct transcoding between numeral representations.
+
+A representation is specified as one of:
+ - 'roman': see `int2roman()` and `roman2int()`
+ - 'letters': see `int2letter()` and `letter2int()`
+ - the name of a numeral system: see `numeral.systems.NUMERAL_SYSTEMS`
+ - a tokens set: see `int2tokens()` and `tokens2int()`
+Names take precedence over tokens sets given as strings.
+
+Each pair of representations is compiled into a transcoder only once
+(for the input-size limits in effect, see `numeral.set_limits()`).
+Between tokens sets of the same size, the tokens are mapped directly,
+without converting to integer, unless limits are set.
+
+Examples:
+    >>> transcode('MDCLXVI', 'roman', 'letters')
+    'blc'
+    >>> transcode('blc', 'letters', ('po', 'ta', 'ke'))
+    'poketapopoketa'
+    >>> transcode_batch(['ab', 'zz', 'b?'], 'letters', string.ascii_uppercase,
+    ...     errors='coerce')
+    (['AB', 'ZZ', None], [2])
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals)
+
+# ======================================================================
+# :: Python Standard Library Imports
+import re  # Regular expression operations
+import string  # Common string operations
+import functools  # Higher-order functions and operations on callable objects
+import doctest  # Test interactive Python examples
+
+# ======================================================================
+# :: Internal Imports
+from numeral.numeral import int2tokens, int2roman, LIMIT_NAMES
+from numeral.numeral import (
+    _hashable, _split_sign, _batch, _tokens2int, _pow2_codec,
+    _pow2_tokens2int, _roman2int, _ROMAN_STRICT_REGEX)
+from numeral.numeral import (
+    _get_limits, _limited_decoder, _limited_encoder, _tokens_max_length,
+    _roman_max_length)
+from numeral.systems import NUMERAL_SYSTEMS
+
+# ======================================================================
+TRANSCODE_NAMES = {
+    'letters': string.ascii_lowercase,
+    'roman': None,
+}
+
+
+# ======================================================================
+def _spec_tokens(spec):
+    """
+    Get the tokens set of a representation, if any.
+
+    Args:
+        spec (str|tuple[str]): The representation.
+            See the module documentation for more details.
+
+    Returns:
+        tokens (str|tuple[str]|None): The tokens set or None.
+
+    Examples:
+        >>> _spec_tokens('letters'), _spec_tokens('roman')
+        ('abcdefghijklmnopqrstuvwxyz', None)
+        >>> _spec_tokens('greek'), _spec_tokens(('po', 'ta'))
+        (None, ('po', 'ta'))
+    """
+    if spec in TRANSCODE_NAMES:
+        return TRANSCODE_NAMES[spec]
+    elif spec in NUMERAL_SYSTEMS:
+        return None
+    else:
+        return spec
+
+
+# ======================================================================
+def _decoder(
+        spec,
+        negative_sign,
+        limits):
+    """
+    Compile the non-raising decoder of a representation.
+
+    Args:
+        spec (str|tuple[str]): The representation.
+            See the module documentation for more details.
+        negative_sign (str): The symbol to use for negative numbers.
+        limits (Mapping[str, int|None]): The input-size limits.
+            See `numeral.set_limits()` for more details.
+
+    Returns:
+        decoder (callable): The decoder.
+            Its signature is: decoder(str) -> (num, error).
+
+    Raises:
+        ValueError: if `negative_sign` is in the tokens set.
+
+    Examples:
+        >>> decoder = _decoder('roman', '-', {'max_magnitude': 100})
+        >>> decoder('XC'), decoder('MMM')[1][1]
+        ((90, None), 'Input magnitude exceeds `max_magnitude=100`')
+    """
+    tokens = _spec_tokens(spec)
+    if spec == 'roman':
+        return _limited_decoder(
+            lambda text: _roman2int(
+                text, False, _ROMAN_STRICT_REGEX, negative_sign),
+            limits, _roman_max_length, len(negative_sign))
+    elif tokens is None:
+        system = NUMERAL_SYSTEMS[spec]
+        return _limited_decoder(
+            lambda text: system._decode(text, False, negative_sign), limits)
+    elif negative_sign in tokens:
+        raise ValueError('Negative sign must not be a token')
+    codec = _pow2_codec(tokens)
+    if codec:
+        func = lambda text: _pow2_tokens2int(text, codec, negative_sign)
+    else:
+        func = lambda text: _tokens2int(text, tokens, negative_sign)
+    return _limited_decoder(
+        func, limits, lambda n: _tokens_max_length(n, tokens),
+        len(negative_sign))
+
+
+# ======================================================================
+def _encoder(
+        spec,
+        negative_sign,
+        limits):
+    """
+    Compile the non-raising encoder of a representation.
+
+    Args:
+        spec (str|tuple[str]): The representation.
+            See the module documentation for more details.
+        negative_sign (str): The symbol to use for negative numbers.
+        limits (Mapping[str, int|None]): The input-size limits.
+            See `numeral.set_limits()` for more details.
+
+    Returns:
+        encoder (callable): The encoder.
+            Its signature is: encoder(int) -> (text, error).
+
+    Examples:
+        >>> encoder = _encoder('letters', '-', {'max_output': 2})
+        >>> encoder(27), encoder(10 ** 9)[1][1]
+        (('ab', None), 'Output length exceeds `max_output=2`')
+    """
+    tokens = _spec_tokens(spec)
+    if spec == 'roman':
+        return _limited_encoder(lambda num: int2roman(
+            num, negative_sign=negative_sign, limits=limits))
+    elif tokens is None:
+        system = NUMERAL_SYSTEMS[spec]
+        return lambda num: system._encode(num, negative_sign)
+    else:
+        return _limited_encoder(lambda num: int2tokens(
+            num, tokens, negative_sign, limits=limits))
+
+
+# ======================================================================
+def _token_mapper(
+        src_tokens,
+        dst_tokens,
+        negative_sign):
+    """
+    Compile the non-raising mapper between tokens sets of the same size.
+
+    This is equivalent to decoding with `src_tokens` and encoding with
+    `dst_tokens`, since the digits of the bijective representations are
+    the same.
+
+    Args:
+        src_tokens (str|tuple[str]): The source tokens set.
+        dst_tokens (str|tuple[str]): The destination tokens set.
+        negative_sign (str): The symbol to use for negative numbers.
+
+    Returns:
+        mapper (callable): The mapper.
+            Its signature is: mapper(str) -> (text, error).
+
+    Raises:
+        ValueError: if `negative_sign` is in the tokens set.
+
+    Examples:
+        >>> mapper = _token_mapper(('po', 'ta'), 'ab', '-')
+        >>> mapper('-potata'), mapper('pox')
+        (('-abb', None), (None, (<class 'ValueError'>, 'Text contains \
+invalid tokens')))
+    """
+    if negative_sign in src_tokens:
+        raise ValueError('Negative sign must not be a token')
+    mapping = dict(zip(src_tokens, dst_tokens))
+    sizes = set(len(token) for token in src_tokens)
+    if sizes == {1}:
+        table = str.maketrans(mapping)
+        chars = frozenset(src_tokens)
+
+        def split(text):
+            return text if chars.issuperset(text) else None
+
+        def join(text):
+            return text.translate(table)
+    else:
+        if len(sizes) == 1:
+            size = sizes.pop()
+
+            def split(text):
+                tokens = [text[i:i + size] for i in range(0, len(text), size)]
+                return tokens if mapping.keys() >= set(tokens) else None
+        else:
+            regex = re.compile('|'.join(
+                re.escape(token)
+                for token in sorted(src_tokens, key=len, reverse=True)))
+
+            def split(text):
+                tokens = regex.findall(text)
+                return tokens if sum(map(len, tokens)) == len(text) else None
+
+        def join(tokens):
+            return ''.join([mapping[token] for token in tokens])
+
+    def mapper(text):
+        sign, text = _split_sign(text, negative_sign)
+        if sign is None:
+            return None, (ValueError, 'Negative sign is in wrong position')
+        tokens = split(text)
+        if tokens is None:
+            return None, (ValueError, 'Text contains invalid tokens')
+        elif not text or text == src_tokens[0]:  # i.e. zero
+            return dst_tokens[0], None
+        return (negative_sign if sign < 0 else '') + join(tokens), None
+
+    return mapper
+
+
+# ======================================================================
+@functools.lru_cache(maxsize=64)
+def _transcoder(
+        src,
+        dst,
+        negative_sign,
+        limits):
+    """
+    Compile the non-raising transcoder between two representations.
+
+    Args:
+        src (str|tuple[str]): The source representation.
+            Must be hashable.
+        dst (str|tuple[str]): The destination representation.
+            Must be hashable.
+        negative_sign (str): The symbol to use for negative numbers.
+        limits (tuple[int|None]): The input-size limits.
+            Must be in the order of `LIMIT_NAMES`, see `_get_limits()`.
+
+    Returns:
+        transcoder (callable): The transcoder.
+            Its signature is: transcoder(str) -> (text, error).
+    """
+    src_tokens = _spec_tokens(src)
+    dst_tokens = _spec_tokens(dst)
+    if src_tokens is not None and dst_tokens is not None \
+            and len(src_tokens) == len(dst_tokens) and not any(limits):
+        return _token_mapper(src_tokens, dst_tokens, negative_sign)
+    limits = dict(zip(LIMIT_NAMES, limits))
+    decoder = _decoder(src, negative_sign, limits)
+    encoder = _encoder(dst, negative_sign, limits)
+
+    def transcoder(text):
+        num, error = decoder(text)
+        return encoder(num) if error is None else (None, error)
+
+    return transcoder
+
+
+# ======================================================================
+def transcode(
+        text,
+        src,
+        dst,
+        negative_sign='-'):
+    """
+    Convert a representation of a number to another representation.
+
+    Args:
+        text (str): The input string to parse.
+        src (str|Sequence[str]): The source representation.
+            See the module documentation for more details.
+        dst (str|Sequence[str]): The destination representation.
+            See the module documentation for more details.
+        negative_sign (str): The symbol to use for negative numbers.
+
+    Returns:
+        text (str): The converted representation.
+
+    Raises:
+        ValueError: if the input is invalid.
+        InputLimitError: if the limits are exceeded.
+
+    Examples:
+        >>> transcode('-ba', 'letters', '0123456789abcdefghijklmnop')
+        '-10'
+        >>> transcode('ⅯⅯⅩⅩⅣ', 'roman', 'chinese')
+        '二千零二十四'
+        >>> transcode('͵αωκα', 'greek', 'roman')
+        'ⅯⅮⅭⅭⅭⅩⅪ'
+        >>> transcode('ab?', 'letters', 'abc')
+        Traceback (most recent call last):
+            ...
+        ValueError: Text contains invalid tokens
+    """
+    result, error = _transcoder(
+        _hashable(src), _hashable(dst), negative_sign, _get_limits(None))(text)
+    if error:
+        raise error[0](error[1])
+    return result
+
+
+# ======================================================================
+def transcode_batch(
+        texts,
+        src,
+        dst,
+        negative_sign='-',
+        errors='raise',
+        fill_value=None):
+    """
+    Convert multiple representations of numbers to another representation.
+
+    Args:
+        texts (Iterable[str]): The input strings to parse.
+        src (str|Sequence[str]): The source representation.
+            See the module documentation for more details.
+        dst (str|Sequence[str]): The destination representation.
+            See the module documentation for more details.
+        negative_sign (str): The symbol to use for negative numbers.
+        errors (str): The policy for invalid items.
+            Accepted values are the items of `numeral.BATCH_ERRORS`.
+        fill_value (Any): The value to use for invalid items.
+            This is only used if `errors == 'coerce'`.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - texts (list): The converted representations.
+             - invalid (list[int]): The indices of the invalid items.
+
+    Examples:
+        >>> transcode_batch(['Ⅻ', 'XIX', 'Q'], 'roman', 'letters',
+        ...     errors='skip')
+        (['m', 't'], [2])
+        >>> from numeral.numeral import use_limits
+        >>> with use_limits(max_magnitude=100):
+        ...     transcode_batch(['MMM', 'X'], 'roman', 'letters',
+        ...         errors='coerce')
+        ([None, 'k'], [0])
+    """
+    return _batch(
+        _transcoder(
+            _hashable(src), _hashable(dst), negative_sign, _get_limits(None)),
+        texts, errors, fill_value)
+
+
+# ======================================================================
+if __name__ == '__main__':
+    doctest.testmod()
@@ -92,16 +92,23 @@ setup(
         ' (GPLv3+)',
 
         'Programming Language :: Python',
-        'Programming Language :: Python :: 2',
         'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3 :: Only',
     ],
 
     keywords=['numeral', 'letter', 'alphabet', 'numeric', 'arabic', 'roman'],
 
     packages=find_packages(exclude=['contrib', 'docs', 'tests']),
 
+    python_requires='>=3.7',
+
     setup_requires=[
         'setuptools',
         'setuptools_scm'
     ],
+
+    extras_require={
+        'pandas': ['pandas'],
+        'numpy': ['numpy'],
+    },
 )